@@ -1 +1,7 @@
-from .main import MainWindow
\ No newline at end of file
+# MainWindow is imported lazily so Qt-free entry points (python -m ddl.headless,
+# the acquisition process) don't load PyQt5/pyqtgraph.
+def __getattr__(name):
+    if name == "MainWindow":
+        from .main import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,98 @@
+"""
+Headless logging-only receiver (no Qt, no display).
+
+Runs the same BlackBox + Flight_<TEAM_ID>.csv recording as the GUI, for
+unattended relay receivers:
+
+    python -m ddl.headless --port /dev/ttyUSB0 --baud 57600 --out ./saves
+    python -m ddl.headless --list-ports
+"""
+import os, sys, time, signal, argparse, threading
+import serial, serial.tools.list_ports
+
+from ddl.modules.managers.configuration_manager import ConfigManager
+from ddl.modules.acquisition import Recorder, AcquisitionCore, SerialAcquisition
+
+
+class HeadlessReceiver:
+    """Serial -> BlackBox/CSV loop with periodic flush, stats and reconnect."""
+    def __init__(self, port: str, baudrate: int, out_dir: str, team_id: str = None,
+                 record_csv: bool = True, stats_every: float = 10.0, retry_s: float = 5.0, log=print):
+        cfg = ConfigManager
+        self.team_id = str(team_id or cfg.get("application.settings.team_id"))
+        pattern = cfg.get("telemetry.csv.filename_pattern")
+        self.recorder = Recorder(out_dir, os.path.join(out_dir, pattern.replace("${TEAM_ID}", self.team_id)),
+                                 cfg.get("telemetry.csv.header"), cfg.get("telemetry.csv.include_header"),
+                                 cfg.get("telemetry.blackbox"), cfg.get("telemetry.pyramid"))
+        self.recorder.record_enabled = record_csv
+        self.core = AcquisitionCore.from_config(self.recorder, cfg.get("connection"), self.team_id)
+        self.acq = SerialAcquisition(self.core, port, baudrate, cfg.get("connection.time_out"), on_frame=self._on_frame)
+        self.stats_every = float(stats_every); self.retry_s = float(retry_s)
+        self.log = log
+        self.stop = threading.Event()
+        self.lines = 0
+        self._next_tick = time.monotonic() + self.stats_every
+
+    def _on_frame(self, line, data):
+        self.lines += 1
+        now = time.monotonic()
+        if now >= self._next_tick:
+            self._next_tick = now + self.stats_every
+            self.recorder.flush()
+            c = self.core.counter
+            self.log(f"(OK) lines: {self.lines} | recv: {c.received} | lost: {c.lost} | last pkt: {c.last}"
+                     f" | corrupt: {self.core.corrupt} | resynced: {self.core.resynced}")
+
+    def run(self):
+        self.recorder.catch_up_pyramid(); self.recorder.open_csv(); self.recorder.open_blackbox()
+        try:
+            while not self.stop.is_set():
+                try:
+                    self.acq.open()
+                    self.log(f"(OK) [CONNECTED] {self.acq.ser.port} @ {self.acq.ser.baudrate}")
+                    self.acq.run(self.stop)
+                except serial.SerialException as e:
+                    self.log(f"[-] Serial error - {e}")
+                    self.recorder.flush()
+                finally:
+                    self.acq.close()
+                if self.retry_s <= 0: break
+                self.stop.wait(self.retry_s)
+        finally:
+            self.recorder.close()
+            c = self.core.counter
+            self.log(f"(OK) [STOPPED] recv: {c.received} | lost: {c.lost}")
+
+
+def main(argv=None):
+    cfg = ConfigManager
+    bauds = cfg.get("connection.bauds_dic") or {}
+    ap = argparse.ArgumentParser(prog="python -m ddl.headless",
+                                 description="Log telemetry to BlackBox + CSV without a display.")
+    ap.add_argument("--port", help="serial port, e.g. COM3 or /dev/ttyUSB0")
+    ap.add_argument("--baud", default=cfg.get("connection.bauds_default"), help="baud rate")
+    ap.add_argument("--out", default=cfg.get("application.settings.logs_folder"), help="output directory")
+    ap.add_argument("--team-id", help="overrides application.settings.team_id in the CSV name")
+    ap.add_argument("--no-csv", action="store_true", help="BlackBox raw log only")
+    ap.add_argument("--stats-every", type=float, default=10.0, help="seconds between status lines/flushes")
+    ap.add_argument("--retry", type=float, default=5.0, help="seconds before reopening a lost port (0 = exit)")
+    ap.add_argument("--list-ports", action="store_true", help="print available ports and exit")
+    args = ap.parse_args(argv)
+
+    if args.list_ports:
+        for p in serial.tools.list_ports.comports(): print(p.device)
+        return 0
+    if not args.port:
+        ap.error("--port is required")
+
+    rx = HeadlessReceiver(args.port, int(bauds.get(str(args.baud), args.baud)), args.out, args.team_id,
+                          record_csv=not args.no_csv, stats_every=args.stats_every, retry_s=args.retry,
+                          log=lambda m: print(m, flush=True))
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: rx.stop.set())
+    rx.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,9 @@ from ddl.modules.managers.terminal_manager import TerminalManager
 from ddl.modules.managers.serial_manager import SerialManager
 from ddl.modules.managers.graph_manager import GraphManager
 from ddl.modules.managers.button_manager import ButtonManager
+from ddl.modules.managers.alarm_manager import AlarmManager
+from ddl.modules.managers.diagnostics_manager import DiagnosticsManager
+from ddl.modules.managers.telemetry_bus import TelemetryBus
 
 from ddl.modules.utility.connection_buffer import ConnectionBuffer
 from ddl.modules.utility.clock_updater import ClockUpdater
@@ -26,19 +29,28 @@ class MainWindow(QMainWindow):
 
         # -- Managers / Config --
         self.config         = ConfigManager
+        self.bus            = TelemetryBus(self)
         self.window_manager = WindowManager(self)
         self.terminal       = TerminalManager(self)
         self.serial         = SerialManager(self)
         self.clock_updater  = ClockUpdater(self)
         self.button_manager = ButtonManager(self)
         self.graph_manager  = GraphManager(self)
+        self.alarm_manager  = AlarmManager(self)
+        self.diagnostics    = DiagnosticsManager(self)
 
         # -- Utility --
         self.connection_buffer = ConnectionBuffer(self)
 
-        # Wiring: serial -> terminal (raw), serial -> graphs (dict)
-        self.serial.data_available.connect(self.terminal.write)
-        self.serial.update_graphs.connect(self.graph_manager.update)
+        # Wiring: serial -> bus (raw lines, packet dicts); consumers subscribe to the bus
+        self.serial.data_available.connect(self.bus.publish_line)
+        self.serial.update_graphs.connect(self.bus.publish)
+        self.bus.subscribe_lines(self.terminal.write_link)
+        self.bus.subscribe(self.graph_manager.update, name="graphs")
+        self.alarm_manager.attach(self.bus)
+        self.serial.ports_updated.connect(self._on_ports_updated)
+        self.serial.connection_changed.connect(self._on_connection_changed)
+        self.serial.counters_changed.connect(self._on_counters_changed)
 
         # Window/UI setup
         self._setup_window()
@@ -49,6 +61,9 @@ class MainWindow(QMainWindow):
         self.clock_updater.update_global_time_label()
         self.clock_updater.start_time_update_thread()
         self.terminal.boot_up_message()
+        # restarted mid-mission: reload the current session of the flight CSV
+        if self.config.get("application.settings.resume_on_start") and os.path.exists(self.serial.csv_file_path):
+            self.graph_manager.resume()
         self.update_status_bar("// #Successfully Started")
         self.show()
 
@@ -127,10 +142,12 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # graphs
+        # session history, graphs
         try:
+            self.bus.clear()
             if hasattr(self.graph_manager, "clear"):
                 self.graph_manager.clear()
+            self.alarm_manager.clear()
         except Exception:
             pass
 
@@ -142,6 +159,22 @@ class MainWindow(QMainWindow):
 
         self.update_status_bar("// cleared all")
 
+    # ---------- serial -> widgets ----------
+    def _on_ports_updated(self, ports):
+        self.ui.cb_ports.clear(); self.ui.cb_ports.addItems(ports)
+
+    def _on_connection_changed(self, connected: bool):
+        self.ui.btn_connect_serial.setText("connected" if connected else "disconnected")
+        if self.ui.btn_connect_serial.isChecked() != connected:
+            self.ui.btn_connect_serial.setChecked(connected)
+
+    def _on_counters_changed(self, received: int, lost: int, corrupt: int, resynced: int, cmd_echo: str):
+        if hasattr(self.ui, "lb_recv"): self.ui.lb_recv.setText(f"recv: {received}")
+        if hasattr(self.ui, "lb_lost"):
+            bad = f" | bad: {corrupt} | resync: {resynced}" if corrupt or resynced else ""
+            self.ui.lb_lost.setText(f"lost: {lost}{bad}")
+        if hasattr(self.ui, "lb_cmd_echo"): self.ui.lb_cmd_echo.setText(cmd_echo)
+
     def update_status_bar(self, msg: str):
         if not msg:
             self.ui.statusBar.showMessage(f"// {self.window_id}")
@@ -175,8 +208,8 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         try:
-            if hasattr(self.serial, "all_data") and self.serial.all_data:
-                self.serial.all_data.close()
+            self.serial.shutdown()
+            self.terminal.close()
         except Exception:
             pass
     def show_landed_map(self, lat: float, lon: float):
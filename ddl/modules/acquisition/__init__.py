@@ -0,0 +1,14 @@
+# Qt-free acquisition core: importable by the acquisition process and headless mode
+from . protocol import REQUIRED_FIELDS, RX_TIME, parse_frame, PacketCounter
+from . integrity import FrameChecker, crc16, xor8
+from . binary import BinaryCodec, pack_packet, unpack_packet, unpack_many
+from . blackbox import BlackBoxLog, read_index, open_segment
+from . flight_csv import read_flight_csv, NUMERIC_FIELDS
+from . pyramid import Pyramid, PyramidWriter, build_from_csv, open_pyramid
+from . attitude import AttitudeFilter, estimate_flight
+from . compare import compare_flights, event_time, resample
+from . recorder import Recorder
+from . core import AcquisitionCore
+from . reader import SerialAcquisition
+from . ring import PacketRing, KIND_PACKET, KIND_TEXT
+from . process import AcquisitionProcess
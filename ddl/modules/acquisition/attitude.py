@@ -0,0 +1,225 @@
+"""
+Attitude from GYRO/ACCEL/MAG as a quaternion complementary filter, vectorized over batches.
+
+Frames: body x/y/z = the R/P/Y sensor axes (z up: ACCEL_Y reads +1 g at rest);
+world x = magnetic north, z = up. Quaternions are [w, x, y, z] arrays of shape (n, 4),
+rotating body vectors into the world frame.
+
+A batch is filtered in three array passes instead of one Python step per sample:
+- gyro propagation: per-sample increments exp(w dt / 2), chained by a log2(n) prefix product
+- reference attitude: roll/pitch from ACCEL, yaw from tilt-compensated MAG (gated samples
+  keep the gyro estimate)
+- correction: the world-frame error reference * conj(gyro) as a rotation vector, low-passed
+  with time constant `tau` (first-order IIR in closed form) and applied to the gyro attitude
+Long runs are cut into chunks of `chunk` samples; each chunk starts from the last estimate.
+"""
+import numpy as np
+
+GYRO = ("GYRO_R", "GYRO_P", "GYRO_Y")
+ACCEL = ("ACCEL_R", "ACCEL_P", "ACCEL_Y")
+MAG = ("MAG_R", "MAG_P", "MAG_Y")
+CHANNELS = ("ATT_ROLL", "ATT_PITCH", "ATT_YAW", "ATT_TILT")
+IDENTITY = np.array([1.0, 0.0, 0.0, 0.0])
+
+
+# ---------- quaternion arrays ----------
+def quat_mul(a, b):
+    """Hamilton product of (4,) or (n, 4) arrays."""
+    aw, ax, ay, az = a.T; bw, bx, by, bz = b.T
+    return np.stack([aw * bw - ax * bx - ay * by - az * bz,
+                     aw * bx + ax * bw + ay * bz - az * by,
+                     aw * by - ax * bz + ay * bw + az * bx,
+                     aw * bz + ax * by - ay * bx + az * bw], axis=-1)
+
+
+def quat_conj(q):
+    return q * np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def quat_normalize(q):
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def quat_exp(r):
+    """Rotation vectors (n, 3) -> unit quaternions."""
+    angle = np.linalg.norm(r, axis=-1, keepdims=True)
+    half = 0.5 * angle
+    with np.errstate(invalid="ignore", divide="ignore"):
+        k = np.where(angle > 1e-12, np.sin(half) / angle, 0.5)
+    return np.concatenate([np.cos(half), r * k], axis=-1)
+
+
+def quat_log(q):
+    """Unit quaternions -> rotation vectors (shortest rotation)."""
+    q = np.where(q[..., :1] < 0, -q, q)
+    v = q[..., 1:]; s = np.linalg.norm(v, axis=-1, keepdims=True)
+    angle = 2.0 * np.arctan2(s, q[..., :1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        k = np.where(s > 1e-12, angle / s, 2.0)
+    return v * k
+
+
+def prefix_product(q):
+    """Running product q0, q0 q1, q0 q1 q2, ... in log2(n) vectorized steps (Hillis-Steele scan)."""
+    q = q.copy(); step = 1
+    while step < len(q):
+        q[step:] = quat_mul(q[:-step], q[step:]); step <<= 1
+    return quat_normalize(q)
+
+
+def from_euler(roll, pitch, yaw):
+    """ZYX Euler angles (rad) -> quaternions: yaw about z, then pitch about y, then roll about x."""
+    cr, sr = np.cos(roll / 2), np.sin(roll / 2)
+    cp, sp = np.cos(pitch / 2), np.sin(pitch / 2)
+    cy, sy = np.cos(yaw / 2), np.sin(yaw / 2)
+    return np.stack([cr * cp * cy + sr * sp * sy, sr * cp * cy - cr * sp * sy,
+                     cr * sp * cy + sr * cp * sy, cr * cp * sy - sr * sp * cy], axis=-1)
+
+
+def to_euler(q):
+    """Quaternions -> (roll, pitch, yaw, tilt) in degrees; tilt = angle of body z from vertical."""
+    w, x, y, z = q.T
+    roll = np.arctan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+    pitch = np.arcsin(np.clip(2 * (w * y - z * x), -1.0, 1.0))
+    yaw = np.arctan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+    tilt = np.arccos(np.clip(1 - 2 * (x * x + y * y), -1.0, 1.0))
+    return tuple(np.degrees(a) for a in (roll, pitch, yaw, tilt))
+
+
+# ---------- filter ----------
+def reference(accel, mag, yaw_fallback):
+    """
+    Absolute attitude per sample from gravity (+ MAG heading) and a validity mask.
+    Samples without MAG take their yaw from `yaw_fallback` (rad).
+    """
+    ax, ay, az = accel.T
+    roll = np.arctan2(ay, az); pitch = np.arctan2(-ax, np.hypot(ay, az))
+    mx, my, mz = mag.T
+    cr, sr, cp, sp = np.cos(roll), np.sin(roll), np.cos(pitch), np.sin(pitch)
+    # MAG in the levelled frame: Ry(pitch) Rx(roll) m
+    my1 = my * cr - mz * sr; mz1 = my * sr + mz * cr
+    mxh = mx * cp + mz1 * sp
+    has_mag = np.linalg.norm(mag, axis=1) > 1e-9
+    yaw = np.where(has_mag, np.arctan2(-my1, mxh), yaw_fallback)
+    return from_euler(roll, pitch, yaw)
+
+
+def lowpass(x, a):
+    """
+    y_k = a_k y_(k-1) + (1 - a_k) x_k from y = 0, per column of x, without a Python loop per sample:
+    y_k = A_k sum_j (1 - a_j) x_j / A_j with A the running product of a (blocks keep 1/A finite).
+    """
+    out = np.empty_like(x); y = np.zeros(x.shape[1]); i = 0
+    loga = np.log(np.clip(a, 1e-300, 1.0))
+    while i < len(x):
+        L = np.cumsum(loga[i:])
+        j = i + max(1, int(np.searchsorted(-L, 300.0, "right")))
+        L = L[:j - i]
+        w = ((1.0 - a[i:j]) * np.exp(-L))[:, None]
+        out[i:j] = np.exp(L)[:, None] * (y + np.cumsum(w * x[i:j], axis=0))
+        y = out[j - 1]; i = j
+    return out
+
+
+class AttitudeFilter:
+    """
+    Streaming estimator: update() takes any batch (one TelemetryBus batch live, a whole flight offline)
+    and keeps the last quaternion / time between calls.
+    - tau_s: correction time constant (smaller trusts ACCEL/MAG more, larger trusts GYRO)
+    - gyro_scale: GYRO units -> rad/s (deg/s by default)
+    - accel_1g / accel_gate: ACCEL samples whose norm is off 1 g by more than the gate
+      fraction (thrust, free fall, parachute shock) do not correct the attitude
+    - max_dt_s: longer gaps are not integrated; the estimate re-converges to the reference
+    """
+    def __init__(self, tau_s=2.0, gyro_scale=np.pi / 180.0, accel_1g=9.80665, accel_gate=0.25,
+                 use_mag=True, max_dt_s=1.0, chunk=4096):
+        self.tau = float(tau_s); self.gyro_scale = float(gyro_scale)
+        self.accel_1g = float(accel_1g); self.accel_gate = float(accel_gate)
+        self.use_mag = bool(use_mag); self.max_dt = float(max_dt_s); self.chunk = int(chunk)
+        self.reset()
+
+    @classmethod
+    def from_config(cls, cfg: dict):
+        """telemetry.attitude section; None when disabled."""
+        cfg = cfg or {}
+        if not cfg.get("enable", False): return None
+        units = str(cfg.get("gyro_units", "deg/s")).lower()
+        return cls(float(cfg.get("tau_s", 2.0)), np.pi / 180.0 if units.startswith("deg") else 1.0,
+                   float(cfg.get("accel_1g", 9.80665)), float(cfg.get("accel_gate", 0.25)),
+                   bool(cfg.get("use_mag", True)), float(cfg.get("max_dt_s", 1.0)))
+
+    def reset(self):
+        self.q = None; self.t = None
+
+    def update(self, t, gyro, accel, mag=None):
+        """Arrays t (n,), gyro/accel/mag (n, 3) -> quaternions (n, 4); NaN inputs count as 0."""
+        t = np.asarray(t, dtype=float)
+        gyro = np.nan_to_num(np.asarray(gyro, dtype=float).reshape(-1, 3)) * self.gyro_scale
+        accel = np.nan_to_num(np.asarray(accel, dtype=float).reshape(-1, 3))
+        mag = np.zeros_like(accel) if mag is None or not self.use_mag else np.nan_to_num(np.asarray(mag, dtype=float).reshape(-1, 3))
+        out = np.empty((len(t), 4))
+        for i in range(0, len(t), self.chunk):
+            s = slice(i, i + self.chunk)
+            out[s] = self._chunk(t[s], gyro[s], accel[s], mag[s])
+        return out
+
+    def _chunk(self, t, gyro, accel, mag):
+        norm = np.linalg.norm(accel, axis=1)
+        valid = np.abs(norm / self.accel_1g - 1.0) <= self.accel_gate
+        if self.q is None:    # start from the first usable reference (identity if none yet)
+            first = np.flatnonzero(valid)
+            q0 = reference(accel[first[:1]], mag[first[:1]], np.zeros(1))[0] if len(first) else IDENTITY
+            prev_t = t[0]
+        else:
+            q0 = self.q; prev_t = self.t
+        dt = np.diff(t, prepend=prev_t)
+        dt = np.where((dt > 0) & (dt <= self.max_dt), dt, 0.0)
+        # gyro: q_k = q0 * dq_1 * ... * dq_k (body rates)
+        gyro_q = quat_mul(q0, prefix_product(quat_exp(gyro * dt[:, None])))
+        # reference with the gyro yaw where MAG is missing, then the low-passed world-frame error
+        ref = reference(accel, mag, np.radians(to_euler(gyro_q)[2]))
+        err = quat_log(quat_mul(ref, quat_conj(gyro_q)))
+        a = np.where(valid, np.exp(-dt / self.tau), 1.0)
+        q = quat_normalize(quat_mul(quat_exp(lowpass(err, a)), gyro_q))
+        self.q = q[-1]; self.t = t[-1]
+        return q
+
+    def angles(self, t, gyro, accel, mag=None):
+        """update() -> {ATT_*: degrees array}."""
+        return dict(zip(CHANNELS, to_euler(self.update(t, gyro, accel, mag))))
+
+
+def estimate_flight(flight, attitude=None, **params):
+    """
+    Whole recorded flight (FlightData from read_flight_csv) -> {ATT_*: array} in one batched pass;
+    with `attitude`, that filter runs (and stays at the end of the flight) instead of a new one.
+    """
+    n = flight.rows
+    cols = lambda names: np.column_stack([flight[k] if k in flight else np.zeros(n) for k in names])
+    return (attitude or AttitudeFilter(**params)).angles(flight["t"], cols(GYRO), cols(ACCEL), cols(MAG))
+
+
+def main(argv=None):
+    """python -m ddl.modules.acquisition.attitude Flight_1043.csv [--out attitude.csv]"""
+    import argparse, time
+    from ddl.modules.acquisition.flight_csv import read_flight_csv
+    ap = argparse.ArgumentParser(description="Offline attitude (roll/pitch/yaw/tilt) for a recorded flight CSV.")
+    ap.add_argument("csv"); ap.add_argument("--out", help="output CSV (default: <csv>_attitude.csv)")
+    ap.add_argument("--tau", type=float, default=2.0, help="correction time constant in s (default: %(default)s)")
+    ap.add_argument("--gyro-units", default="deg/s", choices=("deg/s", "rad/s"))
+    ap.add_argument("--no-mag", action="store_true", help="yaw from GYRO only")
+    args = ap.parse_args(argv)
+    start = time.perf_counter()
+    flight = read_flight_csv(args.csv, fields=set(GYRO + ACCEL + MAG))
+    att = estimate_flight(flight, tau_s=args.tau, use_mag=not args.no_mag,
+                          gyro_scale=np.pi / 180.0 if args.gyro_units == "deg/s" else 1.0)
+    out = args.out or args.csv.rsplit(".", 1)[0] + "_attitude.csv"
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(",".join(("MISSION_TIME", "T") + CHANNELS) + "\n")
+        for row in zip(flight["MISSION_TIME"], flight["t"], *(att[c] for c in CHANNELS)):
+            f.write(f"{row[0]},{row[1]:.3f}," + ",".join(f"{v:.2f}" for v in row[2:]) + "\n")
+    print(f"[ATT] {flight.rows} rows -> {out} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Compact binary telemetry: fixed-layout little-endian packets, COBS or SLIP framed.
+
+Packet layout (PACKET.size bytes, CRC-16/CCITT-FALSE over everything before it):
+
+    H  TEAM_ID              I  MISSION_TIME (s of day)   I  PACKET_COUNT
+    c  MODE                 B  STATE (index in STATES, 255 = unknown)
+    f  ALTITUDE  TEMPERATURE  PRESSURE  VOLTAGE
+    f  GYRO_R/P/Y  ACCEL_R/P/Y  MAG_R/P/Y  AUTO_GYRO_ROTATION_RATE
+    I  GPS_TIME (s of day)  f  GPS_ALTITUDE  i  GPS_LATITUDE/LONGITUDE (1e-7 deg)
+    B  GPS_SATS             8s CMD_ECHO                  H  CRC
+"""
+import struct
+import numpy as np
+
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+from ddl.modules.acquisition.integrity import crc16
+
+STATES = ["LAUNCH_PAD","ASCENT","APOGEE","DESCENT","PROBE_RELEASE","PAYLOAD_RELEASE","LANDED"]
+_STATE_INDEX = {s: i for i, s in enumerate(STATES)}
+
+PACKET = struct.Struct("<HIIcB4f3f3f3ffIfiiB8sH")
+PACKET_DTYPE = np.dtype([
+    ("TEAM_ID", "<u2"), ("MISSION_TIME", "<u4"), ("PACKET_COUNT", "<u4"), ("MODE", "S1"), ("STATE", "u1"),
+    ("ALTITUDE", "<f4"), ("TEMPERATURE", "<f4"), ("PRESSURE", "<f4"), ("VOLTAGE", "<f4"),
+    ("GYRO_R", "<f4"), ("GYRO_P", "<f4"), ("GYRO_Y", "<f4"),
+    ("ACCEL_R", "<f4"), ("ACCEL_P", "<f4"), ("ACCEL_Y", "<f4"),
+    ("MAG_R", "<f4"), ("MAG_P", "<f4"), ("MAG_Y", "<f4"),
+    ("AUTO_GYRO_ROTATION_RATE", "<f4"),
+    ("GPS_TIME", "<u4"), ("GPS_ALTITUDE", "<f4"), ("GPS_LATITUDE", "<i4"), ("GPS_LONGITUDE", "<i4"),
+    ("GPS_SATS", "u1"), ("CMD_ECHO", "S8"), ("CRC", "<u2"),
+])
+assert PACKET_DTYPE.itemsize == PACKET.size
+
+
+# ---------- field conversion ----------
+def _hms(sec):
+    sec = int(sec) % 86400
+    return f"{sec // 3600:02d}:{sec // 60 % 60:02d}:{sec % 60:02d}"
+
+def _sec(hms):
+    try:
+        h, m, s = (str(hms).split(":") + ["0", "0"])[:3]
+        return int(h) * 3600 + int(m) * 60 + int(float(s))
+    except ValueError:
+        return 0
+
+def _f1(v): return f"{v:.1f}"
+def _f2(v): return f"{v:.2f}"
+def _deg(v): return f"{v / 1e7:.7f}"
+
+# one formatter per PACKET value (CRC excluded), in REQUIRED_FIELDS order
+_FORMAT = [str, _hms, str, lambda b: b.decode("ascii", "ignore"),
+           lambda i: STATES[i] if i < len(STATES) else "",
+           _f1, _f1, _f1, _f2] + [_f2] * 9 + [_f1, _hms, _f1, _deg, _deg, str,
+           lambda b: b.rstrip(b"\0").decode("ascii", "ignore")]
+assert len(_FORMAT) == len(REQUIRED_FIELDS)
+
+
+def pack_packet(d: dict) -> bytes:
+    """Field dict (strings or numbers, as in REQUIRED_FIELDS) -> raw packet with CRC."""
+    g = lambda k, default=0.0: float(d.get(k, default) or default)
+    body = PACKET.pack(
+        int(g("TEAM_ID")) & 0xFFFF, _sec(d.get("MISSION_TIME", "0")), int(g("PACKET_COUNT")) & 0xFFFFFFFF,
+        str(d.get("MODE", "F") or "F")[:1].encode("ascii"), _STATE_INDEX.get(d.get("STATE", ""), 255),
+        g("ALTITUDE"), g("TEMPERATURE"), g("PRESSURE"), g("VOLTAGE"),
+        g("GYRO_R"), g("GYRO_P"), g("GYRO_Y"), g("ACCEL_R"), g("ACCEL_P"), g("ACCEL_Y"),
+        g("MAG_R"), g("MAG_P"), g("MAG_Y"), g("AUTO_GYRO_ROTATION_RATE"),
+        _sec(d.get("GPS_TIME", "0")), g("GPS_ALTITUDE"),
+        int(round(g("GPS_LATITUDE") * 1e7)), int(round(g("GPS_LONGITUDE") * 1e7)),
+        int(g("GPS_SATS")) & 0xFF, str(d.get("CMD_ECHO", "")).encode("ascii", "ignore")[:8], 0)
+    return body[:-2] + struct.pack("<H", crc16(body[:-2]))
+
+def unpack_packet(raw: bytes):
+    """Raw packet -> field dict of display strings, or None on size/CRC mismatch."""
+    if len(raw) != PACKET.size or crc16(raw[:-2]) != struct.unpack_from("<H", raw, PACKET.size - 2)[0]:
+        return None
+    vals = PACKET.unpack(raw)
+    return {k: f(v) for k, f, v in zip(REQUIRED_FIELDS, _FORMAT, vals)}
+
+def unpack_many(raws):
+    """Batch decode of already-deframed packets into a structured array (CRC-failed rows dropped)."""
+    good = [r for r in raws if len(r) == PACKET.size and crc16(r[:-2]) == struct.unpack_from("<H", r, PACKET.size - 2)[0]]
+    return np.frombuffer(b"".join(good), dtype=PACKET_DTYPE)
+
+
+# ---------- COBS ----------
+def cobs_encode(data: bytes) -> bytes:
+    out = bytearray()
+    for block in data.split(b"\x00"):
+        while len(block) >= 254:
+            out.append(0xFF); out += block[:254]; block = block[254:]
+        out.append(len(block) + 1); out += block
+    return bytes(out)
+
+def cobs_decode(data: bytes) -> bytes:
+    out = bytearray(); i = 0; n = len(data)
+    while i < n:
+        code = data[i]
+        if code == 0: raise ValueError("zero byte inside COBS frame")
+        i += 1; end = i + code - 1
+        if end > n: raise ValueError("truncated COBS frame")
+        out += data[i:end]; i = end
+        if code < 0xFF and i < n: out.append(0)
+    return bytes(out)
+
+
+# ---------- SLIP ----------
+SLIP_END, SLIP_ESC = b"\xc0", b"\xdb"
+
+def slip_encode(data: bytes) -> bytes:
+    return data.replace(SLIP_ESC, b"\xdb\xdd").replace(SLIP_END, b"\xdb\xdc")
+
+def slip_decode(data: bytes) -> bytes:
+    # every ESC is followed by its code byte, so the two passes cannot overlap
+    return data.replace(b"\xdb\xdc", SLIP_END).replace(b"\xdb\xdd", SLIP_ESC)
+
+
+FRAMINGS = {"cobs": (cobs_encode, cobs_decode, b"\x00"), "slip": (slip_encode, slip_decode, SLIP_END)}
+
+
+class BinaryCodec:
+    """
+    Stream decoder/encoder for one framing.
+    - feed() splits incoming bytes at the frame delimiter; a partial frame waits for the next chunk
+    - a frame that fails unframing, size or CRC is counted in `corrupt`; the next delimiter resyncs
+    """
+    def __init__(self, framing: str = "cobs", max_frame: int = 1024):
+        if framing not in FRAMINGS:
+            raise ValueError(f"unknown binary framing '{framing}' (use {', '.join(FRAMINGS)})")
+        self.framing = framing
+        self._enc, self._dec, self.delimiter = FRAMINGS[framing]
+        self.max_frame = max_frame
+        self.buf = bytearray()
+        self.corrupt = 0
+
+    @classmethod
+    def from_config(cls, protocol: str):
+        """None for the ASCII protocol."""
+        return None if not protocol or protocol == "ascii" else cls(protocol)
+
+    def reset(self):
+        self.buf.clear(); self.corrupt = 0
+
+    def encode(self, d: dict) -> bytes:
+        """Field dict -> framed bytes ready for the wire (leading delimiter flushes line noise)."""
+        return self.delimiter + self._enc(pack_packet(d)) + self.delimiter
+
+    def feed(self, chunk: bytes):
+        """Encoded frames completed by this chunk (delimiters stripped)."""
+        buf = self.buf
+        buf += chunk
+        if self.delimiter not in chunk:
+            if len(buf) > self.max_frame:   # no delimiter for too long: garbage
+                buf.clear(); self.corrupt += 1
+            return []
+        parts = buf.split(self.delimiter)
+        self.buf = bytearray(parts.pop())
+        return [bytes(p) for p in parts if p]
+
+    def decode(self, frame: bytes):
+        """Encoded frame -> field dict, or None (counted as corrupt)."""
+        try: data = unpack_packet(self._dec(frame))
+        except ValueError: data = None
+        if data is None: self.corrupt += 1
+        return data
@@ -0,0 +1,254 @@
+import os, re, csv, gzip, lzma, time, queue, shutil, threading
+from datetime import datetime
+
+COMPRESSORS = {"gzip": (gzip.open, ".gz"), "lzma": (lzma.open, ".xz"), "none": (None, "")}
+INDEX_HEADER = ["segment", "file", "first", "last", "lines", "raw_bytes", "stored_bytes"]
+_SEGMENT = re.compile(r"^flight_data_(\d{6})\.txt(\.gz|\.xz)?$")
+MAX_ATTEMPTS = 3                                        # compression tries before a leftover .txt is left alone
+
+
+def _stamp(line: str):
+    """`[2024-01-01 12:00:00.000000] 1234.567890: ...` -> wall-clock timestamp text, or ''."""
+    if line.startswith("["):
+        end = line.find("]")
+        if end > 0: return line[1:end]
+    return ""
+
+
+class BlackBoxLog:
+    """
+    Raw BlackBox log split into numbered segments (flight_data_000001.txt, ...).
+    - a segment is closed when it reaches `segment_mb`, after `segment_minutes`,
+      on every reconnect and on Clear All; nothing is ever truncated
+    - closed segments are compressed by a background worker (gzip / lzma / none)
+      and listed in index.csv with their time range
+    - numbering continues from the highest segment on disk, rescanned on every open, so several
+      writers on one folder (GUI + acquisition process, headless CLI) never share a number
+    - each open segment holds an OS lock on <segment>.lock; on start, plain .txt segments that are
+      neither locked by a live writer nor indexed are crash leftovers and get compressed
+    - an existing archive is never replaced: the .txt is kept instead
+    - a segment that fails to compress gets a <segment>.failed note; after MAX_ATTEMPTS (at once for an
+      archive clash) the kept .txt is no longer retried
+    - retention: past `max_total_mb` on disk or `max_segments` closed segments (0 = no limit) the oldest
+      indexed segments are deleted, always keeping the newest; they drop out of read_index()
+    """
+    def __init__(self, directory: str, segment_mb: float = 16, segment_minutes: float = 60, compression: str = "gzip",
+                 max_total_mb: float = 0, max_segments: int = 0):
+        if compression not in COMPRESSORS:
+            raise ValueError(f"unknown BlackBox compression '{compression}' (use {', '.join(COMPRESSORS)})")
+        self.dir = directory; os.makedirs(directory, exist_ok=True)
+        self.index_path = os.path.join(directory, "index.csv")
+        self.max_bytes = int(float(segment_mb) * 1024 * 1024) if segment_mb else 0
+        self.max_seconds = float(segment_minutes) * 60 if segment_minutes else 0
+        self.compression = compression
+        self.max_total = int(float(max_total_mb) * 1024 * 1024) if max_total_mb else 0
+        self.max_segments = int(max_segments or 0)
+        self.file = None; self.path = None; self.lock = None
+        self.number = self._highest()
+        self.first = ""; self.last = ""; self.lines = 0; self.bytes = 0; self.deadline = 0.0
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._work, name="blackbox-compress", daemon=True)
+        self._worker.start()
+        indexed = {r["file"] for r in read_index(directory)}
+        for name in sorted(os.listdir(directory)):     # crash leftovers
+            m = _SEGMENT.match(name)
+            if not m or m.group(2) or name in indexed: continue
+            path = os.path.join(directory, name)
+            if _attempts(path) >= MAX_ATTEMPTS: continue     # gave up on it, see <segment>.failed
+            lock = _lock(path + ".lock")
+            if lock is None: continue                   # a live writer still has it open
+            self._jobs.put((int(m.group(1)), path, None, lock))
+        self._prune()
+
+    @classmethod
+    def from_config(cls, directory: str, cfg: dict):
+        cfg = cfg or {}
+        return cls(directory, cfg.get("segment_mb", 16), cfg.get("segment_minutes", 60), cfg.get("compression", "gzip"),
+                   cfg.get("max_total_mb", 0), cfg.get("max_segments", 0))
+
+    @property
+    def is_open(self): return self.file is not None
+
+    # WRITER
+    def open(self):
+        """Start a new segment (closing the current one)."""
+        self.close_segment()
+        n = max(self.number, self._highest())
+        while True:
+            n += 1
+            path = os.path.join(self.dir, f"flight_data_{n:06d}.txt")
+            if self._archived(path): continue
+            lock = _lock(path + ".lock")
+            if lock is None: continue
+            try: f = open(path, "x", encoding="utf-8")
+            except FileExistsError:
+                _unlock(lock); continue
+            if self._archived(path):                    # archived by another writer in the meantime
+                f.close(); os.remove(path); _unlock(lock); continue
+            break
+        self.number = n; self.path = path; self.file = f; self.lock = lock
+        self.first = ""; self.last = ""; self.lines = 0; self.bytes = 0
+        self.deadline = time.monotonic() + self.max_seconds if self.max_seconds else 0.0
+
+    def write(self, line: str, t: float = None):
+        """`[wall clock] <monotonic receive time>: line` (the monotonic part only when t is given)."""
+        if self.file is None: return
+        stamp = str(datetime.now())
+        text = f"[{stamp}] {t:.6f}: {line}\n" if t is not None else f"[{stamp}]: {line}\n"
+        self.file.write(text)
+        if not self.first: self.first = stamp
+        self.last = stamp; self.lines += 1; self.bytes += len(text)
+        if (self.max_bytes and self.bytes >= self.max_bytes) or (self.deadline and time.monotonic() >= self.deadline):
+            self.open()
+
+    def write_text(self, text: str):
+        """Unstamped line (exceptions); does not trigger rotation."""
+        if self.file is not None: self.file.write(text + "\n")
+
+    def flush(self):
+        if self.file is not None: self.file.flush()
+
+    def close_segment(self):
+        if self.file is None: return
+        try: self.file.close()
+        except OSError: pass
+        self._jobs.put((self.number, self.path, (self.first, self.last, self.lines), self.lock))
+        self.file = None; self.path = None; self.lock = None
+
+    def close(self, wait: bool = True):
+        """Close the open segment; with wait, block until every closed segment is compressed and indexed."""
+        self.close_segment()
+        if wait: self._jobs.join()
+
+    # COMPRESSION WORKER
+    def _work(self):
+        while True:
+            number, path, meta, lock = self._jobs.get()
+            try:
+                self._store(number, path, meta); self._prune()
+            except Exception as e: self._fail(path, f"{type(e).__name__}: {e}")
+            finally:
+                _unlock(lock, path + ".lock"); self._jobs.task_done()
+
+    def _store(self, number, path, meta):
+        if not os.path.exists(path): return
+        raw_bytes = os.path.getsize(path)
+        if meta is None: meta = self._scan(path)
+        opener, ext = COMPRESSORS[self.compression]
+        out = path
+        if opener is not None:
+            out = path + ext
+            with open(path, "rb") as src, opener(out + ".part", "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            try: _publish(out + ".part", out)
+            except FileExistsError:
+                os.remove(out + ".part")
+                self._fail(path, f"{os.path.basename(out)} already exists", final=True)
+                return
+            os.remove(path)
+        new_index = not os.path.exists(self.index_path)
+        with open(self.index_path, "a", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            if new_index: w.writerow(INDEX_HEADER)
+            w.writerow([number, os.path.basename(out), meta[0], meta[1], meta[2], raw_bytes, os.path.getsize(out)])
+        if os.path.exists(path + ".failed"): os.remove(path + ".failed")
+
+    def _fail(self, path, reason, final=False):
+        """Count a failed compression in <segment>.failed; past MAX_ATTEMPTS the .txt is kept as is."""
+        n = MAX_ATTEMPTS if final else _attempts(path) + 1
+        try:
+            with open(path + ".failed", "w", encoding="utf-8") as f: f.write(f"{n}\n{reason}\n")
+        except OSError: pass
+        if n >= MAX_ATTEMPTS: print(f"[WARNING] BLACKBOX {reason} - keeping {os.path.basename(path)}, not retried")
+        else: print(f"[WARNING] BLACKBOX {os.path.basename(path)}: {reason} (attempt {n}/{MAX_ATTEMPTS})")
+
+    def _prune(self):
+        """Delete the oldest indexed segments past max_total_mb / max_segments (never the newest)."""
+        if not (self.max_total or self.max_segments): return
+        closed = [os.path.join(self.dir, r["file"]) for r in read_index(self.dir)]
+        total = sum(_size(os.path.join(self.dir, n)) for n in os.listdir(self.dir) if _SEGMENT.match(n))
+        for path in closed[:-1]:
+            over = len(closed) > self.max_segments if self.max_segments else False
+            if not (over or (self.max_total and total > self.max_total)): break
+            total -= _size(path); closed.remove(path)
+            try: os.remove(path)
+            except OSError: pass                        # another writer pruned it first
+
+    def _highest(self):
+        return max((int(m.group(1)) for m in map(_SEGMENT.match, os.listdir(self.dir)) if m), default=0)
+
+    @staticmethod
+    def _archived(path):
+        return any(os.path.exists(path + ext) for _, ext in COMPRESSORS.values() if ext)
+
+    @staticmethod
+    def _scan(path):
+        first = last = ""; lines = 0
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                s = _stamp(line)
+                if s:
+                    if not first: first = s
+                    last = s; lines += 1
+        return first, last, lines
+
+
+def _size(path):
+    try: return os.path.getsize(path)
+    except OSError: return 0
+
+
+def _attempts(path):
+    """Failed compression attempts recorded for a segment .txt."""
+    try:
+        with open(path + ".failed", encoding="utf-8") as f: return int(f.readline())
+    except (OSError, ValueError): return 0
+
+
+def _lock(path):
+    """Exclusive non-blocking OS lock on `path` (created if needed): the open file, or None if another process holds it."""
+    f = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt; f.seek(0); msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl; fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close(); return None
+    return f
+
+
+def _unlock(f, path=None):
+    """Release a _lock() (the OS drops it on close); with `path`, also remove the lock file."""
+    if f is None: return
+    f.close()
+    try:
+        if path: os.remove(path)
+    except OSError:
+        pass
+
+
+def _publish(src, dst):
+    """Move src to dst; FileExistsError instead of replacing an existing dst."""
+    if os.name == "nt":
+        os.rename(src, dst)                             # never replaces on Windows
+        return
+    os.link(src, dst)
+    os.remove(src)
+
+
+def read_index(directory: str):
+    """index.csv rows as dicts (segment, file, first, last, lines, raw_bytes, stored_bytes), oldest first; pruned segments are left out."""
+    try:
+        with open(os.path.join(directory, "index.csv"), newline="", encoding="utf-8") as f:
+            rows = sorted(csv.DictReader(f), key=lambda r: int(r["segment"]))
+        return [r for r in rows if os.path.exists(os.path.join(directory, r["file"]))]
+    except FileNotFoundError:
+        return []
+
+
+def open_segment(path: str):
+    """Text reader for a segment whatever its compression."""
+    for opener, ext in COMPRESSORS.values():
+        if ext and path.endswith(ext): return opener(path, "rt", encoding="utf-8", errors="ignore")
+    return open(path, "r", encoding="utf-8", errors="ignore")
@@ -0,0 +1,120 @@
+"""
+Several recorded flights on one time base, aligned on a flight event.
+
+Events: "start", "launch" (first STATE leaving LAUNCH_PAD, else the first
+`rise_m` climb above the first altitude), "apogee" (highest ALTITUDE), "landed",
+or "state:<NAME>" (first row with that STATE). Every flight is resampled onto
+one grid of `dt` seconds relative to its event; samples outside a flight are NaN.
+
+A Flight_<TEAM>.csv holds every session appended, split by Clear All and session markers:
+`flight.csv@N` picks the N-th flight of the file (negative from the end), `@all`
+takes each one; without a selector the last flight is compared.
+"""
+import os
+import numpy as np
+
+from ddl.modules.acquisition.flight_csv import read_flight_csv
+
+EVENTS = ("start", "launch", "apogee", "landed", "state:<NAME>")
+
+
+def event_time(flight, event: str = "launch", rise_m: float = 5.0):
+    """Session time of `event` in a FlightData, or None when the flight never reaches it."""
+    t = flight["t"]
+    if not len(t): return None
+    state = flight.get("STATE")
+    def first(mask):
+        i = np.flatnonzero(mask)
+        return float(t[i[0]]) if len(i) else None
+    if event == "start": return float(t[0])
+    if event == "apogee":
+        alt = flight.get("ALTITUDE")
+        return float(t[np.nanargmax(alt)]) if alt is not None and np.isfinite(alt).any() else None
+    if event == "launch":
+        if state is not None:
+            pad = np.flatnonzero(state == "LAUNCH_PAD")
+            if len(pad):
+                hit = first((state != "LAUNCH_PAD") & (np.arange(len(t)) > pad[0]))
+                if hit is not None: return hit
+        alt = flight.get("ALTITUDE")
+        return first(alt > alt[np.isfinite(alt)][0] + rise_m) if alt is not None and np.isfinite(alt).any() else None
+    if event == "landed": event = "state:LANDED"
+    if event.startswith("state:"):
+        return first(state == event[6:]) if state is not None else None
+    raise ValueError(f"unknown event '{event}' (use {', '.join(EVENTS)})")
+
+
+def parse_spec(spec: str):
+    """'flight.csv@2' -> ('flight.csv', '2'); no (or an invalid) selector -> (spec, None)."""
+    path, sep, sel = spec.rpartition("@")
+    if sep and path and (sel == "all" or sel.lstrip("-").isdigit()): return path, sel
+    return spec, None
+
+
+def pick_flights(f, sel, name):
+    """[(name, FlightData)] for selector `sel` ('all', N or -N) over the flights of `f` (FlightData.segments)."""
+    segs = f.segments()
+    if not segs: raise ValueError("no telemetry rows")
+    label = lambda k: name if len(segs) == 1 else f"{name}#{k + 1}"
+    if sel == "all": return [(label(k), f.slice(*s)) for k, s in enumerate(segs)]
+    k = int(sel); k = k - 1 if k > 0 else len(segs) + k
+    if not 0 <= k < len(segs): raise ValueError(f"no flight {sel} ({len(segs)} in the file)")
+    return [(label(k), f.slice(*segs[k]))]
+
+
+def resample(t, values, grid):
+    """
+    Linear interpolation of every row of `values` (C x n, over non-decreasing t) at `grid`,
+    NaN outside [t0, t1]; the bracketing indices and weights are computed once for all rows.
+    """
+    values = np.atleast_2d(values)
+    if len(t) < 2: return np.full((len(values), len(grid)), np.nan)
+    i1 = np.clip(np.searchsorted(t, grid, "right"), 1, len(t) - 1); i0 = i1 - 1
+    span = t[i1] - t[i0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        w = np.where(span > 0, (grid - t[i0]) / span, 0.0)
+    out = values[:, i0] + (values[:, i1] - values[:, i0]) * w
+    out[:, (grid < t[0]) | (grid > t[-1])] = np.nan
+    return out
+
+
+class Comparison:
+    """Aligned flights: `grid` (s from the event), `names`, `offsets` (event time per flight) and
+    `channels[name]` -> (flights x grid) array."""
+    def __init__(self, event, grid, names, offsets, channels, skipped):
+        self.event = event; self.grid = grid; self.names = names
+        self.offsets = offsets; self.channels = channels; self.skipped = skipped
+
+
+def compare_flights(paths, channels, event: str = "launch", dt: float = 0.1,
+                    max_points: int = 200000, rise_m: float = 5.0, segment: str = "-1") -> Comparison:
+    """
+    Load `paths` (only `channels` + STATE/ALTITUDE converted), align on `event`, resample.
+    A path may end in @N / @all (see parse_spec); the others take `segment` (the last flight).
+    """
+    flights = []; skipped = []
+    need = set(channels) | {"STATE", "ALTITUDE"}
+    for spec in paths:
+        path, sel = parse_spec(spec)
+        try:
+            picked = pick_flights(read_flight_csv(path, fields=need), sel or segment,
+                                  os.path.splitext(os.path.basename(path))[0])
+        except (OSError, ValueError) as e:
+            skipped.append((spec, str(e))); continue
+        for name, f in picked:
+            t0 = event_time(f, event, rise_m)
+            if t0 is None or f.rows < 2:
+                skipped.append((name, f"no '{event}' event" if f.rows >= 2 else "too few rows")); continue
+            flights.append((name, t0, f))
+    if not flights:
+        return Comparison(event, np.zeros(0), [], [], {c: np.zeros((0, 0)) for c in channels}, skipped)
+    lo = min(f["t"][0] - t0 for _, t0, f in flights); hi = max(f["t"][-1] - t0 for _, t0, f in flights)
+    dt = max(dt, (hi - lo) / max_points)
+    grid = np.arange(lo, hi + dt / 2, dt)
+    out = {c: np.full((len(flights), len(grid)), np.nan) for c in channels}
+    for k, (_, t0, f) in enumerate(flights):
+        have = [c for c in channels if c in f]
+        if not have: continue
+        rows = resample(f["t"] - t0, np.vstack([f[c] for c in have]), grid)
+        for c, row in zip(have, rows): out[c][k] = row
+    return Comparison(event, grid, [n for n, _, _ in flights], [t0 for _, t0, _ in flights], out, skipped)
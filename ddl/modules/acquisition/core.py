@@ -0,0 +1,97 @@
+import time
+
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS, RX_TIME, parse_frame, PacketCounter
+from ddl.modules.acquisition.integrity import FrameChecker
+from ddl.modules.acquisition.binary import BinaryCodec
+
+
+class AcquisitionCore:
+    """
+    Qt-free per-frame pipeline shared by every reader mode
+    (GUI thread, acquisition process, headless):
+    ASCII:  line -> BlackBox -> [checksum/resync] -> parse -> packet counters -> CSV
+    binary: bytes -> COBS/SLIP deframe -> BlackBox (hex) -> unpack + CRC -> counters -> CSV
+    Every frame is stamped with time.monotonic() as soon as its bytes are read (data[RX_TIME]).
+    """
+    def __init__(self, recorder, filter_character: str = "", checker=None, codec=None):
+        self.recorder = recorder
+        self.filter_character = filter_character or ""
+        self.checker = checker            # FrameChecker or None (no integrity check)
+        self.codec = codec                # BinaryCodec or None (ASCII protocol)
+        self.counter = PacketCounter()
+
+    @classmethod
+    def from_config(cls, recorder, connection: dict, team_id: str = ""):
+        """Build from the `connection` config section (protocol, integrity, filter_character)."""
+        connection = connection or {}
+        return cls(recorder, connection.get("filter_character", ""),
+                   FrameChecker.from_config(connection.get("integrity"), team_id),
+                   BinaryCodec.from_config(connection.get("protocol", "ascii")))
+
+    @property
+    def corrupt(self):
+        return (self.checker.corrupt if self.checker else 0) + (self.codec.corrupt if self.codec else 0)
+    @property
+    def resynced(self): return self.checker.resynced if self.checker else 0
+
+    def read(self, ser):
+        """Blocking read of whatever the protocol needs next; returns [(line, data), ...]."""
+        if self.codec is None:
+            raw = ser.readline()
+            return [self.handle(raw, time.monotonic())]
+        chunk = ser.read(ser.in_waiting or 1)
+        return self.feed(chunk, time.monotonic())
+
+    def handle(self, raw: bytes, t: float = None):
+        """One ASCII line -> (line, data); line is None for empty reads, data None for non-telemetry lines."""
+        line = raw.decode("utf-8", errors="ignore").strip()
+        if not line: return None, None
+        if t is None: t = time.monotonic()
+        self.recorder.raw(line, t)
+        if self.checker is None:
+            line, data = parse_frame(line, self.filter_character)
+            if data is not None: self._accept(data, t)
+            return line, data
+
+        fc = self.filter_character
+        if fc and line.startswith(fc):
+            line = line.replace(fc, "", 1).strip()
+        payloads = self.checker.frames(line)
+        if payloads is None: return line, None
+        if not payloads: return f"(!) [CORRUPT FRAME] {line}", None
+        # several payloads only when frames ran together: all are recorded, the last is returned
+        data = None
+        for payload in payloads:
+            _, d = parse_frame(payload)
+            if d is not None:
+                self._accept(d, t); data = d; line = payload
+        return line, data
+
+    def feed(self, chunk: bytes, t: float = None):
+        """Binary protocol: bytes from the port -> [(line, data), ...] for every completed frame."""
+        out = []
+        if t is None: t = time.monotonic()
+        for frame in self.codec.feed(chunk):
+            out.append(self.handle_frame(frame, t))
+        return out
+
+    def handle_frame(self, frame: bytes, t: float = None):
+        """One deframed binary frame -> (line, data); also used to replay BlackBox `BIN:<hex>` lines."""
+        if t is None: t = time.monotonic()
+        raw = "BIN:" + frame.hex()
+        self.recorder.raw(raw, t)
+        data = self.codec.decode(frame)
+        if data is None: return f"(!) [CORRUPT FRAME] {raw}", None
+        self._accept(data, t)
+        return ",".join(data[k] for k in REQUIRED_FIELDS), data
+
+    def _accept(self, data, t):
+        data[RX_TIME] = t
+        self.counter.count(data)
+        self.recorder.write_row(data)
+
+    def clear(self):
+        self.counter.reset()
+        if self.checker: self.checker.reset()
+        if self.codec: self.codec.reset()
+        self.recorder.mark_clear()
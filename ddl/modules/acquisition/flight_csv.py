@@ -0,0 +1,136 @@
+"""
+Vectorized Flight_<TEAM_ID>.csv loading: numbers and text columns go through
+NumPy's C CSV reader (np.loadtxt), never a per-row Python parse.
+"""
+import numpy as np
+
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+
+TEXT_FIELDS = ("TEAM_ID", "MISSION_TIME", "MODE", "STATE", "GPS_TIME", "CMD_ECHO")
+NUMERIC_FIELDS = [f for f in REQUIRED_FIELDS if f not in TEXT_FIELDS]
+CLEAR_MARK = "# --- CLEAR ALL ---"
+SESSION_MARK = "# --- SESSION "      # + "<id> ---", written by Recorder.open_csv()
+
+
+def hms_seconds(col) -> np.ndarray:
+    """'hh:mm:ss' strings -> seconds of day as float (NaN when malformed), without a Python loop."""
+    a = np.ascontiguousarray(col, dtype="U8")
+    if not len(a): return np.zeros(0)
+    c = a.view(np.uint32).reshape(len(a), 8).astype(np.int64) - 48
+    ok = (c[:, 2] == ord(":") - 48) & (c[:, 5] == ord(":") - 48)
+    d = c[:, [0, 1, 3, 4, 6, 7]]
+    ok &= ((d >= 0) & (d <= 9)).all(axis=1)
+    sec = (d[:, 0] * 10 + d[:, 1]) * 3600 + (d[:, 2] * 10 + d[:, 3]) * 60 + d[:, 4] * 10 + d[:, 5]
+    return np.where(ok, sec, np.nan).astype(float)
+
+
+def hms_second(text) -> float:
+    """One 'hh:mm:ss' -> seconds of day (NaN when malformed); hms_seconds() for a single live packet."""
+    s = str(text)[:8]
+    if len(s) != 8 or s[2] != ":" or s[5] != ":": return float("nan")
+    d = s[:2] + s[3:5] + s[6:]
+    if not (d.isascii() and d.isdigit()): return float("nan")
+    return float(int(d[:2]) * 3600 + int(d[2:4]) * 60 + int(d[4:]))
+
+
+def continuous_time(sec: np.ndarray) -> np.ndarray:
+    """
+    Seconds of day -> non-decreasing session time.
+    - a drop of more than 12 h is UTC midnight (+86400)
+    - any other step back (new session, Clear All) restarts 1 s after the previous sample
+    - packets sharing one MISSION_TIME second are spread evenly inside it
+    """
+    sec = np.asarray(sec, dtype=float)
+    n = len(sec)
+    if not n: return sec
+    s = sec.copy()
+    bad = np.isnan(s)
+    if bad.all(): return np.arange(n, dtype=float)
+    if bad.any():   # carry the last good value forward (and the first good one back)
+        idx = np.where(~bad, np.arange(n), 0); np.maximum.accumulate(idx, out=idx)
+        s = s[idx]; s[:np.argmax(~bad)] = s[np.argmax(~bad)]
+    d = np.diff(s, prepend=s[0])
+    fix = np.where(d < -43200, 86400.0, np.where(d < 0, 1.0 - d, 0.0))
+    t = s + np.cumsum(fix)
+    # spread duplicates: position inside each run of equal seconds
+    start = np.flatnonzero(np.diff(t, prepend=np.nan) != 0)
+    run_id = np.cumsum(np.diff(t, prepend=np.nan) != 0) - 1
+    counts = np.diff(np.append(start, n))
+    k = np.arange(n) - start[run_id]
+    return t + k / counts[run_id]
+
+
+class FlightData(dict):
+    """Column dict (numeric fields as float arrays, text fields as str arrays) plus `t`, `clears` and `sessions`."""
+    clears = (); sessions = (); session = ""
+
+    @property
+    def rows(self): return len(self["t"])
+
+    def segments(self):
+        """(start, stop) row ranges between Clear All markers and app sessions (one flight each), empty ones left out."""
+        edges = sorted({0, self.rows, *self.clears, *self.sessions})
+        return [(a, b) for a, b in zip(edges, edges[1:]) if b > a]
+
+    def slice(self, start: int, stop: int):
+        """Rows [start, stop) as a FlightData of their own (views, no copy)."""
+        return FlightData((k, v[start:stop]) for k, v in self.items())
+
+
+def read_flight_csv(path: str, header=None, fields=None) -> FlightData:
+    """
+    Load a flight CSV in one pass.
+    - `# ...` lines (Clear All / session markers) are skipped; `clears` holds the row index after each
+      Clear All, `sessions` the row where each app run starts (a marker with a new id) and `session` the last id
+    - rows with the wrong field count are dropped
+    - `fields` limits the converted columns (MISSION_TIME is always kept for `t`)
+    - `t` is continuous_time(MISSION_TIME)
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        lines = f.read().splitlines()
+    if lines and header is None and lines[0].startswith("TEAM_ID"):
+        header = [h.strip() for h in lines[0].split(",")]; lines = lines[1:]
+    header = list(header or REQUIRED_FIELDS)
+    ncomma = len(header) - 1
+    rows = []; clears = []; sessions = []; session = ""
+    for line in lines:
+        if line.count(",") == ncomma and not line.startswith("#"): rows.append(line)
+        elif line.startswith(CLEAR_MARK): clears.append(len(rows))
+        elif line.startswith(SESSION_MARK):     # the same id again is a reconnect, not a new run
+            sid = line[len(SESSION_MARK):].split(" ")[0]
+            if sid != session: sessions.append(len(rows)); session = sid
+    out = FlightData()
+    n = len(rows)
+    keep = set(header) if fields is None else set(fields) | {"MISSION_TIME"}
+    num = [j for j, name in enumerate(header) if name not in TEXT_FIELDS and name in keep]
+    txt = [j for j, name in enumerate(header) if name in TEXT_FIELDS and name in keep]
+    if n:
+        try:
+            numbers = np.loadtxt(rows, delimiter=",", usecols=num, dtype=np.float64, ndmin=2, comments=None)
+        except ValueError:   # a malformed number somewhere: NaN for that cell (slower path)
+            numbers = np.loadtxt(rows, delimiter=",", usecols=num, converters=_float, ndmin=2, comments=None)
+        texts = np.loadtxt(rows, delimiter=",", usecols=txt, dtype=str, ndmin=2, comments=None) if txt else None
+    else:
+        numbers = np.zeros((0, len(num))); texts = np.zeros((0, len(txt)), dtype=str)
+    for i, j in enumerate(num): out[header[j]] = numbers[:, i]
+    for i, j in enumerate(txt): out[header[j]] = texts[:, i]
+    out["t"] = continuous_time(hms_seconds(out["MISSION_TIME"])) if "MISSION_TIME" in out else np.arange(n, dtype=float)
+    out.clears = clears; out.sessions = sessions; out.session = session
+    return out
+
+
+def count_rows(path: str, header=None) -> int:
+    """Data rows read_flight_csv() would return, without converting them."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f: lines = f.read().splitlines()
+    except FileNotFoundError:
+        return 0
+    if lines and header is None and lines[0].startswith("TEAM_ID"):
+        header = lines[0].split(","); lines = lines[1:]
+    ncomma = len(header or REQUIRED_FIELDS) - 1
+    return sum(1 for line in lines if line.count(",") == ncomma and not line.startswith("#"))
+
+
+def _float(v):
+    try: return float(v)
+    except (TypeError, ValueError): return np.nan
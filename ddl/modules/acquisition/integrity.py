@@ -0,0 +1,97 @@
+import binascii
+
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+
+
+def crc16(data: bytes, crc: int = 0xFFFF) -> int:
+    """CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) via binascii's table-driven C loop."""
+    return binascii.crc_hqx(data, crc)
+
+def xor8(data: bytes) -> int:
+    """NMEA-style XOR of all bytes, folded as one big int (O(log n) Python ops)."""
+    width = len(data)
+    x = int.from_bytes(data, "little")
+    while width > 1:
+        half = (width + 1) // 2
+        x = (x >> (half * 8)) ^ (x & ((1 << (half * 8)) - 1))
+        width = half
+    return x
+
+# mode -> (checksum function, hex digits after '*')
+CHECKSUMS = {"crc16": (crc16, 4), "xor": (xor8, 2)}
+
+
+class FrameChecker:
+    """
+    Per-frame checksum verification: `[start_marker]<payload>*<HEX>`.
+    - frames() returns the verified payloads of a line: [] when corrupt, None when the line is
+      plain text; only lines that look like telemetry (carrying the sync token, or at least
+      `min_fields` fields) are checked and counted, boot/debug chatter passes through untouched
+    - on a failed line it resyncs by scanning for later frame starts
+      (start_marker, or `sync_token` such as "<TEAM_ID>," when there is no marker)
+    - counts ok / corrupt / resynced frames
+    """
+    def __init__(self, mode: str = "crc16", start_marker: str = "", sync_token: str = "",
+                 resync: bool = True, min_fields: int = len(REQUIRED_FIELDS)):
+        if mode not in CHECKSUMS:
+            raise ValueError(f"unknown checksum mode '{mode}' (use {', '.join(CHECKSUMS)})")
+        self.mode = mode
+        self.fn, self.width = CHECKSUMS[mode]
+        self.start_marker = start_marker or ""
+        self.sync_token = self.start_marker or sync_token or ""
+        self.resync = resync
+        self.min_commas = min_fields - 1
+        self.reset()
+
+    @classmethod
+    def from_config(cls, cfg: dict, team_id: str = ""):
+        """None when connection.integrity.mode is "none"/missing."""
+        cfg = cfg or {}
+        mode = cfg.get("mode", "none")
+        if not mode or mode == "none": return None
+        return cls(mode, cfg.get("start_marker", ""), f"{team_id}," if team_id else "", cfg.get("resync", True))
+
+    def reset(self):
+        self.ok = 0; self.corrupt = 0; self.resynced = 0
+
+    def seal(self, payload: str) -> str:
+        """Build a frame the checker accepts (dummy generator / test stand-ins)."""
+        return f"{self.start_marker}{payload}*{self.fn(payload.encode('ascii', 'ignore')):0{self.width}X}"
+
+    def frames(self, line: str):
+        tok = self.sync_token
+        if not ((tok and tok in line) or line.count(",") >= self.min_commas): return None
+        star = line.rfind("*")
+        if star < 0:
+            self.corrupt += 1; return []
+        m = self.start_marker
+        begin = len(m) if m and line.startswith(m) else 0
+        if (begin or not m) and self._valid(line[begin:star], line[star + 1:]):
+            self.ok += 1
+            return [line[begin:star]]
+        found = self._scan(line) if self.resync else []
+        if found: self.resynced += len(found)
+        else: self.corrupt += 1
+        return found
+
+    def _valid(self, payload: str, cs: str) -> bool:
+        if len(cs) != self.width: return False
+        try: return int(cs, 16) == self.fn(payload.encode("ascii", "ignore"))
+        except ValueError: return False
+
+    def _scan(self, line: str):
+        tok = self.sync_token
+        if not tok: return []
+        skip = len(self.start_marker); w = self.width
+        out = []
+        pos = line.find(tok)
+        while pos >= 0:
+            begin = pos + skip
+            star = line.find("*", begin)
+            if star < 0: break
+            if self._valid(line[begin:star], line[star + 1:star + 1 + w]):
+                out.append(line[begin:star])
+                pos = line.find(tok, star + 1 + w)
+            else:
+                pos = line.find(tok, pos + 1)
+        return out
@@ -0,0 +1,105 @@
+import time, queue, threading
+import multiprocessing as mp
+
+from ddl.modules.acquisition.ring import PacketRing, KIND_PACKET, KIND_TEXT
+from ddl.modules.acquisition.recorder import Recorder
+from ddl.modules.acquisition.core import AcquisitionCore
+from ddl.modules.acquisition.protocol import RX_TIME
+from ddl.modules.acquisition.reader import SerialAcquisition
+
+
+def run_acquisition(cfg: dict, ring_name: str, commands, stop):
+    """
+    Child-process entry: serial read + BlackBox/CSV recording, publishing to the ring.
+    - commands: ("write", bytes) goes straight to the port from a pump thread;
+      ("record", bool) / ("clear",) are applied by the read loop between lines
+    """
+    import serial
+    ring = PacketRing.attach(ring_name)
+    recorder = Recorder(cfg["logs_path"], cfg["csv_file_path"], cfg["csv_header"], cfg["include_header"],
+                        cfg.get("blackbox"), cfg.get("pyramid"), cfg.get("session"))
+    recorder.record_enabled = cfg["record_enabled"]
+    core = AcquisitionCore.from_config(recorder, cfg["connection"], cfg.get("team_id", ""))
+    if cfg.get("counters"):   # resumed session: keep counting from the GUI's counters
+        core.counter.received, core.counter.lost, core.counter.last = cfg["counters"]
+    lock = threading.Lock()   # the ring has one writer: reader loop + command pump share it
+
+    def publish(line, data):
+        c = core.counter
+        rx = data[RX_TIME] if data is not None else time.monotonic()
+        with lock: ring.write(KIND_PACKET if data is not None else KIND_TEXT, line.encode("utf-8"),
+                              c.received, c.lost, core.corrupt, core.resynced, rx)
+    text = lambda msg: publish(msg, None)
+
+    acq = SerialAcquisition(core, cfg["port"], cfg["baudrate"], cfg["timeout"], on_frame=publish)
+    try:
+        acq.open()
+    except Exception as e:
+        text(f"[-] Error Connecting - {e}"); ring.close(); return
+
+    recorder.catch_up_pyramid(); recorder.open_csv(); recorder.open_blackbox()
+    pump = threading.Thread(target=_command_pump, args=(commands, acq, stop, text), daemon=True)
+    pump.start()
+    try:
+        acq.run(stop)
+    except serial.SerialException as e:
+        text(f"[-] Serial error - {e}")
+    finally:
+        acq.close(); recorder.close(); ring.close()
+
+
+def _command_pump(commands, acq, stop, text):
+    while not stop.is_set():
+        try: cmd = commands.get(timeout=0.2)
+        except queue.Empty: continue
+        except (EOFError, OSError): return
+        if cmd[0] == "write":
+            try: acq.write(cmd[1])
+            except Exception as e: text(f"[-] Error Sending Data - {e}")
+        elif cmd[0] == "record":
+            acq.controls.put(lambda core, on=bool(cmd[1]): set_recording(core.recorder, on))
+        elif cmd[0] == "clear":
+            acq.controls.put(lambda core: core.clear())
+
+
+def set_recording(recorder, on: bool):
+    recorder.record_enabled = on
+    if on: recorder.open_csv()
+    else: recorder.flush()
+
+
+class AcquisitionProcess:
+    """
+    GUI-side handle of the acquisition child process.
+    - owns the shared-memory ring (the GUI polls it with read())
+    - spawn context: the child never inherits Qt state
+    """
+    def __init__(self, cfg: dict, slots: int = 4096, slot_bytes: int = 1024):
+        ctx = mp.get_context("spawn")
+        self.ring = PacketRing.create(slots, slot_bytes)
+        self.commands = ctx.Queue()
+        self.stop_event = ctx.Event()
+        self.proc = ctx.Process(target=run_acquisition, name="ddl-acquisition",
+                                args=(cfg, self.ring.name, self.commands, self.stop_event), daemon=True)
+
+    def start(self): self.proc.start()
+    def is_alive(self): return self.proc.is_alive()
+
+    def read(self, max_items: int = 0): return self.ring.read(max_items)
+    @property
+    def overruns(self): return self.ring.overruns
+
+    def write(self, data: bytes): self.commands.put(("write", data))
+    def set_recording(self, on: bool): self.commands.put(("record", bool(on)))
+    def clear(self): self.commands.put(("clear",))
+
+    def stop(self, timeout: float = 3.0):
+        """Stop the child and release the ring; returns the records it published last."""
+        self.stop_event.set()
+        self.proc.join(timeout)
+        if self.proc.is_alive():
+            self.proc.terminate(); self.proc.join(1.0)
+        tail = self.ring.read()
+        self.commands.close()
+        self.ring.close()
+        return tail
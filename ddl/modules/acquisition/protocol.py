@@ -0,0 +1,48 @@
+REQUIRED_FIELDS = [
+    "TEAM_ID","MISSION_TIME","PACKET_COUNT","MODE","STATE","ALTITUDE",
+    "TEMPERATURE","PRESSURE","VOLTAGE",
+    "GYRO_R","GYRO_P","GYRO_Y",
+    "ACCEL_R","ACCEL_P","ACCEL_Y",
+    "MAG_R","MAG_P","MAG_Y",
+    "AUTO_GYRO_ROTATION_RATE",
+    "GPS_TIME","GPS_ALTITUDE","GPS_LATITUDE","GPS_LONGITUDE","GPS_SATS",
+    "CMD_ECHO"
+]
+_N_FIELDS = len(REQUIRED_FIELDS)
+# time.monotonic() at byte receipt, added by the reader to every packet dict (float, seconds)
+RX_TIME = "RX_TIME"
+
+
+def parse_frame(line: str, filter_character: str = ""):
+    """
+    Split one telemetry line.
+    Returns (line, data): data is the field dict, or None for short/non-telemetry lines.
+    """
+    if filter_character and line.startswith(filter_character):
+        line = line.replace(filter_character, "", 1).strip()
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) < _N_FIELDS:
+        return line, None
+    return line, dict(zip(REQUIRED_FIELDS, parts[:_N_FIELDS]))
+
+
+class PacketCounter:
+    """Received/lost bookkeeping from PACKET_COUNT gaps."""
+    def __init__(self): self.reset()
+
+    def reset(self):
+        self.received = 0; self.lost = 0; self.last = None
+
+    def count(self, data: dict):
+        try:
+            pkt = int(data["PACKET_COUNT"])
+        except (KeyError, ValueError, TypeError):
+            return
+        if self.last is None:
+            self.received = 1
+        else:
+            step = pkt - self.last
+            if step <= 0: self.received += 1
+            else:
+                self.lost += max(0, step-1); self.received += 1
+        self.last = pkt
@@ -0,0 +1,215 @@
+"""
+On-disk min/max pyramid for browsing long recordings.
+
+<name>.pyr/
+    meta.json      channels, fanout
+    L0.bin         one record per packet: t, lo[C], hi[C]   (lo == hi)
+    L1.bin ...     one record per `fanout` records of the level below: first t, min lo, max hi
+
+Levels are appended while recording (PyramidWriter) or built in one vectorized
+pass from a flight CSV (build_from_csv). Pyramid.query() memory-maps the level
+files and binary-searches the view, so only the pages covering the visible
+time range of one level are read.
+"""
+import os, json, math, time
+import numpy as np
+
+from ddl.modules.acquisition.flight_csv import NUMERIC_FIELDS, read_flight_csv, hms_second, count_rows
+
+MAX_LEVELS = 12
+
+
+def level_dtype(channels: int):
+    return np.dtype([("t", "<f8"), ("lo", "<f4", (channels,)), ("hi", "<f4", (channels,))])
+
+
+def pyramid_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".pyr"
+
+
+class PyramidWriter:
+    """
+    Incremental builder fed one packet at a time (Recorder.write_row).
+    - per-level accumulators are NumPy vectors over all channels
+    - records are buffered and appended to the level files every `flush_every` packets
+    - time is MISSION_TIME made continuous (midnight / restarts); packets inside one
+      MISSION_TIME second are placed by their RX_TIME offset
+    """
+    def __init__(self, directory: str, channels=None, fanout: int = 8, flush_every: int = 256):
+        self.dir = directory; os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f: meta = json.load(f)
+            channels, fanout = meta["channels"], meta["fanout"]
+        else:
+            channels = list(channels or NUMERIC_FIELDS)
+            with open(meta_path, "w", encoding="utf-8") as f: json.dump({"channels": channels, "fanout": fanout}, f)
+        self.channels = list(channels); self.fanout = int(fanout); self.flush_every = flush_every
+        C = len(self.channels)
+        self.dtype = level_dtype(C)
+        self.acc_t = np.full(MAX_LEVELS, np.nan); self.acc_n = np.zeros(MAX_LEVELS, np.int64)
+        self.acc_lo = np.full((MAX_LEVELS, C), np.inf, np.float32); self.acc_hi = np.full((MAX_LEVELS, C), -np.inf, np.float32)
+        self.pending = [[] for _ in range(MAX_LEVELS)]
+        self.records = np.zeros(MAX_LEVELS, np.int64)     # per level, this session
+        self.count = 0
+        # continuous time state (resume after the last stored sample)
+        self.last_t = _last_t(os.path.join(directory, "L0.bin"), self.dtype)
+        self.offset = 0.0; self.prev_sec = None; self.sec_rx0 = None
+
+    def _time(self, mission_time, rx):
+        sec = hms_second(mission_time or "")     # scalar parse: this runs per packet on the acquisition path
+        if math.isnan(sec): sec = self.prev_sec if self.prev_sec is not None else 0.0
+        if self.prev_sec is not None and sec != self.prev_sec:
+            if sec < self.prev_sec - 43200: self.offset += 86400.0
+        if sec != self.prev_sec:
+            self.sec_rx0 = rx
+        self.prev_sec = sec
+        frac = min(0.999, max(0.0, rx - self.sec_rx0)) if rx is not None and self.sec_rx0 is not None else 0.0
+        t = sec + self.offset + frac
+        if self.last_t is not None and t <= self.last_t:   # new session / Clear All: keep time increasing
+            shift = self.last_t + 1.0 - (sec + self.offset)
+            self.offset += shift; t = sec + self.offset + frac
+        self.last_t = t
+        return t
+
+    def append(self, data: dict, rx: float = None):
+        v = np.array([_f(data.get(c)) for c in self.channels], np.float32)
+        self.append_values(self._time(data.get("MISSION_TIME"), rx if rx is not None else time.monotonic()), v)
+
+    def append_values(self, t: float, v):
+        self.pending[0].append((t, v, v)); self.records[0] += 1
+        lo = v; hi = v
+        for k in range(1, MAX_LEVELS):
+            if self.acc_n[k] == 0: self.acc_t[k] = t
+            np.fmin(self.acc_lo[k], lo, out=self.acc_lo[k]); np.fmax(self.acc_hi[k], hi, out=self.acc_hi[k])
+            self.acc_n[k] += 1
+            if self.acc_n[k] < self.fanout: break
+            lo = self.acc_lo[k].copy(); hi = self.acc_hi[k].copy(); t = self.acc_t[k]
+            self.pending[k].append((t, lo, hi)); self.records[k] += 1
+            self.acc_n[k] = 0; self.acc_lo[k] = np.inf; self.acc_hi[k] = -np.inf
+        self.count += 1
+        if self.count % self.flush_every == 0: self.flush()
+
+    def flush(self):
+        for k, recs in enumerate(self.pending):
+            if not recs: continue
+            arr = np.empty(len(recs), self.dtype)
+            arr["t"] = [r[0] for r in recs]; arr["lo"] = [r[1] for r in recs]; arr["hi"] = [r[2] for r in recs]
+            with open(os.path.join(self.dir, f"L{k}.bin"), "ab") as f: arr.tofile(f)
+            recs.clear()
+
+    def close(self):
+        """
+        Write the partial block of every level, then flush.
+        - each partial block is folded into the level above, so every level covers the whole session
+        - a level is only written while the one below holds more than one record (as build_from_csv)
+        """
+        for k in range(1, MAX_LEVELS):
+            if self.acc_n[k] and self.records[k - 1] > 1:
+                t = self.acc_t[k]; lo = self.acc_lo[k].copy(); hi = self.acc_hi[k].copy()
+                self.pending[k].append((t, lo, hi)); self.records[k] += 1
+                if k + 1 < MAX_LEVELS:
+                    if self.acc_n[k + 1] == 0: self.acc_t[k + 1] = t
+                    np.fmin(self.acc_lo[k + 1], lo, out=self.acc_lo[k + 1]); np.fmax(self.acc_hi[k + 1], hi, out=self.acc_hi[k + 1])
+                    self.acc_n[k + 1] += 1
+            self.acc_n[k] = 0; self.acc_lo[k] = np.inf; self.acc_hi[k] = -np.inf
+        self.flush()
+
+
+def build_from_csv(csv_path: str, directory: str = None, fanout: int = 8) -> "Pyramid":
+    """Whole pyramid from a flight CSV: np.minimum/maximum.reduceat per level."""
+    directory = directory or pyramid_path(csv_path)
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith(".bin"): os.remove(os.path.join(directory, name))
+    data = read_flight_csv(csv_path)
+    channels = [c for c in NUMERIC_FIELDS if c in data]
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"channels": channels, "fanout": fanout}, f)
+    dtype = level_dtype(len(channels))
+    t = data["t"]
+    lo = np.column_stack([data[c] for c in channels]).astype(np.float32) if len(t) else np.zeros((0, len(channels)), np.float32)
+    hi = lo
+    for k in range(MAX_LEVELS):
+        arr = np.empty(len(t), dtype); arr["t"] = t; arr["lo"] = lo; arr["hi"] = hi
+        arr.tofile(os.path.join(directory, f"L{k}.bin"))
+        if len(t) <= 1: break
+        idx = np.arange(0, len(t), fanout)
+        t = t[idx]
+        with np.errstate(invalid="ignore"):
+            lo = np.fmin.reduceat(lo, idx, axis=0); hi = np.fmax.reduceat(hi, idx, axis=0)
+    return Pyramid(directory)
+
+
+class Pyramid:
+    """Read side: memory-mapped levels, view queries bounded by a point budget."""
+    def __init__(self, directory: str):
+        self.dir = directory
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f: meta = json.load(f)
+        self.channels = meta["channels"]; self.fanout = meta["fanout"]
+        self.index = {c: i for i, c in enumerate(self.channels)}
+        self.dtype = level_dtype(len(self.channels))
+        self.reload()
+
+    def reload(self):
+        """Re-map the level files (they grow while recording)."""
+        self.levels = []
+        for k in range(MAX_LEVELS):
+            path = os.path.join(self.dir, f"L{k}.bin")
+            n = os.path.getsize(path) // self.dtype.itemsize if os.path.exists(path) else 0
+            if not n: break
+            self.levels.append(np.memmap(path, self.dtype, mode="r", shape=(n,)))
+
+    @property
+    def samples(self): return len(self.levels[0]) if self.levels else 0
+
+    def span(self):
+        if not self.levels: return 0.0, 0.0
+        return float(self.levels[0]["t"][0]), float(self.levels[0]["t"][-1])
+
+    def query(self, channel: str, t0: float, t1: float, max_points: int = 2000):
+        """(t, lo, hi) covering [t0, t1] from the finest level with at most max_points records in view."""
+        j = self.index[channel]
+        for level in self.levels:
+            ts = level["t"]
+            a = max(0, int(np.searchsorted(ts, t0, "right")) - 1)
+            b = min(len(ts), int(np.searchsorted(ts, t1, "left")) + 1)
+            if b - a <= max_points or level is self.levels[-1]: break
+        rec = level[a:b]
+        lo = np.asarray(rec["lo"][:, j]); hi = np.asarray(rec["hi"][:, j])
+        bad = ~np.isfinite(lo) | ~np.isfinite(hi)    # blocks with no valid sample
+        if bad.any(): lo = np.where(bad, np.nan, lo); hi = np.where(bad, np.nan, hi)
+        return np.asarray(rec["t"]), lo, hi
+
+    def is_current(self, csv_path: str) -> bool:
+        """True when the pyramid holds exactly the CSV's data rows."""
+        return self.samples == count_rows(csv_path)
+
+
+def open_pyramid(csv_path: str, fanout: int = 8, rebuild: bool = True) -> Pyramid:
+    """
+    Pyramid next to a flight CSV, (re)built from the CSV when missing or out of step.
+    - rebuild=False: read-only, as it is on disk (a writer still has the files open)
+    """
+    path = pyramid_path(csv_path)
+    if not rebuild: return Pyramid(path)
+    try:
+        pyr = Pyramid(path)
+        if pyr.is_current(csv_path): return pyr
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_from_csv(csv_path, path, fanout)
+
+
+def _last_t(path, dtype):
+    try:
+        n = os.path.getsize(path) // dtype.itemsize
+        if not n: return None
+        return float(np.memmap(path, dtype, mode="r", offset=(n - 1) * dtype.itemsize, shape=(1,))["t"][0])
+    except OSError:
+        return None
+
+
+def _f(v):
+    try: return float(v)
+    except (TypeError, ValueError): return np.nan
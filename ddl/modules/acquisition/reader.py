@@ -0,0 +1,53 @@
+import queue, threading
+import serial
+
+
+class SerialAcquisition:
+    """
+    Blocking serial read loop around an AcquisitionCore, without Qt.
+    - on_frame(line, data) runs in the reading thread for every non-empty line
+      (data is None for non-telemetry lines)
+    - write() is safe from any thread; pyserial allows a concurrent reader
+    """
+    def __init__(self, core, port: str, baudrate: int, timeout: float = 2.0, on_frame=None):
+        self.core = core
+        self.on_frame = on_frame
+        self.ser = serial.Serial()
+        self.ser.port = port; self.ser.baudrate = int(baudrate); self.ser.timeout = timeout
+        self._write_lock = threading.Lock()
+        self.controls = queue.Queue()   # callables applied between lines, in the read thread
+
+    def open(self):
+        self.ser.open()
+
+    def close(self):
+        try: self.ser.close()
+        except Exception: pass
+
+    @property
+    def is_open(self): return self.ser.is_open
+
+    def write(self, data: bytes):
+        with self._write_lock:
+            self.ser.write(data)
+
+    def run(self, stop):
+        """Read until `stop` (threading/multiprocessing Event) is set; SerialException propagates."""
+        core = self.core; on_frame = self.on_frame; ser = self.ser
+        while not stop.is_set():
+            self._apply_controls()
+            try:
+                frames = core.read(ser)
+            except serial.SerialException:
+                raise
+            except Exception as e:
+                core.recorder.exception(e); continue
+            if on_frame is None: continue
+            for line, data in frames:
+                if line is not None: on_frame(line, data)
+
+    def _apply_controls(self):
+        while True:
+            try: fn = self.controls.get_nowait()
+            except queue.Empty: return
+            fn(self.core)
@@ -0,0 +1,102 @@
+import os, csv
+from datetime import datetime
+
+from ddl.modules.acquisition.blackbox import BlackBoxLog
+from ddl.modules.acquisition.protocol import RX_TIME
+from ddl.modules.acquisition.flight_csv import SESSION_MARK
+
+
+class Recorder:
+    """
+    CSV + BlackBox writer, independent of Qt.
+    - CSV (Flight_<TEAM_ID>.csv) is appended, header only on a new file
+    - BlackBox keeps every raw line as `[timestamp] <monotonic rx>: <frame>` in rotated, compressed segments
+    - optional min/max pyramid (<csv name>.pyr) grown alongside the CSV for the flight viewer;
+      whoever owns the CSV calls catch_up_pyramid() before open_csv(), never during a session
+    - every open_csv() writes `# --- SESSION <id> ---`; the id is one per app run (handed to the acquisition
+      process, taken over by a resume), so reconnects stay in one session and a new run starts a new one
+    """
+    def __init__(self, logs_path: str, csv_file_path: str, csv_header, include_header: bool = True,
+                 blackbox: dict = None, pyramid: dict = None, session: str = None):
+        self.logs_path = logs_path
+        self.blackbox_dir = os.path.join(logs_path, "BlackBox")
+        self.blackbox = BlackBoxLog.from_config(self.blackbox_dir, blackbox)
+        self.csv_file_path = csv_file_path
+        self.csv_header = list(csv_header)
+        self.include_header = include_header
+        self.record_enabled = True
+        self.csv_file = None; self.csv_writer = None; self.csv_header_written = False
+        self.pyramid_cfg = pyramid or {}
+        self.pyramid = None
+        self.session = session or f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+
+    # CSV
+    def open_csv(self):
+        if not self.record_enabled or self.csv_file: return
+        new_file = not os.path.exists(self.csv_file_path)
+        self.csv_file = open(self.csv_file_path, "a", newline="", encoding="utf-8")
+        self.csv_writer = csv.writer(self.csv_file, delimiter=",")
+        if new_file and self.include_header:
+            self.csv_writer.writerow(self.csv_header); self.csv_header_written = True
+        self.csv_writer.writerow([f"{SESSION_MARK}{self.session} ---"])
+        if self.pyramid_cfg.get("enable"): self._open_pyramid()
+
+    def catch_up_pyramid(self):
+        """Rebuild the pyramid from the CSV if it is out of step; only while no writer has either open."""
+        if not self.pyramid_cfg.get("enable") or self.pyramid is not None or not os.path.exists(self.csv_file_path): return
+        from ddl.modules.acquisition.pyramid import open_pyramid
+        try: open_pyramid(self.csv_file_path, int(self.pyramid_cfg.get("fanout", 8)))
+        except Exception as e: print(f"[WARNING] PYRAMID - {e}")
+
+    def _open_pyramid(self):
+        from ddl.modules.acquisition.pyramid import PyramidWriter, pyramid_path
+        try:
+            self.pyramid = PyramidWriter(pyramid_path(self.csv_file_path), fanout=int(self.pyramid_cfg.get("fanout", 8)))
+        except Exception as e:
+            print(f"[WARNING] PYRAMID - {e}"); self.pyramid = None
+
+    def close_csv(self):
+        if self.csv_file:
+            try: self.csv_file.close()
+            except OSError: pass
+        if self.pyramid: self.pyramid.close(); self.pyramid = None
+        self.csv_file = None; self.csv_writer = None; self.csv_header_written = False
+
+    def write_row(self, data: dict):
+        if self.record_enabled and self.csv_writer:
+            self.csv_writer.writerow([data.get(h, "") for h in self.csv_header])
+            if self.pyramid: self.pyramid.append(data, data.get(RX_TIME))
+
+    # BlackBox
+    def open_blackbox(self):
+        """New segment on every (re)connect; the previous one is compressed in the background."""
+        self.blackbox.open()
+
+    def close_blackbox(self):
+        self.blackbox.close_segment()
+
+    def raw(self, line: str, t: float = None):
+        self.blackbox.write(line, t)
+
+    def exception(self, e):
+        try: self.blackbox.write_text("[EXCEPTION]: " + str(e))
+        except OSError: pass
+
+    # Session
+    def mark_clear(self):
+        """Clear All: start a new BlackBox segment, keep the CSV but write a separator."""
+        if self.blackbox.is_open: self.blackbox.open()
+        if self.record_enabled and self.csv_writer:
+            try: self.csv_writer.writerow(["# --- CLEAR ALL ---"])
+            except OSError: pass
+
+    def flush(self):
+        try:
+            if self.csv_file: self.csv_file.flush()
+            if self.pyramid: self.pyramid.flush()
+            self.blackbox.flush()
+        except OSError: pass
+
+    def close(self):
+        """Close everything and wait for pending BlackBox compression."""
+        self.close_csv(); self.blackbox.close(wait=True)
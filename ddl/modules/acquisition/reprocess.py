@@ -0,0 +1,180 @@
+"""
+Rebuild clean recordings from the BlackBox raw log.
+
+    python -m ddl.modules.acquisition.reprocess --out ./saves/reprocessed
+    python -m ddl.modules.acquisition.reprocess saves/BlackBox/flight_data_000012.txt.gz --workers 4
+
+Plain segments are split into byte ranges at line boundaries, compressed segments
+are one task each. Tasks are parsed in a process pool by the live AcquisitionCore
+(same filter, checksum/resync and binary decoding as on air), merged back in order
+and written as a CSV (telemetry.csv.header) plus a columnar .npz.
+"""
+import os, re, csv, sys, time, argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from ddl.modules.acquisition.protocol import PacketCounter
+from ddl.modules.acquisition.core import AcquisitionCore
+from ddl.modules.acquisition.binary import BinaryCodec, FRAMINGS
+from ddl.modules.acquisition.blackbox import COMPRESSORS, open_segment
+from ddl.modules.acquisition.flight_csv import TEXT_FIELDS
+
+_SEGMENT = re.compile(r"^flight_data(?:_(\d{6}))?\.txt(\.gz|\.xz)?$")
+
+
+class _Sink:
+    """Recorder stand-in: the core only reports parsed rows back to the task."""
+    def __init__(self): self.rows = []
+    def raw(self, line, t=None): pass
+    def write_row(self, data): self.rows.append(data)
+    def mark_clear(self): pass
+
+
+def blackbox_files(directory: str):
+    """Legacy flight_data.txt first, then numbered segments in order."""
+    found = []
+    for name in os.listdir(directory):
+        m = _SEGMENT.match(name)
+        if m: found.append((int(m.group(1) or 0), os.path.join(directory, name)))
+    return [p for _, p in sorted(found)]
+
+
+def plan_tasks(paths, chunk_bytes: int):
+    """(path, start, end) ranges; plain files are cut just after a newline, compressed ones are whole."""
+    tasks = []
+    for path in paths:
+        if any(ext and path.endswith(ext) for _, ext in COMPRESSORS.values()):
+            tasks.append((path, 0, -1)); continue
+        size = os.path.getsize(path)
+        cuts = [0]
+        with open(path, "rb") as f:
+            pos = chunk_bytes
+            while pos < size:
+                f.seek(pos); f.readline()
+                nxt = f.tell()
+                if nxt >= size: break
+                cuts.append(nxt); pos = nxt + chunk_bytes
+        cuts.append(size)
+        tasks += [(path, a, b) for a, b in zip(cuts, cuts[1:]) if b > a]
+    return tasks
+
+
+def _lines(path, start, end):
+    if end < 0:
+        with open_segment(path) as f:
+            yield from f
+        return
+    with open(path, "rb") as f:
+        f.seek(start)
+        for raw in f.read(end - start).split(b"\n"):
+            yield raw.decode("utf-8", errors="ignore")
+
+
+def parse_task(task, connection: dict, team_id: str, header, framing: str):
+    """Worker: one byte range -> (rows, wall times, rx times, stats)."""
+    path, start, end = task
+    sink = _Sink()
+    core = AcquisitionCore.from_config(sink, connection, team_id)
+    if core.codec is None and framing: core.codec = BinaryCodec(framing)
+    rows = []; walls = []; rxs = []
+    lines = text = 0
+    for line in _lines(path, start, end):
+        line = line.rstrip("\r\n")
+        close = line.find("]")
+        if not line.startswith("[") or close < 0: continue
+        wall = line[1:close]
+        if wall == "EXCEPTION": continue
+        rest = line[close + 1:]
+        if rest.startswith(": "):
+            rx = np.nan; frame = rest[2:]
+        else:
+            sep = rest.find(": ")
+            if sep < 0: continue
+            try: rx = float(rest[1:sep])
+            except ValueError: rx = np.nan
+            frame = rest[sep + 2:]
+        lines += 1
+        n = len(sink.rows)
+        if frame.startswith("BIN:"):
+            try: core.handle_frame(bytes.fromhex(frame[4:]), rx)
+            except ValueError: core.codec.corrupt += 1
+        else:
+            core.handle(frame.encode("utf-8"), rx)
+        new = sink.rows[n:]
+        if not new: text += 1
+        for data in new:
+            rows.append([data.get(h, "") for h in header]); walls.append(wall); rxs.append(rx)
+        sink.rows.clear()
+    return rows, walls, rxs, {"lines": lines, "packets": len(rows), "corrupt": core.corrupt, "text": text}
+
+
+def _parse_star(args): return parse_task(*args)
+
+
+def reprocess(paths, out_dir: str, name: str, connection: dict, team_id: str, header,
+              workers: int = None, chunk_mb: float = 8.0, framing: str = "", log=print):
+    """Parse `paths` in parallel and write <name>.csv + <name>.npz; returns the merged stats."""
+    os.makedirs(out_dir, exist_ok=True)
+    header = list(header)
+    tasks = plan_tasks(paths, max(1, int(chunk_mb * 1024 * 1024)))
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    columns = {h: [] for h in header}; walls = []; rxs = []
+    stats = {"lines": 0, "packets": 0, "corrupt": 0, "text": 0}
+    counter = PacketCounter()
+    csv_path = os.path.join(out_dir, f"{name}.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f, ProcessPoolExecutor(workers) as pool:
+        w = csv.writer(f); w.writerow(header)
+        jobs = [(t, connection, team_id, header, framing) for t in tasks]
+        for rows, wall, rx, st in pool.map(_parse_star, jobs):      # results come back in task order
+            w.writerows(rows)
+            for h, col in zip(header, zip(*rows) if rows else [()] * len(header)): columns[h] += col
+            walls += wall; rxs += rx
+            for k in stats: stats[k] += st[k]
+    for pkt in columns.get("PACKET_COUNT", ()): counter.count({"PACKET_COUNT": pkt})   # sequential across task borders
+    arrays = {"WALL_TIME": np.array(walls, dtype=str), "RX_TIME": np.array(rxs, dtype=float)}
+    for h, col in columns.items():
+        if h in TEXT_FIELDS: arrays[h] = np.array(col, dtype=str); continue
+        try: arrays[h] = np.array(col, dtype=float)
+        except ValueError: arrays[h] = np.array([_float(v) for v in col])
+    np.savez(os.path.join(out_dir, f"{name}.npz"), **arrays)
+    stats.update(received=counter.received, lost=counter.lost, tasks=len(tasks), workers=workers,
+                 seconds=time.perf_counter() - start, csv=csv_path)
+    log(f"(OK) {stats['packets']} packets from {stats['lines']} lines in {len(tasks)} tasks / {workers} workers"
+        f" | lost {counter.lost} | corrupt {stats['corrupt']} | {stats['seconds']:.2f} s -> {csv_path}")
+    return stats
+
+
+def _float(v):
+    try: return float(v)
+    except (TypeError, ValueError): return np.nan
+
+
+def main(argv=None):
+    from ddl.modules.managers.configuration_manager import ConfigManager as cfg
+    ap = argparse.ArgumentParser(prog="python -m ddl.modules.acquisition.reprocess",
+                                 description="Rebuild CSV + columnar recordings from BlackBox raw logs.")
+    ap.add_argument("files", nargs="*", help="BlackBox files (default: every segment in --blackbox)")
+    ap.add_argument("--blackbox", default=os.path.join(cfg.get("application.settings.logs_folder"), "BlackBox"))
+    ap.add_argument("--out", default=os.path.join(cfg.get("application.settings.logs_folder"), "reprocessed"))
+    ap.add_argument("--team-id", default=str(cfg.get("application.settings.team_id")))
+    ap.add_argument("--workers", type=int, default=0, help="processes (default: CPU count)")
+    ap.add_argument("--chunk-mb", type=float, default=8.0, help="byte range per task for plain segments")
+    ap.add_argument("--protocol", choices=["ascii", *FRAMINGS], help="overrides connection.protocol")
+    ap.add_argument("--integrity", choices=["none", "crc16", "xor"], help="overrides connection.integrity.mode")
+    args = ap.parse_args(argv)
+
+    connection = dict(cfg.get("connection") or {})
+    if args.protocol: connection["protocol"] = args.protocol
+    if args.integrity: connection["integrity"] = dict(connection.get("integrity") or {}, mode=args.integrity)
+    framing = connection.get("protocol") if connection.get("protocol") in FRAMINGS else "cobs"
+    paths = args.files or blackbox_files(args.blackbox)
+    if not paths:
+        print(f"[-] No BlackBox files found in {args.blackbox}"); return 1
+    reprocess(paths, args.out, f"Reprocessed_{args.team_id}", connection, args.team_id,
+              cfg.get("telemetry.csv.header"), args.workers or None, args.chunk_mb, framing)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
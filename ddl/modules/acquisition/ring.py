@@ -0,0 +1,90 @@
+import struct
+from multiprocessing import shared_memory
+
+# header: write_seq, slots, slot_bytes
+_HDR = struct.Struct("<QII")
+_HDR_BYTES = 64
+# slot: seq, kind, received, lost, corrupt, resynced, monotonic receive time, payload length
+_SLOT = struct.Struct("<QBIIIIdH")
+
+KIND_PACKET = 1   # telemetry frame (payload = cleaned line)
+KIND_TEXT   = 2   # non-telemetry line / status message for the terminal
+
+
+class PacketRing:
+    """
+    Single-writer shared-memory ring of framed records with sequence numbers.
+    - the writer never blocks: when the reader falls behind, the oldest slots are overwritten
+    - the reader detects skipped or torn slots from their sequence numbers and counts them in `overruns`
+    - create() in the owner (GUI), attach(name) in the acquisition process
+    """
+    def __init__(self, shm, owner: bool):
+        self.shm = shm; self.owner = owner
+        self.buf = shm.buf
+        _, self.slots, self.slot_bytes = _HDR.unpack_from(self.buf, 0)
+        self.max_payload = self.slot_bytes - _SLOT.size
+        self.next_seq = 1      # reader cursor
+        self.overruns = 0      # records the reader never saw
+        self._seq = 0          # writer cursor
+
+    @classmethod
+    def create(cls, slots: int = 4096, slot_bytes: int = 1024):
+        shm = shared_memory.SharedMemory(create=True, size=_HDR_BYTES + slots * slot_bytes)
+        _HDR.pack_into(shm.buf, 0, 0, slots, slot_bytes)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str):
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self): return self.shm.name
+
+    @property
+    def write_seq(self): return _HDR.unpack_from(self.buf, 0)[0]
+
+    # WRITER
+    def write(self, kind: int, payload: bytes, received: int = 0, lost: int = 0, corrupt: int = 0, resynced: int = 0,
+              rx: float = 0.0):
+        seq = self._seq + 1
+        payload = payload[:self.max_payload]
+        off = _HDR_BYTES + ((seq - 1) % self.slots) * self.slot_bytes
+        buf = self.buf
+        _SLOT.pack_into(buf, off, 0, kind, received, lost, corrupt, resynced, rx, len(payload))   # invalidate while writing
+        start = off + _SLOT.size
+        buf[start:start + len(payload)] = payload
+        struct.pack_into("<Q", buf, off, seq)
+        struct.pack_into("<Q", buf, 0, seq)
+        self._seq = seq
+
+    # READER
+    def read(self, max_items: int = 0):
+        """New records since the last call as (seq, kind, received, lost, corrupt, resynced, rx, payload)."""
+        w = self.write_seq
+        nxt = self.next_seq
+        if nxt > w: return []
+        oldest = w - self.slots + 1
+        if nxt < oldest:
+            self.overruns += oldest - nxt; nxt = oldest
+        if max_items: w = min(w, nxt + max_items - 1)
+        out = []; buf = self.buf
+        for seq in range(nxt, w + 1):
+            off = _HDR_BYTES + ((seq - 1) % self.slots) * self.slot_bytes
+            s1, kind, received, lost, corrupt, resynced, rx, n = _SLOT.unpack_from(buf, off)
+            if s1 != seq:
+                self.overruns += 1; continue
+            start = off + _SLOT.size
+            payload = bytes(buf[start:start + n])
+            if struct.unpack_from("<Q", buf, off)[0] != seq:   # lapped while copying
+                self.overruns += 1; continue
+            out.append((seq, kind, received, lost, corrupt, resynced, rx, payload))
+        self.next_seq = w + 1
+        return out
+
+    def close(self):
+        self.buf = None
+        try: self.shm.close()
+        except (BufferError, OSError): pass
+        if self.owner:
+            try: self.shm.unlink()
+            except (FileNotFoundError, OSError): pass
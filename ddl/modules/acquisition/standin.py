@@ -0,0 +1,83 @@
+"""
+Flight-computer stand-in: writes synthetic telemetry to a serial port (or a pty
+it creates) in any supported protocol, for bench tests of the ground station.
+
+    python -m ddl.modules.acquisition.standin --port /dev/ttyUSB1 --protocol cobs --rate 10
+    python -m ddl.modules.acquisition.standin --pty --protocol slip
+    python -m ddl.modules.acquisition.standin --port COM7 --protocol ascii --checksum crc16
+"""
+import os, sys, math, time, argparse
+import serial
+
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+from ddl.modules.acquisition.integrity import FrameChecker
+from ddl.modules.acquisition.binary import BinaryCodec, FRAMINGS, _hms
+
+
+def synthetic_packet(n: int, team_id: str = "1043", t0: float = 0.0) -> dict:
+    """Packet n of a smooth fake flight (strings, as parse_frame produces them)."""
+    t = t0 + n
+    alt = max(0.0, 700.0 * math.sin(min(math.pi, n / 120.0 * math.pi)))
+    return {
+        "TEAM_ID": team_id, "MISSION_TIME": _hms(t), "PACKET_COUNT": str(n), "MODE": "F",
+        "STATE": "ASCENT" if n < 60 else ("DESCENT" if n < 120 else "LANDED"),
+        "ALTITUDE": f"{alt:.1f}", "TEMPERATURE": f"{25 - alt / 150:.1f}",
+        "PRESSURE": f"{101.3 * math.exp(-alt / 8400):.1f}", "VOLTAGE": f"{8.4 - n * 0.001:.2f}",
+        "GYRO_R": f"{math.sin(n / 5):.2f}", "GYRO_P": f"{math.cos(n / 7):.2f}", "GYRO_Y": f"{math.sin(n / 11):.2f}",
+        "ACCEL_R": "0.00", "ACCEL_P": "0.00", "ACCEL_Y": "9.81",
+        "MAG_R": "0.20", "MAG_P": "0.00", "MAG_Y": "0.40", "AUTO_GYRO_ROTATION_RATE": f"{alt / 10:.1f}",
+        "GPS_TIME": _hms(t), "GPS_ALTITUDE": f"{alt:.1f}",
+        "GPS_LATITUDE": f"{13.7563 + n * 1e-5:.7f}", "GPS_LONGITUDE": f"{100.5018 + n * 1e-5:.7f}",
+        "GPS_SATS": "8", "CMD_ECHO": "CXON",
+    }
+
+
+def frame_bytes(d: dict, codec=None, checker=None) -> bytes:
+    """Wire bytes for one packet in the selected protocol."""
+    if codec is not None: return codec.encode(d)
+    line = ",".join(d[k] for k in REQUIRED_FIELDS)
+    if checker is not None: line = checker.seal(line)
+    return (line + "\r\n").encode("ascii")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m ddl.modules.acquisition.standin",
+                                 description="Send synthetic telemetry frames over serial.")
+    ap.add_argument("--port", help="serial port to write to")
+    ap.add_argument("--pty", action="store_true", help="create a pseudo-terminal and print its path (POSIX)")
+    ap.add_argument("--baud", type=int, default=115200)
+    ap.add_argument("--protocol", default="ascii", choices=["ascii", *FRAMINGS])
+    ap.add_argument("--checksum", default="none", help="ascii only: none | crc16 | xor")
+    ap.add_argument("--rate", type=float, default=1.0, help="packets per second")
+    ap.add_argument("--count", type=int, default=0, help="stop after N packets (0 = forever)")
+    ap.add_argument("--team-id", default="1043")
+    args = ap.parse_args(argv)
+    if not args.port and not args.pty:
+        ap.error("--port or --pty is required")
+
+    codec = BinaryCodec.from_config(args.protocol)
+    checker = None if codec else FrameChecker.from_config({"mode": args.checksum}, args.team_id)
+    if args.pty:
+        import pty
+        master, slave = pty.openpty()
+        print(os.ttyname(slave), flush=True)
+        write = lambda b: os.write(master, b)
+    else:
+        ser = serial.Serial(args.port, args.baud)
+        write = ser.write
+
+    period = 1.0 / args.rate if args.rate > 0 else 0.0
+    n = 0; t0 = time.time() % 86400; nxt = time.monotonic()
+    try:
+        while not args.count or n < args.count:
+            n += 1
+            write(frame_bytes(synthetic_packet(n, args.team_id, t0), codec, checker))
+            nxt += period
+            time.sleep(max(0.0, nxt - time.monotonic()))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
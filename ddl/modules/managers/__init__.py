@@ -1,7 +1,19 @@
 # ddl/modules/managers/__init__.py
-from .configuration_manager import ConfigManager
-from .window_manager import WindowManager
-from .terminal_manager import TerminalManager
-from .serial_manager import SerialManager
-from .graph_manager import GraphManager
-from .button_manager import ButtonManager
+# Lazy re-exports: importing configuration_manager alone must not pull in Qt.
+_EXPORTS = {
+    "ConfigManager":   "configuration_manager",
+    "WindowManager":   "window_manager",
+    "TerminalManager": "terminal_manager",
+    "SerialManager":   "serial_manager",
+    "GraphManager":    "graph_manager",
+    "ButtonManager":   "button_manager",
+    "AlarmManager":    "alarm_manager",
+    "DiagnosticsManager": "diagnostics_manager",
+    "TelemetryBus":    "telemetry_bus",
+}
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,73 @@
+import time
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer
+
+from ddl.modules.utility.alarms import RuleEngine
+
+
+class AlarmManager(QObject):
+    """
+    Runs the alarm rules off the per-packet path:
+    - attach(bus): a batched bus subscription hands over the rows received in the last
+      alarms.eval_ms; rules read them as column views of the telemetry store (no per-packet queue)
+    - raised/cleared alarms are reported on the terminal and status bar; a timer checks link silence
+    - disabled entirely when connection.alarm is false (no subscription)
+    """
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent; self.terminal = parent.terminal; self.config = parent.config
+        self.enabled = bool(self.config.get("connection.alarm", True))
+        self.engine = RuleEngine(self.config.get("alarms.rules") or [],
+                                 self.config.get("telemetry.state_allowlist") or [])
+        self.eval_ms = int(self.config.get("alarms.eval_ms", 200))
+        self.sub = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.eval_ms)
+        self.timer.timeout.connect(self.tick)
+
+    # PUBLIC
+    def attach(self, bus):
+        if not (self.enabled and self.engine.rules): return
+        self.bus = bus
+        self.sub = bus.subscribe(self.evaluate, interval_ms=self.eval_ms, name="alarms")
+        self.timer.start()
+
+    def clear(self):
+        self.engine.reset()
+
+    def evaluate(self, update):
+        """Rows of one batched bus delivery."""
+        n = len(update)
+        def cols(field, text=False):
+            v = update.view(field)
+            if v is None: return np.full(n, "", dtype=object) if text else np.full(n, np.nan)
+            if (v.dtype == object) != text: return v.astype(str).astype(object) if text else np.full(n, np.nan)
+            return v
+        try:
+            alerts = self.engine.evaluate_columns(cols, n)
+        except Exception as e:
+            print(f"[WARNING] ALARMS - {e}"); return
+        for a in alerts: self._report(a)
+
+    def tick(self):
+        self.bus.flush(self.sub)    # rows received since the last batch count as link activity
+        try: alerts = self.engine.tick(time.monotonic())
+        except Exception as e:
+            print(f"[WARNING] ALARMS - {e}"); return
+        for a in alerts: self._report(a)
+
+    def report(self):
+        """Terminal lines for /alarms."""
+        lines = [f"(OK) Alarms: {'ON' if self.enabled else 'OFF (connection.alarm)'} | {len(self.engine.rules)} rules"]
+        for r in self.engine.rules:
+            lines.append(f" - {r.id} [{type(r).__name__}] {'ACTIVE' if getattr(r, 'active', False) else 'ok'}")
+        return lines
+
+    def _report(self, a):
+        if a.active:
+            self.terminal.write(f"(!) [ALARM {a.severity.upper()}] {a.rule}: {a.message}")
+            self.parent.update_status_bar(f"// ALARM {a.rule}: {a.message}")
+        else:
+            self.terminal.write(f"(OK) [ALARM CLEARED] {a.rule}: {a.message}")
+            active = self.engine.active()
+            self.parent.update_status_bar(f"// ALARM {active[0].id} still active" if active else "// alarms clear")
@@ -9,19 +9,28 @@ _DEFAULTS = {
             "logs_folder": "./saves",
             "on_start_maximized": True,
             "on_start_port_update": True,
-            "team_id": "1043"
+            "team_id": "1043",
+            "terminal_backlog": 5000,
+            "resume_on_start": False,
+            "search": { "enable": True, "path": "", "flush_ms": 500, "max_queue": 100000, "max_rows": 2000000, "max_days": 30 }
         }
     },
     "version": { "version": "0.0.1", "status": "BETA" },
     "connection": {
         "alarm": True,
         "filter_character": "",
+        "protocol": "ascii",
         "time_out": 2,
         "bauds_default": "115200",
-        "bauds_dic": { "115200": 115200 }
+        "bauds_dic": { "115200": 115200 },
+        "acquisition_process": { "enable": False, "poll_ms": 20, "ring_slots": 4096, "slot_bytes": 1024 },
+        "integrity": { "mode": "none", "start_marker": "", "resync": True }
     },
     "telemetry": {
         "rate_hz": 1,
+        "blackbox": { "segment_mb": 16, "segment_minutes": 60, "compression": "gzip", "max_total_mb": 2048, "max_segments": 0 },
+        "pyramid": { "enable": True, "fanout": 8 },
+        "attitude": { "enable": False, "batch_ms": 100, "tau_s": 2.0, "gyro_units": "deg/s", "accel_1g": 9.80665, "accel_gate": 0.25, "use_mag": True, "max_dt_s": 1.0 },
         "csv": {
             "enable": True,
             "filename_pattern": "Flight_${TEAM_ID}.csv",
@@ -36,9 +45,40 @@ _DEFAULTS = {
                 "GPS_TIME","GPS_ALTITUDE","GPS_LATITUDE","GPS_LONGITUDE","GPS_SATS",
                 "CMD_ECHO"
             ]
-        }
+        },
+        "state_allowlist": ["LAUNCH_PAD","ASCENT","APOGEE","DESCENT","PROBE_RELEASE","PAYLOAD_RELEASE","LANDED"]
     },
-    "graphs": { "default_update_time": 1.0, "settings": { "antialias": True, "opengl": False, "cupy": True, "numba": True, "segmentedLineMode": "off" } },
+    "graphs": { "default_update_time": 1.0, "render_profile_path": "./saves/render_profile.json", "settings": { "antialias": True, "opengl": False, "cupy": True, "numba": True, "segmentedLineMode": "off" },
+                "gps": { "simplify_tolerance_m": 2.0, "min_span_m": 50.0,
+                         "tiles": { "path": "", "cache_tiles": 128, "budget_ms": 8.0, "opacity": 1.0 } },
+                "landing": { "enable": True, "tau_s": 20.0, "min_descent_mps": 1.0, "confidence": 0.95, "ground_altitude_m": None,
+                             "states": ["DESCENT", "PROBE_RELEASE", "PAYLOAD_RELEASE"] },
+                "compare": { "event": "launch", "dt": 0.1, "panels": ["altitude", "voltage", "accel", "gyro"] },
+                "stats": { "window_s": 10.0, "refresh_ms": 500 },
+                "panels": [
+                    { "id": "altitude", "title": "Altitude", "type": "mono", "fields": ["ALTITUDE"], "units": "m", "colors": ["#0A5"], "row": 0, "visible": True },
+                    { "id": "voltage", "title": "Battery Voltage", "type": "mono", "fields": ["VOLTAGE"], "units": "V", "colors": ["#0A5"], "row": 0, "visible": True },
+                    { "id": "accel", "title": "Accel (R/P/Y)", "type": "rpy", "fields": ["ACCEL_R", "ACCEL_P", "ACCEL_Y"], "units": "", "colors": ["#0A5", "#06C", "#C60"], "row": 1, "visible": True },
+                    { "id": "gyro", "title": "Gyro (R/P/Y)", "type": "rpy", "fields": ["GYRO_R", "GYRO_P", "GYRO_Y"], "units": "", "colors": ["#0A5", "#06C", "#C60"], "row": 1, "visible": True },
+                    { "id": "gps", "title": "GPS Track", "type": "gps", "fields": ["GPS_LATITUDE", "GPS_LONGITUDE"], "units": "E/N m", "colors": ["#222"], "row": 2, "visible": True },
+                    { "id": "temperature", "title": "Temperature", "type": "mono", "fields": ["TEMPERATURE"], "units": "°C", "colors": ["#C60"], "row": 3, "visible": False },
+                    { "id": "pressure", "title": "Pressure", "type": "mono", "fields": ["PRESSURE"], "units": "kPa", "colors": ["#06C"], "row": 3, "visible": False },
+                    { "id": "mag", "title": "Mag (R/P/Y)", "type": "rpy", "fields": ["MAG_R", "MAG_P", "MAG_Y"], "units": "", "colors": ["#0A5", "#06C", "#C60"], "row": 4, "visible": False },
+                    { "id": "rotor", "title": "Auto-Gyro Rotation Rate", "type": "mono", "fields": ["AUTO_GYRO_ROTATION_RATE"], "units": "rpm", "colors": ["#606"], "row": 4, "visible": False },
+                    { "id": "attitude", "title": "Attitude (Roll/Pitch/Yaw)", "type": "rpy", "fields": ["ATT_ROLL", "ATT_PITCH", "ATT_YAW"], "units": "deg", "colors": ["#0A5", "#06C", "#C60"], "row": 5, "visible": False },
+                    { "id": "tilt", "title": "Tilt", "type": "mono", "fields": ["ATT_TILT"], "units": "deg", "colors": ["#A0A"], "row": 5, "visible": False },
+                    { "id": "vibration_gyro", "title": "Gyro spectrum", "type": "spectrum", "fields": ["GYRO_R", "GYRO_P", "GYRO_Y"], "nfft": 64, "hop": 8, "lines": 200,
+                      "rate_hz": None, "range_db": 60.0, "marker_field": "AUTO_GYRO_ROTATION_RATE", "marker_scale": 0.016667, "row": 6, "visible": False },
+                    { "id": "vibration_accel", "title": "Accel spectrum", "type": "spectrum", "fields": ["ACCEL_R", "ACCEL_P", "ACCEL_Y"], "nfft": 64, "hop": 8, "lines": 200,
+                      "rate_hz": None, "range_db": 60.0, "marker_field": "AUTO_GYRO_ROTATION_RATE", "marker_scale": 0.016667, "row": 6, "visible": False }
+                ] },
+    "alarms": { "eval_ms": 200, "rules": [
+            { "id": "low_voltage", "type": "threshold", "field": "VOLTAGE", "below": 7.0, "hysteresis": 0.2, "debounce": 3, "severity": "critical" },
+            { "id": "gps_dropout", "type": "threshold", "field": "GPS_SATS", "below": 4, "hysteresis": 1, "debounce": 3 },
+            { "id": "fast_descent", "type": "rate", "field": "ALTITUDE", "below": -20.0, "hysteresis": 2.0, "debounce": 3 },
+            { "id": "state_order", "type": "state", "field": "STATE", "severity": "critical" },
+            { "id": "link_silence", "type": "silence", "seconds": 5 }
+        ] },
     "simulation": { "enabled": True, "csv_profile_path": "./sim/pressure_profile.csv", "csv_column": "pressure_pa", "tx_interval_s": 1.0 }
 }
 
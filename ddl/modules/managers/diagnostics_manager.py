@@ -0,0 +1,101 @@
+import os, time
+from PyQt5.QtCore import QObject, QTimer
+
+from ddl.modules.utility import profiling
+
+
+class DiagnosticsManager(QObject):
+    """
+    /profile.start, /profile.stop, /mem.snapshot on a running session.
+    - profiling covers the GUI thread and every worker loop calling profiling.thread_hook()
+      (serial/dummy reader, search indexer); the acquisition process is not included
+    - stop waits up to `detach_s` for workers to leave the session, then writes
+      <logs>/diagnostics/profile_*.pstats + .txt
+    - snapshots write <logs>/diagnostics/mem_*.txt with a per-component breakdown
+      and tracemalloc allocation sites / growth since the previous snapshot
+    """
+    def __init__(self, parent, detach_s: float = 3.0):
+        super().__init__(parent)
+        self.parent = parent; self.terminal = parent.terminal
+        self.dir = os.path.join(parent.config.get("application.settings.logs_folder") or "./saves", "diagnostics")
+        self.detach_s = detach_s
+        self.session = None; self.last_snapshot = None
+        self.timer = QTimer(self); self.timer.setInterval(100); self.timer.timeout.connect(self._poll_stop)
+
+    # PUBLIC
+    def start_profile(self):
+        if self.session is not None:
+            self.terminal.write("(!) Profiler already running - /profile.stop"); return
+        self.session = profiling.ProfileSession.start()
+        self.terminal.write("(OK) Profiler started (GUI + worker threads)")
+
+    def stop_profile(self):
+        if self.session is None or self.timer.isActive():
+            self.terminal.write("(!) Profiler not running - /profile.start"); return
+        self.session.stop()
+        self._deadline = time.monotonic() + self.detach_s
+        self.timer.start()
+
+    def memory_snapshot(self):
+        text, self.last_snapshot = profiling.snapshot_report(self.components(), self.last_snapshot)
+        os.makedirs(self.dir, exist_ok=True)
+        path = os.path.join(self.dir, time.strftime("mem_%Y%m%d_%H%M%S.txt"))
+        with open(path, "w", encoding="utf-8") as f: f.write(text)
+        for line in text.split("\n==== ")[1].splitlines()[1:]:
+            if line.strip(): self.terminal.write(f"[MEM] {line}")
+        self.terminal.write(f"(OK) Memory report: {path}")
+
+    def components(self):
+        """name -> (bytes, detail) for the station's own buffers and caches."""
+        p = self.parent; out = {}
+        for panel in p.graph_manager.panels.panels.values():
+            w = panel.widget
+            if w is None: continue
+            if panel.type == "spectrum":
+                out[f"plot {panel.id}"] = (w.nbytes, f"{w.filled}/{w.lines} lines x {w.bins} bins, {w.buf.shape[1]} samples windowed")
+            elif getattr(w, "store", None) is not None:
+                out[f"plot {panel.id}"] = (0, f"{len(w.store)} points, views of the telemetry store")
+            else:
+                ys = w.y if panel.type != "rpy" else [v for axis in w.y for v in axis]
+                stored = profiling.list_bytes(w.x) + profiling.list_bytes(ys)
+                drawn = sum(profiling.array_bytes(getattr(c, "xData", None), getattr(c, "yData", None)) for c in w.listDataItems())
+                out[f"plot {panel.id}"] = (stored + drawn, f"{len(w.x)} points, {drawn / 1e6:.2f} MB in curve arrays")
+            tiles = getattr(w, "tiles", None)
+            if tiles is not None:
+                c = tiles.cache
+                out[f"map tiles {panel.id}"] = (c.nbytes, f"{len(c)}/{c.max_tiles} tiles, {c.hits} hits / {c.misses} misses")
+        if hasattr(p.ui, "terminal"):
+            doc = p.ui.terminal.document()
+            chars = doc.characterCount()
+            out["terminal document"] = (chars * 2, f"{doc.blockCount()} blocks, {chars} chars (text only)")
+        term = p.terminal
+        out["terminal backlog"] = (profiling.list_bytes(term.backlog), f"{len(term.backlog)} lines while hidden")
+        if term.search is not None:
+            out["search queue"] = (term.search.queue.qsize() * 200, f"{term.search.queue.qsize()} lines not yet indexed, "
+                                                                    f"{term.search.indexed} indexed")
+        timing = p.graph_manager.timing
+        out["link timing window"] = (sum(profiling.list_bytes(d) for d in (timing.intervals, timing.latencies, timing.clock)),
+                                     f"{len(timing.intervals)} intervals")
+        bus = p.bus; store = bus.store
+        out["telemetry store"] = (store.nbytes, f"{len(store)} rows x {len(store.cols)} channels (capacity {store.cap}), "
+                                                f"{len(bus.subs)} subscribers")
+        pyr = p.serial.recorder.pyramid
+        if pyr is not None:
+            recs = sum(len(level) for level in pyr.pending)
+            out["pyramid write buffer"] = (recs * pyr.dtype.itemsize, f"{recs} records")
+        viewers = [v for v in getattr(p.graph_manager, "viewers", []) if v.isVisible() and hasattr(v, "curves")]
+        if viewers:
+            out["flight viewers"] = (sum(sum(profiling.array_bytes(c.xData, c.yData) for _, c, _ in v.curves) for v in viewers),
+                                     f"{len(viewers)} open (levels are memory-mapped)")
+        return out
+
+    def _poll_stop(self):
+        s = self.session
+        if s.pending() and time.monotonic() < self._deadline: return
+        self.timer.stop(); self.session = None
+        try:
+            stats, text = s.write(self.dir)
+        except Exception as e:
+            self.terminal.write(f"[-] Profiler report failed - {e}"); return
+        if s.profiles: self.terminal.write(f"(!) Not profiled (idle): {', '.join(s.pending())}")
+        self.terminal.write(f"(OK) Profile saved: {stats} | report: {text}")
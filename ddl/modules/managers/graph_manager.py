@@ -1,7 +1,13 @@
+import sys, time
+import numpy as np
 import pyqtgraph as pg
-from PyQt5.QtCore import QObject, QDateTime
+from PyQt5.QtCore import QObject, QProcess
 from PyQt5.QtGui import QPainter
-from ddl.modules.utility import MonoAxisPlotWidget, RPYPlotWidget, GpsPlotWidget
+from ddl.modules.utility import LastTelemetryModel, LinkTiming, VisibilityWatch
+from ddl.modules.utility.panels import PanelRegistry
+from ddl.modules.utility.landing import LandingPredictor
+from ddl.modules.acquisition import REQUIRED_FIELDS, RX_TIME
+from ddl.modules.acquisition.attitude import AttitudeFilter, GYRO, ACCEL, MAG
 
 class GraphManager(QObject):
     def __init__(self, parent):
@@ -9,80 +15,239 @@ class GraphManager(QObject):
         self.parent = parent
         self.config = parent.config
         self.ui = parent.ui
-        self._set_config(); self._set_layout(); self._set_graphs()
-        self.last_update_time = QDateTime.currentDateTime()
-        self.total_time = 0.0  # seconds since start (mission-time axis)
+        self.bus = parent.bus   # session history lives in bus.store; mono/rpy plots draw from its views
+        self._set_config(); self._set_layout(); self._set_graphs(); self._set_table()
+        self.timing = LinkTiming()
+        self.total_time = 0.0  # seconds since start (mission-time axis, bus.store "t")
         self._last_state = None
         self._landed_popup_done = False
-        self._last_data_cache = {}
+        self.landing = LandingPredictor.from_config(self.config.get("graphs.landing"))
+        # ATT_* (telemetry.attitude): batched bus consumer, off the reader path; display only, not recorded
+        att_cfg = self.config.get("telemetry.attitude") or {}
+        self.attitude = AttitudeFilter.from_config(att_cfg)
+        if self.attitude is not None:
+            self.bus.subscribe(self._derive_attitude, GYRO + ACCEL + MAG, int(att_cfg.get("batch_ms", 100)), name="attitude")
+        # hidden window / plot area: packets are stored, labels and plots drawn once when shown again
+        self._deferred = None
+        self.window_view = VisibilityWatch(self.parent, self)
+        self.window_view.changed.connect(self._on_window_visibility)
+        self.view = VisibilityWatch(self.layout, self)
+        self.view.changed.connect(self._on_visibility)
 
     # PUBLIC
     def clear(self):
         self.total_time = 0.0
+        self.timing.reset()
         self._last_state = None
         self._landed_popup_done = False
-        self._last_data_cache = {}
-        self.graph_alt.reset()
-        self.graph_batt.reset()
-        self.graph_accel.reset()
-        self.graph_gyro.reset()
-        self.graph_gps.reset()
+        self._deferred = None
+        if self.landing: self.landing.reset()
+        if self.attitude: self.attitude.reset()
+        self.telemetry_model.clear()
+        self.panels.reset()
         if hasattr(self.ui, "lb_map_link"):
             self.ui.lb_map_link.setText("")
 
+    def set_panel_visible(self, pid: str, on: bool) -> bool:
+        """Show/hide a configured panel; its widget is created on first show."""
+        if pid not in self.panels or self.panels[pid].visible == on:
+            return pid in self.panels
+        self.panels.set_visible(pid, on)
+        self._place_panels()
+        return True
+
+    def set_map_tiles(self, path):
+        """Offline basemap for the GPS panels (None removes it); hidden panels get it when first shown."""
+        import sqlite3
+        cfg = dict(self.config.get("graphs.gps.tiles") or {}, path=path or "")
+        for p in self.panels.panels.values():
+            if p.type != "gps": continue
+            p.spec["tiles"] = cfg
+            if p.widget is None: continue
+            if not path: p.widget.clear_tiles(); continue
+            try:
+                layer = p.widget.set_tiles(**cfg)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                self.parent.terminal.write(f"[-] Map tiles: cannot open {path} - {e}"); return
+            self.parent.terminal.write(f"(OK) Map tiles: {path} (zoom {layer.source.minzoom}-{layer.source.maxzoom}, "
+                                       f"cache {layer.cache.max_tiles} tiles)")
+        if not path: self.parent.terminal.write("(OK) Map tiles: off")
+
+    def run_render_benchmark(self, csv_path=None):
+        """Benchmark render settings in a child process; save the fastest as the render profile."""
+        if getattr(self, "_bench_proc", None) is not None:
+            self.parent.terminal.write("(!) Render benchmark already running"); return
+        args = ["-m", "ddl.modules.utility.render_benchmark", "--save", self.render_profile_path]
+        if csv_path: args += ["--csv", csv_path]
+        self._bench_proc = QProcess(self)
+        self._bench_proc.setProcessChannelMode(QProcess.MergedChannels)
+        self._bench_proc.readyReadStandardOutput.connect(self._on_bench_output)
+        self._bench_proc.finished.connect(self._on_bench_finished)
+        self._bench_proc.start(sys.executable, args)
+        self.parent.terminal.write("(OK) Render benchmark started (runs in background)")
+
+    def _on_bench_output(self):
+        out = bytes(self._bench_proc.readAllStandardOutput()).decode("utf-8", errors="ignore")
+        for line in out.splitlines():
+            if line.startswith("[BENCH]"): self.parent.terminal.write(line)
+
+    def _on_bench_finished(self, code, _status):
+        self._on_bench_output()
+        self._bench_proc.deleteLater(); self._bench_proc = None
+        if code == 0:
+            self.parent.terminal.write(f"(OK) Render profile saved: {self.render_profile_path} (applies on restart)")
+        else:
+            self.parent.terminal.write(f"[-] Render benchmark failed (exit {code})")
+
+    def open_viewer(self, csv_path=None):
+        """Post-flight viewer over the min/max pyramid of a flight CSV (the live one by default)."""
+        from ddl.modules.acquisition import open_pyramid
+        from ddl.modules.utility import FlightViewer
+        serial = self.parent.serial
+        csv_path = csv_path or serial.csv_file_path
+        live = csv_path == serial.csv_file_path and (serial.acq is not None or serial.recorder.pyramid is not None)
+        if live: serial.recorder.flush()
+        try:   # a live pyramid is read as it is: its writer owns the files
+            pyr = open_pyramid(csv_path, int(self.config.get("telemetry.pyramid.fanout", 8)), rebuild=not live)
+        except (OSError, ValueError) as e:
+            self.parent.terminal.write(f"[-] Viewer: cannot open {csv_path} - {e}"); return
+        if not pyr.samples:
+            self.parent.terminal.write(f"(!) Viewer: no telemetry rows in {csv_path}"); return
+        specs = [s for s in self.config.get("graphs.panels") or [] if s.get("type") in ("mono", "rpy")]
+        viewer = FlightViewer(pyr, specs, f"Flight viewer - {csv_path}")
+        self.viewers = [v for v in getattr(self, "viewers", []) if v.isVisible()] + [viewer]
+        viewer.show()
+        self.parent.terminal.write(f"(OK) Viewer: {pyr.samples} samples, {len(pyr.levels)} levels")
+
+    def open_stats(self, window_s=None):
+        """Rolling mean/std/min/max/rate of every channel (graphs.stats: window_s, refresh_ms)."""
+        from ddl.modules.utility.telemetry_table import RollingStatsView
+        cfg = self.config.get("graphs.stats") or {}
+        window_s = float(window_s or cfg.get("window_s", 10.0))
+        if window_s <= 0: self.parent.terminal.write("(!) Stats: the window must be > 0 s"); return
+        view = RollingStatsView(self.bus, window_s, int(cfg.get("refresh_ms", 500)))
+        self.viewers = [v for v in getattr(self, "viewers", []) if v.isVisible()] + [view]
+        view.show()
+        self.parent.terminal.write(f"(OK) Stats: last {window_s:g} s, refreshed every {int(cfg.get('refresh_ms', 500))} ms")
+
+    def resume(self, csv_path=None):
+        """
+        Session resume after a restart: reload the rows of the last app session of a flight CSV, after its
+        last Clear All (the live one by default), into plots, labels and packet counters, then continue live.
+        """
+        from ddl.modules.acquisition import read_flight_csv
+        from ddl.modules.acquisition.attitude import CHANNELS as ATT, estimate_flight
+        from ddl.modules.acquisition.flight_csv import FlightData, hms_seconds
+        serial = self.parent.serial
+        csv_path = csv_path or serial.csv_file_path
+        start = time.perf_counter()
+        if csv_path == serial.csv_file_path: serial.recorder.flush()
+        try:
+            f = read_flight_csv(csv_path, header=None if self._has_header(csv_path) else serial.csv_header)
+        except (OSError, ValueError) as e:
+            self.parent.terminal.write(f"[-] Resume: cannot read {csv_path} - {e}"); return
+        first = max([*f.clears, *f.sessions], default=0)     # earlier runs and Clear All are not this flight
+        if f.rows <= first:
+            self.parent.terminal.write(f"(!) Resume: no telemetry rows in {csv_path}"); return
+        cols = f.slice(first, f.rows)
+        t = cols["t"] - cols["t"][0]
+        self.clear()
+        # ATT_* are not recorded: the live filter (or a one-off one for a visible panel) runs over the rows
+        if any(c not in cols for c in ATT) and (self.attitude or any(fl in ATT for p in self.panels.visible() for fl in p.fields)):
+            cols.update(estimate_flight(FlightData(cols, t=t), self.attitude))
+        gap = (time.time() % 86400.0 - hms_seconds([cols["MISSION_TIME"][-1] if "MISSION_TIME" in cols else ""])[0]) % 86400.0
+        gap = gap if 0.0 <= gap < 3600.0 else 1.0
+        self.bus.clear(); self.bus.load(cols, t, time.monotonic() - float(t[-1]) - gap)
+        loaded = self.panels.load(cols, t)
+
+        # last packet -> labels / table / landing state; the time axis continues after the gap
+        last = self.bus.store.last
+        self._update_labels(last, 0)
+        self._last_state = last.get("STATE")
+        self._landed_popup_done = bool("STATE" in cols and (cols["STATE"] == "LANDED").any())
+        self.total_time = float(t[-1])
+        if self.landing and "ALTITUDE" in cols:
+            zeros = np.zeros(len(t)); lat = cols.get("GPS_LATITUDE", zeros); lon = cols.get("GPS_LONGITUDE", zeros)
+            state = cols.get("STATE", np.full(len(t), ""))
+            self.landing.seed(cols["ALTITUDE"], lat, lon)   # the pad, not the start of the replayed tail
+            for i in np.flatnonzero(t >= t[-1] - 5 * self.landing.tau):
+                self.landing.update(float(t[i]), float(cols["ALTITUDE"][i]), float(lat[i]), float(lon[i]), str(state[i]))
+            for p in self.panels.panels.values():
+                if p.type == "gps" and p.widget is not None: p.widget.set_prediction(self.landing.last)
+        received, lost = serial.restore_counters(cols.get("PACKET_COUNT"), last.get("CMD_ECHO", ""))
+        if csv_path == serial.csv_file_path and f.session: serial.recorder.session = f.session   # continue that run
+        self.parent.terminal.write(f"(OK) Resume: {len(t)} rows ({received} received, {lost} lost) from {csv_path} "
+                                   f"into {', '.join(loaded) or 'no panel'} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    @staticmethod
+    def _has_header(path):
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f: return f.readline().startswith("TEAM_ID")
+        except OSError:
+            return False
+
+    def open_compare(self, paths, event=None):
+        """Overlay recorded flights aligned on an event (graphs.compare: panels, event, dt)."""
+        from ddl.modules.utility.flight_compare import FlightCompare
+        cfg = self.config.get("graphs.compare") or {}
+        event = event or cfg.get("event", "launch")
+        ids = cfg.get("panels") or ["altitude", "voltage", "accel", "gyro"]
+        specs = {s.get("id"): s for s in self.config.get("graphs.panels") or [] if s.get("type") in ("mono", "rpy")}
+        try:
+            view = FlightCompare(paths, [specs[i] for i in ids if i in specs], event, float(cfg.get("dt", 0.1)))
+        except ValueError as e:
+            self.parent.terminal.write(f"[-] Compare: {e}"); return
+        for path, why in view.cmp.skipped: self.parent.terminal.write(f"(!) Compare: skipped {path} - {why}")
+        if not view.cmp.names:
+            self.parent.terminal.write("(!) Compare: no flight could be aligned"); return
+        self.viewers = [v for v in getattr(self, "viewers", []) if v.isVisible()] + [view]
+        view.show()
+        self.parent.terminal.write(f"(OK) Compare: {len(view.cmp.names)} flights aligned on {event} in {view.load_ms:.0f} ms")
+
     # UPDATE
-    def update(self, data: dict):
+    def update(self, u):
+        """Bus subscriber: one packet (u.last), already stored as a row of bus.store."""
         try:
-            now = QDateTime.currentDateTime()
-            dt_s = max(0.0, self.last_update_time.msecsTo(now) / 1000.0)
-            self.total_time += dt_s
-
-            # labels + last-telemetry pretty block + landing check
-            self._update_labels_and_state(data, int(dt_s * 1000))
-
-            # plots
-            self.graph_alt.update(float(data.get("ALTITUDE", 0.0)), self.total_time)
-            self.graph_batt.update(float(data.get("VOLTAGE", 0.0)), self.total_time)
-            self.graph_accel.update([
-                float(data.get("ACCEL_R", 0.0)),
-                float(data.get("ACCEL_P", 0.0)),
-                float(data.get("ACCEL_Y", 0.0))
-            ], self.total_time)
-            self.graph_gyro.update([
-                float(data.get("GYRO_R", 0.0)),
-                float(data.get("GYRO_P", 0.0)),
-                float(data.get("GYRO_Y", 0.0))
-            ], self.total_time)
-            lat = float(data.get("GPS_LATITUDE", 0.0))
-            lon = float(data.get("GPS_LONGITUDE", 0.0))
-            self.graph_gps.update(lat, lon)
-
-            self.last_update_time = now
+            # time axis from the reader's monotonic receive stamp (store "t"), not GUI delivery time
+            data = u.last
+            rx = data.get(RX_TIME)
+            if rx is None: rx = time.monotonic()
+            self.total_time = u.t
+            dt_s = self.timing.arrival(rx, data.get("MISSION_TIME"))
+
+            # labels + last-telemetry table (only the latest packet matters while hidden)
+            if self.window_view.visible: self._update_labels(data, int(dt_s * 1000))
+            else: self._deferred = (data, int(dt_s * 1000))
+            self._check_landing(data)
+            if self.landing: self._predict_landing(data)
+
+            # plots: only visible panels subscribed to these fields
+            self.panels.dispatch(data, self.total_time)
+            self.timing.rendered(rx, time.monotonic())
 
         except Exception as e:
             print(f"[WARNING] UPDATE GRAPHS - {e}")
 
-    def _pretty_last_packet(self, d: dict) -> str:
-        # Minimal pretty format; show key fields first then the rest
-        keys_first = [
-            "TEAM_ID","MISSION_TIME","PACKET_COUNT","MODE","STATE",
-            "ALTITUDE","TEMPERATURE","PRESSURE","VOLTAGE",
-            "GYRO_R","GYRO_P","GYRO_Y","ACCEL_R","ACCEL_P","ACCEL_Y",
-            "MAG_R","MAG_P","MAG_Y",
-            "GPS_TIME","GPS_ALTITUDE","GPS_LATITUDE","GPS_LONGITUDE","GPS_SATS",
-            "CMD_ECHO"
-        ]
-        lines = []
-        for k in keys_first:
-            if k in d:
-                lines.append(f"{k}: {d.get(k,'')}")
-        # If any extra optional fields exist, append them
-        for k, v in d.items():
-            if k not in keys_first:
-                lines.append(f"{k}: {v}")
-        return "\n".join(lines)
-
-    def _update_labels_and_state(self, d, ping_ms):
+    def _derive_attitude(self, u):
+        """Batched bus subscriber: ATT_* for rows [start, stop) into the store, the newest packet and the panels."""
+        n = len(u); views = [u.view(k) for k in GYRO + ACCEL + MAG]
+        if any(v is None for v in views[:6]): return        # no IMU channels in this session
+        v = np.column_stack([np.zeros(n) if c is None else np.asarray(c, dtype=float) for c in views])
+        att = self.attitude.angles(u.view("t"), v[:, :3], v[:, 3:6], v[:, 6:])
+        for k, a in att.items(): u.store.put(k, u.start, a)
+        last = {k: f"{a[-1]:.2f}" for k, a in att.items()}
+        if u.stop == len(u.store): u.store.last.update(last)
+        self.panels.dispatch(last, u.t)
+
+    def _on_window_visibility(self, on):
+        if on and self._deferred is not None:
+            self._update_labels(*self._deferred); self._deferred = None
+
+    def _on_visibility(self, on):
+        if on: self.panels.resume()
+        else: self.panels.pause()
+
+    def _update_labels(self, d, ping_ms):
         # Mission time
         if hasattr(self.ui, "lb_mission_time"):
             self.ui.lb_mission_time.setText(str(d.get("MISSION_TIME","--:--:--")) + " UTC")
@@ -101,17 +266,12 @@ class GraphManager(QObject):
         # Ping (optional)
         if hasattr(self.ui, "lb_ping"):
             self.ui.lb_ping.setText(f"{ping_ms} ms")
-        # Last telemetry pretty block
-        if hasattr(self.ui, "tb_last_telemetry"):
-            try:
-                # cache and render only if changed
-                if d != self._last_data_cache:
-                    self._last_data_cache = dict(d)
-                    self.ui.tb_last_telemetry.setPlainText(self._pretty_last_packet(d))
-            except Exception:
-                pass
-
-        # Landing detection → show maps
+        # Last telemetry table (only changed cells repaint)
+        self.telemetry_model.update(d)
+
+    def _check_landing(self, d):
+        # Landing detection → show maps (runs even while the plots are hidden)
+        state = d.get("STATE", "")
         try:
             if state == "LANDED" and not self._landed_popup_done:
                 lat = float(d.get("GPS_LATITUDE", 0.0))
@@ -125,35 +285,63 @@ class GraphManager(QObject):
         except Exception as e:
             print("[LANDING MAP ERROR]:", e)
 
+    def _predict_landing(self, d):
+        # touchdown prediction on every GPS panel (O(1) per packet; hidden panels pick it up when shown)
+        try:
+            pred = self.landing.update(self.total_time, float(d.get("ALTITUDE", "nan")), float(d.get("GPS_LATITUDE", 0.0)),
+                                       float(d.get("GPS_LONGITUDE", 0.0)), d.get("STATE", ""))
+        except ValueError:
+            return
+        for p in self.panels.panels.values():
+            if p.type == "gps" and p.widget is not None: p.widget.set_prediction(pred)
+
     # SETUP
     def _set_graphs(self):
-        # Mission-time X axis graphs, SI titles
-        self.graph_alt  = MonoAxisPlotWidget(title="Altitude (m)",          mission_time_axis=True)
-        self.graph_batt = MonoAxisPlotWidget(title="Battery Voltage (V)",   mission_time_axis=True)
-        self.graph_accel = RPYPlotWidget(title="Accel (R/P/Y)", mission_time_axis=True)
-        self.graph_gyro  = RPYPlotWidget(title="Gyro (R/P/Y)",  mission_time_axis=True)
-        self.graph_gps   = GpsPlotWidget(title="GPS Track (lat, lon)")
+        # Panels come from graphs.panels; hidden ones are never built or updated
+        gps_defaults = self.config.get("graphs.gps") or {}
+        specs = [dict(gps_defaults, **s) if s.get("type") == "gps" else s
+                 for s in self.config.get("graphs.panels") or []]
+        self.panels = PanelRegistry(specs, self.bus.store)
+        self._place_panels()
+
+    def _place_panels(self):
+        # detach plots first: dropping a row layout deletes the items it still owns
+        for row in getattr(self, "_rows", []):
+            for item in list(row.items):
+                row.removeItem(item); item.setParentItem(None)
+        self.graph_rows.clear()
+        self._rows = []
+        rows = {}
+        for p in self.panels.visible():
+            rows.setdefault(p.row, []).append(p)
+        for r in sorted(rows):
+            row = self.graph_rows.addLayout(rowspan=1, colspan=1)
+            for p in rows[r]: row.addItem(p.widget)
+            self._rows.append(row)
+            self.graph_rows.nextRow()
 
-        self.graphs_top.addItem(self.graph_alt);  self.graphs_top.addItem(self.graph_batt)
-        self.graphs_mid.addItem(self.graph_accel); self.graphs_mid.addItem(self.graph_gyro)
-        self.graphs_bot.addItem(self.graph_gps)
+    def _set_table(self):
+        self.telemetry_model = LastTelemetryModel(REQUIRED_FIELDS, self)
+        if hasattr(self.ui, "tb_last_telemetry"):
+            self.ui.tb_last_telemetry.setModel(self.telemetry_model)
 
     def _set_config(self):
+        # graphs.settings, overridden by the profile saved by /bench.render
+        from ddl.modules.utility.render_benchmark import load_profile, PG_OPTIONS
+        self.render_profile_path = self.config.get("graphs.render_profile_path", "./saves/render_profile.json")
+        self.render_settings = dict(self.config.get("graphs.settings") or {})
+        self.render_settings.update(load_profile(self.render_profile_path))
         pg.setConfigOption("background", (250,250,250))
         pg.setConfigOption("foreground", (17,17,17))
-        pg.setConfigOption("antialias", self.config.get("graphs.settings.antialias"))
         pg.setConfigOption("exitCleanup", True)
-        pg.setConfigOption("useOpenGL", self.config.get("graphs.settings.opengl"))
-        pg.setConfigOption("useCupy", self.config.get("graphs.settings.cupy"))
-        pg.setConfigOption("useNumba", self.config.get("graphs.settings.numba"))
-        pg.setConfigOption("segmentedLineMode", self.config.get("graphs.settings.segmentedLineMode"))
+        for key, option in PG_OPTIONS.items():
+            if key in self.render_settings:
+                pg.setConfigOption(option, self.render_settings[key])
 
     def _set_layout(self):
         self.layout = pg.GraphicsLayoutWidget()
-        self.layout.setAntialiasing(True)
-        self.layout.setRenderHints(QPainter.Antialiasing)
-        container = self.layout.addLayout(colspan=1, rowspan=1)
-        self.graphs_top = container.addLayout(rowspan=1, colspan=1); container.nextRow()
-        self.graphs_mid = container.addLayout(rowspan=1, colspan=1); container.nextRow()
-        self.graphs_bot = container.addLayout(rowspan=1, colspan=1)
+        antialias = bool(self.render_settings.get("antialias"))
+        self.layout.setAntialiasing(antialias)
+        self.layout.setRenderHint(QPainter.Antialiasing, antialias)
+        self.graph_rows = self.layout.addLayout(colspan=1, rowspan=1)
         self.ui.telemetry_graphs.addWidget(self.layout)
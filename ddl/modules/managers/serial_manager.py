@@ -1,28 +1,24 @@
-import os, csv, time
+import os, time
 import serial, serial.tools.list_ports
 from datetime import datetime
 import numpy as np
-from PyQt5.QtCore import QObject, pyqtSignal, QThread
-
-REQUIRED_FIELDS = [
-    "TEAM_ID","MISSION_TIME","PACKET_COUNT","MODE","STATE","ALTITUDE",
-    "TEMPERATURE","PRESSURE","VOLTAGE",
-    "GYRO_R","GYRO_P","GYRO_Y",
-    "ACCEL_R","ACCEL_P","ACCEL_Y",
-    "MAG_R","MAG_P","MAG_Y",
-    "AUTO_GYRO_ROTATION_RATE",
-    "GPS_TIME","GPS_ALTITUDE","GPS_LATITUDE","GPS_LONGITUDE","GPS_SATS",
-    "CMD_ECHO"
-]
+from PyQt5.QtCore import QObject, pyqtSignal, QThread, QTimer
+from ddl.modules.utility.profiling import thread_hook
+from ddl.modules.acquisition import (REQUIRED_FIELDS, RX_TIME, Recorder, AcquisitionCore,
+                                     AcquisitionProcess, KIND_PACKET)
 
 class SerialManager(QObject):
     data_available = pyqtSignal(str)
     update_graphs = pyqtSignal(dict)
     landed = pyqtSignal(float, float)
+    # widget-facing state; MainWindow wires these to the UI
+    ports_updated = pyqtSignal(list)
+    connection_changed = pyqtSignal(bool)
+    counters_changed = pyqtSignal(int, int, int, int, str)   # received, lost, corrupt, resynced, CMD_ECHO
 
     def __init__(self, parent):
         super().__init__(parent)
-        self.parent = parent; self.ui = parent.ui; self.terminal = parent.terminal; self.config = parent.config
+        self.parent = parent; self.terminal = parent.terminal; self.config = parent.config
         self.is_connected = False; self.is_unplugged=False
         self.alarm = self.config.get("connection.alarm")
         self.ser = serial.Serial(); self.ser.timeout = self.config.get("connection.time_out")
@@ -30,69 +26,99 @@ class SerialManager(QObject):
         os.makedirs(f"{self.logs_path}/BlackBox", exist_ok=True)
         self.sim_playing = False
         self.sim_thread = None
-        self.record_enabled = True
         self.team_id = str(self.config.get("application.settings.team_id"))
         self.csv_header = list(self.config.get("telemetry.csv.header"))
         self.file_pattern = self.config.get("telemetry.csv.filename_pattern")
         self.csv_file_path = os.path.join(self.logs_path, self.file_pattern.replace("${TEAM_ID}", self.team_id))
-        self.csv_file = None; self.csv_writer=None; self.csv_header_written=False
+        self.recorder = Recorder(self.logs_path, self.csv_file_path, self.csv_header,
+                                 self.config.get("telemetry.csv.include_header"), self.config.get("telemetry.blackbox"),
+                                 self.config.get("telemetry.pyramid"))
         self.dummy_enabled=False; self.dummy_update_time = self.config.get("graphs.default_update_time")
         self.baudratesDIC = self.config.get("connection.bauds_dic")
         self.filter_character = self.config.get("connection.filter_character")
         self.portList = []
-        self.received_count=0; self.lost_count=0; self.last_packet_count=None
+        self.core = AcquisitionCore.from_config(self.recorder, self.config.get("connection"), self.team_id)
+        # optional: serial reading + recording in a child process, GUI polls a shared-memory ring
+        self.use_process = bool(self.config.get("connection.acquisition_process.enable", False))
+        self.acq = None
+        self.ring_timer = QTimer(self)
+        self.ring_timer.setInterval(int(self.config.get("connection.acquisition_process.poll_ms", 20)))
+        self.ring_timer.timeout.connect(self.poll_ring)
+        self._corrupt = 0; self._resynced = 0   # integrity counters reported by the acquisition process
+        self._cmd_echo = ""
         self.sim_enabled=False; self.sim_activated=False
         self.last_latitude=42.842835; self.last_longitude=-2.668065; self.last_temperature=15.0; self.last_altitude=0.0
 
+    # Counters / recording state live in the acquisition core
+    @property
+    def received_count(self): return self.core.counter.received
+    @received_count.setter
+    def received_count(self, v): self.core.counter.received = v
+    @property
+    def lost_count(self): return self.core.counter.lost
+    @lost_count.setter
+    def lost_count(self, v): self.core.counter.lost = v
+    @property
+    def last_packet_count(self): return self.core.counter.last
+    @last_packet_count.setter
+    def last_packet_count(self, v): self.core.counter.last = v
+    @property
+    def record_enabled(self): return self.recorder.record_enabled
+    @record_enabled.setter
+    def record_enabled(self, on):
+        self.recorder.record_enabled = bool(on)
+        if self.acq: self.acq.set_recording(on)
+    @property
+    def ring_overruns(self): return self.acq.overruns if self.acq else 0
+
     def update_ports(self):
         try:
             self.portList = [p.device for p in serial.tools.list_ports.comports()]
             self.parent.terminal.write(f"(OK) [Available Ports]: {self.portList}")
-            self.ui.cb_ports.clear(); self.ui.cb_ports.addItems(self.portList)
+            self.ports_updated.emit(self.portList)
         except Exception as e:
             self.parent.terminal.write(f"[-] Error Updating Ports - {e}")
 
-    def connect(self):
+    def connect(self, port: str, baud_key: str):
         try:
-            self.ser.port = self.ui.cb_ports.currentText()
-            baud_key = self.ui.cb_bauds.currentText()
+            self.ser.port = port
             self.ser.baudrate = int(self.baudratesDIC.get(baud_key, 115200))
+            if self.use_process:
+                self.start_process(); self.is_connected=True
+                self.parent.terminal.write("(OK) [CONNECTED] (acquisition process)")
+                self.connection_changed.emit(True)
+                return
             self.ser.open(); self.is_connected=True
             self._open_csv_if_needed(); self.start_thread()
             self.parent.terminal.write("(OK) [CONNECTED]")
-            self.ui.btn_connect_serial.setText("connected")
+            self.connection_changed.emit(True)
         except Exception as e:
             self.parent.terminal.write(f"[-] Error Connecting - {e}")
             try: self.ser.close()
             except: pass
+            self.connection_changed.emit(False)
 
     def disconnect(self):
         try:
-            self.is_connected=False; self.stop_thread()
+            self.is_connected=False
+            if self.acq: self.stop_process()
+            else: self.stop_thread()
             self._close_csv_if_needed(); self.ser.close()
-            self.ui.btn_connect_serial.setText("disconnected")
+            self.connection_changed.emit(False)
             self.parent.terminal.write("(OK) [DISCONNECTED]")
         except Exception as e:
             self.parent.terminal.write(f"[-] Error Disconnecting - {e}")
 
     def _open_csv_if_needed(self):
-        if not self.record_enabled: return
-        new_file = not os.path.exists(self.csv_file_path)
-        self.csv_file = open(self.csv_file_path, "a", newline="", encoding="utf-8")
-        self.csv_writer = csv.writer(self.csv_file, delimiter=",")
-        if new_file and self.config.get("telemetry.csv.include_header"):
-            self.csv_writer.writerow(self.csv_header); self.csv_header_written=True
-
-    def _close_csv_if_needed(self):
-        if self.csv_file:
-            try: self.csv_file.close()
-            except: pass
-        self.csv_file=None; self.csv_writer=None; self.csv_header_written=False
+        if self.acq: return     # the acquisition process owns the CSV and its pyramid
+        self.recorder.catch_up_pyramid(); self.recorder.open_csv()
+    def _close_csv_if_needed(self): self.recorder.close_csv()
 
     # Commands
     def send_data(self, data):
         try:
-            self.ser.write(bytes(data, "utf-8"))
+            if self.acq: self.acq.write(bytes(data, "utf-8"))
+            else: self.ser.write(bytes(data, "utf-8"))
             self.terminal.write(self.config.get("commands.sent", 2).replace("$CMD", data))
         except Exception as e:
             self.terminal.write(f"[-] Error Sending Data - {e}")
@@ -112,44 +138,88 @@ class SerialManager(QObject):
     def cmd_mec(self, device:str, on=True): self.send_data(f"CMD,{self.team_id},MEC,{device},{'ON' if on else 'OFF'}\r\n")
 
     # Reader
+    def restore_counters(self, packet_counts, cmd_echo=""):
+        """Session resume: received/lost/last PACKET_COUNT from a column of packet counts; returns (received, lost)."""
+        c = self.core.counter; c.reset()
+        pkt = np.asarray(packet_counts if packet_counts is not None else [], dtype=float)
+        pkt = pkt[np.isfinite(pkt)]
+        if len(pkt):
+            step = np.diff(pkt)
+            c.received = len(pkt); c.lost = int((step[step > 1] - 1).sum()); c.last = int(pkt[-1])
+        self._cmd_echo = cmd_echo
+        self._show_counters(cmd_echo)
+        return c.received, c.lost
+
     def read_serial(self):
         try:
-            line = self.ser.readline().decode("utf-8", errors="ignore").strip()
-            if not line: return
-            self.all_data.write(f"[{datetime.now()}]: {line}\n")
-            if self.filter_character and line.startswith(self.filter_character):
-                line = line.replace(self.filter_character, "", 1).strip()
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) < len(REQUIRED_FIELDS):
-                self.data_available.emit(line); return
-            data = dict(zip(REQUIRED_FIELDS, parts[:len(REQUIRED_FIELDS)]))
-            try:
-                pkt = int(data["PACKET_COUNT"])
-                if self.last_packet_count is None:
-                    self.received_count = 1
-                else:
-                    step = pkt - self.last_packet_count
-                    if step <= 0: self.received_count += 1
-                    else:
-                        self.lost_count += max(0, step-1); self.received_count += 1
-                self.last_packet_count = pkt
-            except: pass
-            try:
-                if hasattr(self.ui, "lb_recv"): self.ui.lb_recv.setText(f"recv: {self.received_count}")
-                if hasattr(self.ui, "lb_lost"): self.ui.lb_lost.setText(f"lost: {self.lost_count}")
-                if hasattr(self.ui, "lb_cmd_echo"): self.ui.lb_cmd_echo.setText(data.get("CMD_ECHO",""))
-            except: pass
-            if self.record_enabled and self.csv_writer:
-                self.csv_writer.writerow([data.get(h,"") for h in self.csv_header])
-            self.update_graphs.emit(data); self.data_available.emit(line)
+            self._emit_frames(self.core.read(self.ser))
         except Exception as e:
-            try: self.all_data.write("[EXCEPTION]: " + str(e) + "\n")
-            except: pass
+            self.recorder.exception(e)
             print("[EXCEPTION]:", e)
 
+    def _emit_frames(self, frames):
+        for line, data in frames:
+            if line is None: continue
+            if data is None:
+                self.data_available.emit(line); continue
+            self._show_counters(data.get("CMD_ECHO",""))
+            self.update_graphs.emit(data); self.data_available.emit(line)
+
+    def _show_counters(self, cmd_echo):
+        self.counters_changed.emit(self.received_count, self.lost_count,
+                                   self._corrupt + self.core.corrupt, self._resynced + self.core.resynced, cmd_echo)
+
+    # Acquisition process
+    def start_process(self):
+        self.recorder.close_csv(); self.recorder.close_blackbox()   # the child becomes the only writer
+        cfg = {
+            "port": self.ser.port, "baudrate": self.ser.baudrate, "timeout": self.ser.timeout,
+            "logs_path": self.logs_path,
+            "csv_file_path": self.csv_file_path, "csv_header": self.csv_header,
+            "include_header": self.recorder.include_header, "record_enabled": self.record_enabled,
+            "connection": self.config.get("connection"), "team_id": self.team_id,
+            "blackbox": self.config.get("telemetry.blackbox"), "pyramid": self.config.get("telemetry.pyramid"),
+            "counters": (self.core.counter.received, self.core.counter.lost, self.core.counter.last),
+            "session": self.recorder.session,
+        }
+        self.acq = AcquisitionProcess(cfg,
+                                      int(self.config.get("connection.acquisition_process.ring_slots", 4096)),
+                                      int(self.config.get("connection.acquisition_process.slot_bytes", 1024)))
+        self.acq.start(); self.ring_timer.start()
+
+    def stop_process(self):
+        self.ring_timer.stop()
+        tail = self.acq.stop((self.ser.timeout or 0) + 2.0)
+        self._deliver(tail)
+        if self.acq.overruns:
+            self.parent.terminal.write(f"(!) GUI ring overruns this session: {self.acq.overruns}")
+        self.acq = None
+
+    def poll_ring(self):
+        if not self.acq: return
+        self._deliver(self.acq.read())
+        if not self.acq.is_alive() and self.is_connected:
+            self._deliver(self.acq.read())
+            self.disconnect()
+
+    def _deliver(self, records):
+        for _seq, kind, received, lost, corrupt, resynced, rx, payload in records:
+            line = payload.decode("utf-8", errors="ignore")
+            if kind == KIND_PACKET:
+                data = dict(zip(REQUIRED_FIELDS, [p.strip() for p in line.split(",")]))
+                data[RX_TIME] = rx
+                self._cmd_echo = data.get("CMD_ECHO","")
+                self.update_graphs.emit(data)
+            self.data_available.emit(line)
+        if records:
+            _seq, _kind, received, lost, corrupt, resynced, _rx, _payload = records[-1]
+            self.core.counter.received = received; self.core.counter.lost = lost
+            self._corrupt = corrupt; self._resynced = resynced
+            self._show_counters(self._cmd_echo)
+
     # Dummy generator
     def dummy_serial(self):
-        pkt = (self.last_packet_count or 0) + 1; self.last_packet_count = pkt; self.received_count += 1
+        pkt = (self.last_packet_count or 0) + 1
         self.last_latitude += np.random.uniform(0.00001, 0.000001)
         self.last_longitude += np.random.uniform(0.00001, 0.000001)
         self.last_altitude += np.random.uniform(0, 1.0); self.last_temperature += np.random.uniform(-0.05, 0.05)
@@ -161,60 +231,61 @@ class SerialManager(QObject):
             "MAG_R":"0.0","MAG_P":"0.0","MAG_Y":"0.0","AUTO_GYRO_ROTATION_RATE":"0",
             "GPS_TIME": datetime.utcnow().strftime("%H:%M:%S"), "GPS_ALTITUDE":"10.0",
             "GPS_LATITUDE": f"{self.last_latitude:.5f}", "GPS_LONGITUDE": f"{self.last_longitude:.5f}",
-            "GPS_SATS":"7","CMD_ECHO":"CXON"
+            "GPS_SATS":"7","CMD_ECHO":"CXON", RX_TIME: time.monotonic()
         }
-        if self.record_enabled and self.csv_writer:
-            self.csv_writer.writerow([row.get(h,"") for h in self.csv_header])
-        self.update_graphs.emit(row)
-        self.data_available.emit(",".join([row.get(h,"") for h in self.csv_header]))
+        if self.core.codec is not None:   # exercise the binary decoder end to end (it does the counting)
+            self._emit_frames(self.core.feed(self.core.codec.encode(row)))
+        else:
+            self.last_packet_count = pkt; self.received_count += 1
+            self.recorder.write_row(row)
+            self.update_graphs.emit(row)
+            self.data_available.emit(",".join([row.get(h,"") for h in self.csv_header]))
         time.sleep(1.0)
 
     class WorkerThread(QThread):
         def __init__(self, parent): super().__init__(parent); self.parent = parent
         def run(self):
             if self.parent.dummy_enabled:
-                while self.parent.dummy_enabled: self.parent.dummy_serial()
+                while self.parent.dummy_enabled: thread_hook(); self.parent.dummy_serial()
             else:
                 self.parent.is_connected=True
                 while self.parent.is_connected:
                     if self.parent.ser.isOpen():
                         while self.parent.ser.isOpen():
-                            self.parent.read_serial()
+                            thread_hook(); self.parent.read_serial()
                     
 
     def start_thread(self):
-        self.all_data = open(f"./{self.logs_path}/BlackBox/flight_data.txt", 'w', encoding="utf-8")
+        if not self.acq: self.recorder.open_blackbox()   # else the acquisition process owns the BlackBox
         self.worker = self.WorkerThread(self); self.worker.start()
 
     def stop_thread(self):
         try: self.is_connected=False; self.worker.terminate()
         except: pass
-        try: self.all_data.close()
-        except: pass
+        self.recorder.close_blackbox()
 
     # API for ConnectionBuffer
-    def start_dummy(self): self.dummy_enabled=True; self._open_csv_if_needed(); self.start_thread()
-    def stop_dummy(self): self.dummy_enabled=False; self.stop_thread()
+    def start_dummy(self):
+        if self.acq: self.parent.terminal.write("(!) Dummy rows are not recorded: the acquisition process owns the CSV/BlackBox")
+        self.dummy_enabled=True; self._open_csv_if_needed(); self.start_thread()
+    def stop_dummy(self):
+        self.dummy_enabled=False
+        if not self.acq: self.stop_thread()   # the dummy loop ends on its own; keep the process link up
     def set_dummy_time(self, sec: float): self.dummy_update_time = float(sec)
 
     def clear_runtime(self):
-        """Reset runtime counters and close/reopen CSV if recording."""
-        self.received_count = 0
-        self.lost_count = 0
-        self.last_packet_count = None
-        # reset blackbox file too
-        try:
-            if getattr(self, "all_data", None):
-                self.all_data.close()
-        except:
-            pass
-        self.all_data = open(f"./{self.logs_path}/BlackBox/flight_data.txt", 'w', encoding="utf-8")
-        # keep the CSV file, but write a separator for clarity
-        if self.record_enabled and self.csv_writer:
-            try:
-                self.csv_writer.writerow(["# --- CLEAR ALL ---"])
-            except:
-                pass
+        """Reset runtime counters, restart the BlackBox and mark the CSV."""
+        if self.acq:
+            self.acq.clear()
+            self.core.counter.reset(); self._corrupt = 0; self._resynced = 0
+        else:
+            self.core.clear()
+
+    def shutdown(self):
+        """Window closing: stop the reader and close every log file."""
+        if self.acq: self.stop_process()
+        self.recorder.close()
+
     def sim_play(self):
         if self.sim_playing:
             self.terminal.write("(!) SIM already playing.")
@@ -230,17 +301,3 @@ class SerialManager(QObject):
         if self.sim_thread and self.sim_playing:
             self.sim_thread.stop()
         self.sim_playing = False
-        
-    def clear_runtime(self):
-        self.received_count = 0
-        self.lost_count = 0
-        self.last_packet_count = None
-        try:
-            if getattr(self, "all_data", None):
-                self.all_data.close()
-        except:
-            pass
-        self.all_data = open(f"./{self.logs_path}/BlackBox/flight_data.txt", 'w', encoding="utf-8")
-        if self.record_enabled and self.csv_writer:
-            try: self.csv_writer.writerow(["# --- CLEAR ALL ---"])
-            except: pass
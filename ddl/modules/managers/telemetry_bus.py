@@ -0,0 +1,109 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from ddl.modules.utility.telemetry_store import TelemetryStore
+
+
+class Update:
+    """
+    Rows [start, stop) of the store handed to a subscriber; columns are read-only views, never copies.
+    - view(name): the new rows of one channel (None if the channel never appeared)
+    - history(name): every row of the session so far
+    - last: the newest packet dict
+    """
+    __slots__ = ("store", "start", "stop")
+
+    def __init__(self, store, start, stop):
+        self.store = store; self.start = start; self.stop = stop
+
+    def __len__(self): return self.stop - self.start
+
+    def view(self, name): return self.store.view(name, self.start, self.stop)
+    def history(self, name): return self.store.view(name, 0, self.stop)
+
+    @property
+    def t(self): return float(self.store.cols["t"][self.stop - 1])
+
+    @property
+    def last(self): return self.store.last
+
+
+class Subscription:
+    """callback(Update) for packets carrying any of `channels` (all when None); batched when interval_ms > 0."""
+    def __init__(self, bus, callback, channels=None, interval_ms=0, name=None):
+        self.callback = callback; self.channels = set(channels) if channels else None
+        self.name = name or getattr(callback, "__qualname__", repr(callback))
+        self.next = len(bus.store)     # first row not delivered yet
+        self.timer = None
+        if interval_ms > 0:
+            self.timer = QTimer(bus); self.timer.setInterval(int(interval_ms))
+            self.timer.timeout.connect(lambda: bus._flush(self))
+            self.timer.start()
+
+
+class TelemetryBus(QObject):
+    """
+    In-process pub/sub between the link and its consumers (plots, labels, alarms, extra windows).
+    - publish(data): the packet becomes one row of the shared TelemetryStore, then each subscriber
+      gets an Update over it; memory does not grow with the number of subscribers
+    - subscribe(cb, channels, interval_ms): per packet, or batched every interval_ms (rows since the last call)
+    - subscribe_lines(cb): raw text lines (terminal)
+    - a failing subscriber is reported and skipped, the others still get the packet
+    """
+    cleared = pyqtSignal()
+
+    def __init__(self, parent=None, capacity: int = 4096):
+        super().__init__(parent)
+        self.store = TelemetryStore(capacity)
+        self.subs = []; self.line_subs = []
+
+    # PUBLIC
+    def subscribe(self, callback, channels=None, interval_ms: int = 0, name=None) -> Subscription:
+        sub = Subscription(self, callback, channels, interval_ms, name)
+        self.subs.append(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        if sub in self.subs: self.subs.remove(sub)
+        if sub in self.line_subs: self.line_subs.remove(sub)
+        if getattr(sub, "timer", None) is not None: sub.timer.stop(); sub.timer.deleteLater(); sub.timer = None
+
+    def subscribe_lines(self, callback):
+        self.line_subs.append(callback)
+        return callback
+
+    def publish(self, data: dict):
+        i = self.store.append(data)
+        for sub in self.subs:
+            if sub.timer is not None: continue
+            if sub.channels is not None and sub.channels.isdisjoint(data): sub.next = i + 1; continue
+            self._deliver(sub, sub.next, i + 1)
+
+    def publish_line(self, line: str):
+        for cb in self.line_subs:
+            try: cb(line)
+            except Exception as e: print(f"[WARNING] BUS lines - {e}")
+
+    def load(self, cols: dict, t, t0: float = None):
+        """Bulk rows (session resume); subscribers are not called, they read the history on their own."""
+        self.store.load(cols, t, t0)
+        for sub in self.subs: sub.next = len(self.store)
+
+    def clear(self):
+        self.store.clear()
+        for sub in self.subs: sub.next = 0
+        self.cleared.emit()
+
+    def flush(self, sub=None):
+        """Deliver pending rows to one batched subscriber (all of them by default) now."""
+        for s in ([sub] if sub is not None else self.subs):
+            if s.timer is not None: self._flush(s)
+
+    # UPDATE
+    def _flush(self, sub):
+        n = len(self.store)
+        if sub.next < n: self._deliver(sub, sub.next, n)
+
+    def _deliver(self, sub, start, stop):
+        sub.next = stop
+        try: sub.callback(Update(self.store, start, stop))
+        except Exception as e: print(f"[WARNING] BUS {sub.name} - {e}")
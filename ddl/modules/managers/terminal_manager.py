@@ -1,25 +1,67 @@
 # ddl/modules/managers/terminal_manager.py
+from collections import deque
+
+
 class TerminalManager:
     """
     Minimal terminal adapter:
     - ui.terminal is a QTextBrowser
     - provides write(), clear(), boot_up_message()
+    - every line is queued to the full-text SearchIndex (/find), written by its own thread
+    - while the terminal can't be seen, lines are kept in a bounded backlog and
+      appended in one batch (single repaint) when it is shown again
     """
     def __init__(self, parent):
         self.parent = parent
         self.ui = parent.ui
         # prefix from config if needed
         self.prefix = parent.config.get("application.settings.command_prefix") or "/"
+        self.backlog = deque(maxlen=int(parent.config.get("application.settings.terminal_backlog", 5000) or 5000))
+        self.dropped = 0
+        self.search = None
+        try:
+            from ddl.modules.utility.search_index import SearchIndex
+            self.search = SearchIndex.from_config(parent.config.get("application.settings.search"),
+                                                  parent.config.get("application.settings.logs_folder") or "./saves")
+        except Exception as e:
+            print(f"[WARNING] SEARCH INDEX - {e}")
+        self.view = None
+        if hasattr(self.ui, "terminal"):
+            from ddl.modules.utility.visibility import VisibilityWatch
+            self.view = VisibilityWatch(self.ui.terminal, parent)
+            self.view.changed.connect(self._on_visibility)
 
-    def write(self, msg: str):
+    def write(self, msg: str, source: str = "term"):
         # Accept both plain text and preformatted HTML
         try:
+            if self.search is not None and source != "find": self.search.add(msg, source)
+            if self.view is not None and not self.view.visible:
+                if len(self.backlog) == self.backlog.maxlen: self.dropped += 1
+                self.backlog.append(str(msg)); return
             if hasattr(self.ui, "terminal"):
                 self.ui.terminal.append(str(msg))
         except Exception:
             pass
 
+    def write_link(self, line: str):
+        """Line received from the link (same text the BlackBox keeps)."""
+        self.write(line, "link")
+
+    def find(self, query: str, limit: int = 50):
+        from ddl.modules.utility.search_index import format_hit
+        if self.search is None:
+            self.write("(!) Search is disabled (application.settings.search.enable)"); return
+        rows, ms = self.search.search(query, limit)
+        for hit in reversed(rows): self.write(format_hit(*hit), "find")
+        more = f" (latest {limit})" if len(rows) == limit else ""
+        lost = f" | {self.search.dropped} lines not indexed (writer behind)" if self.search.dropped else ""
+        self.write(f"(OK) /find '{query}': {len(rows)} matches{more} in {ms:.1f} ms{lost}", "find")
+
+    def close(self):
+        if self.search is not None: self.search.close()
+
     def clear(self):
+        self.backlog.clear(); self.dropped = 0
         try:
             if hasattr(self.ui, "terminal"):
                 self.ui.terminal.clear()
@@ -28,3 +70,14 @@ class TerminalManager:
 
     def boot_up_message(self):
         self.write("(OK) Ground Station ready. Type /help")
+
+    def _on_visibility(self, on):
+        if not on or not self.backlog: return
+        term = self.ui.terminal
+        term.setUpdatesEnabled(False)
+        try:
+            if self.dropped: term.append(f"(!) {self.dropped} lines not shown while hidden (see BlackBox)")
+            for msg in self.backlog: term.append(msg)
+        finally:
+            self.backlog.clear(); self.dropped = 0
+            term.setUpdatesEnabled(True)
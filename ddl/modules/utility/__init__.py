@@ -1,3 +1,27 @@
-from . connection_buffer import ConnectionBuffer
-from . clock_updater import ClockUpdater
-from . graph_types import MonoAxisPlotWidget, RPYPlotWidget, GpsPlotWidget
+# Lazy re-exports: Qt-free helpers (resource_path, geo) must not pull in Qt/pyqtgraph.
+_EXPORTS = {
+    "ConnectionBuffer":   "connection_buffer",
+    "ClockUpdater":       "clock_updater",
+    "MonoAxisPlotWidget": "graph_types",
+    "RPYPlotWidget":      "graph_types",
+    "GpsPlotWidget":      "graph_types",
+    "LocalTangentPlane":  "geo",
+    "PathSimplifier":     "geo",
+    "distance_bearing":   "geo",
+    "LastTelemetryModel": "telemetry_table",
+    "LinkTiming":         "link_timing",
+    "FlightViewer":       "flight_viewer",
+    "VisibilityWatch":    "visibility",
+    "SearchIndex":        "search_index",
+    "ProfileSession":     "profiling",
+    "FlightCompare":      "flight_compare",
+    "TileLayer":          "map_tiles",
+    "MBTiles":            "map_tiles",
+    "TelemetryStore":     "telemetry_store",
+}
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,245 @@
+"""
+Telemetry alarm rules, compiled once from config and evaluated over packet batches
+(packet dicts, or column views of the telemetry store).
+
+Rule specs (config `alarms.rules`):
+
+    {"id": "low_voltage", "type": "threshold", "field": "VOLTAGE", "below": 7.0, "hysteresis": 0.2, "debounce": 3}
+    {"id": "fast_descent", "type": "rate", "field": "ALTITUDE", "below": -20.0, "debounce": 3}
+    {"id": "state_order", "type": "state", "field": "STATE"}
+    {"id": "link_silence", "type": "silence", "seconds": 5}
+
+- threshold / rate: active after `debounce` consecutive samples outside [below, above];
+  cleared once back inside the band narrowed by `hysteresis`
+- rate: d(field)/dt per second from the packets' RX_TIME stamps
+- state: active on a transition not allowed by `transitions` (state -> list), by default
+  "stay or move forward" along telemetry.state_allowlist, or on a state outside the allowlist;
+  cleared by the next allowed change (unknown -> known is a resync, not a violation)
+- silence: active when no packet arrived for `seconds` (checked by tick())
+"""
+from collections import namedtuple
+import numpy as np
+
+from ddl.modules.acquisition.protocol import RX_TIME
+
+Alert = namedtuple("Alert", "rule severity active message index")
+
+
+def _column(packets, field):
+    out = np.empty(len(packets))
+    for i, d in enumerate(packets):
+        try: out[i] = float(d.get(field, "nan"))
+        except (TypeError, ValueError): out[i] = np.nan
+    return out
+
+
+def _text(packets, field):
+    return np.array([d.get(field, "") for d in packets], dtype=object)
+
+
+def _runs(c, carry):
+    """Per row: length of the run of True ending at each column, continuing `carry` from the previous batch."""
+    n = c.shape[1]
+    cs = np.cumsum(c, axis=1)
+    run = cs - np.maximum.accumulate(np.where(c, 0, cs), axis=1)
+    first_break = np.where(c.all(axis=1), n, np.argmin(c, axis=1))
+    return run + carry[:, None] * (np.arange(n)[None, :] < first_break[:, None])
+
+
+class LatchedRule:
+    """Debounced, hysteretic band check on one value per packet (threshold and rate rules)."""
+    def __init__(self, spec):
+        self.id = spec["id"]; self.field = spec.get("field", "")
+        self.severity = spec.get("severity", "warning")
+        self.message = spec.get("message", "")
+        self.below = spec.get("below"); self.above = spec.get("above")
+        self.hysteresis = float(spec.get("hysteresis", 0.0))
+        self.debounce = max(1, int(spec.get("debounce", 1)))
+        self.reset()
+
+    def reset(self):
+        self.active = False
+
+    def text(self, on, value):
+        what = self.message or f"{self.field} = {value:.2f}"
+        return what if on else f"{self.field} back in range ({value:.2f})"
+
+
+class LatchedGroup:
+    """
+    All threshold/rate rules evaluated together as one (rules x packets) matrix,
+    so a batch costs the same handful of NumPy calls whatever the rule count.
+    - rate rules on the same field share one derivative per batch
+    """
+    def __init__(self, rules):
+        self.rules = rules
+        self.keys = [(isinstance(r, RateRule), r.field) for r in rules]
+        nan_to = lambda v, inf: inf if v is None else float(v)
+        self.below = np.array([nan_to(r.below, -np.inf) for r in rules])[:, None]
+        self.above = np.array([nan_to(r.above, np.inf) for r in rules])[:, None]
+        h = np.array([r.hysteresis for r in rules])[:, None]
+        self.clear_lo = self.below + h; self.clear_hi = self.above - h
+        self.debounce = np.array([r.debounce for r in rules])[:, None]
+        self.reset()
+
+    def reset(self):
+        n = len(self.rules)
+        self.active = np.zeros(n, bool); self.run = np.zeros(n, np.int64)
+        self.last = {}    # rate field -> (value, RX_TIME) of the previous packet
+        for r in self.rules: r.reset()
+
+    def _rate(self, field, cols):
+        v = cols(field); t = cols(RX_TIME)
+        v0, t0 = self.last.get(field, (np.nan, np.nan))
+        self.last[field] = (v[-1], t[-1])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dt = np.diff(t, prepend=t0)
+            return np.where(dt > 0, np.diff(v, prepend=v0) / dt, np.nan)
+
+    def evaluate(self, cols, n):
+        if not self.rules or not n: return []
+        rows = {}
+        for key in self.keys:
+            if key not in rows: rows[key] = self._rate(key[1], cols) if key[0] else cols(key[1])
+        v = np.vstack([rows[key] for key in self.keys])
+        with np.errstate(invalid="ignore"):
+            bad = (v < self.below) | (v > self.above)
+            ok = (v >= self.clear_lo) & (v <= self.clear_hi)
+        run = _runs(bad, self.run)
+        ev = np.where(run >= self.debounce, 1, np.where(ok, -1, 0))
+        idx = np.maximum.accumulate(np.where(ev != 0, np.arange(ev.shape[1]), -1), axis=1)
+        active = np.where(idx >= 0, np.take_along_axis(ev, np.maximum(idx, 0), axis=1) == 1, self.active[:, None])
+        change = np.diff(np.concatenate((self.active[:, None], active), axis=1).astype(np.int8), axis=1)
+        out = []
+        for k, i in zip(*np.nonzero(change)):
+            r = self.rules[k]; on = bool(active[k, i])
+            out.append(Alert(r.id, r.severity, on, r.text(on, v[k, i]), int(i)))
+        self.run = run[:, -1].copy(); self.active = active[:, -1].copy()
+        for r, a in zip(self.rules, self.active): r.active = bool(a)
+        return out
+
+
+class RateRule(LatchedRule):
+    """Band check on d(field)/dt (computed by LatchedGroup)."""
+    def text(self, on, value):
+        what = self.message or f"d{self.field}/dt = {value:+.1f}/s"
+        return what if on else f"d{self.field}/dt back in range ({value:+.1f}/s)"
+
+
+class StateRule:
+    """
+    Allowed state transitions, looked up as integer pair codes in a boolean table.
+    - only state changes are examined (a Python step per change, none per packet)
+    - latched: raised once on a bad change, held while the state stays there
+    """
+    def __init__(self, spec, allowlist):
+        self.id = spec["id"]; self.field = spec.get("field", "STATE")
+        self.severity = spec.get("severity", "warning")
+        self.states = list(allowlist)
+        self.code = {s: i for i, s in enumerate(self.states)}
+        n = self.k = len(self.states) + 1        # last code = unknown state
+        trans = spec.get("transitions")
+        if trans is None:   # stay or move forward
+            pairs = [(a, b) for a in range(n - 1) for b in range(a, n - 1)]
+        else:
+            pairs = [(self.code[a], self.code[b]) for a, nxt in trans.items() for b in [a, *nxt]
+                     if a in self.code and b in self.code]
+        self.allowed = np.zeros(n * n, bool)
+        self.allowed[[a * n + b for a, b in pairs]] = True
+        self.reset()
+
+    def reset(self):
+        self.prev = None; self.active = False
+
+    def evaluate(self, cols, n):
+        if not n: return []
+        unknown = self.k - 1; code = self.code; text = cols(self.field, True)
+        cur = np.fromiter((code.get(s, unknown) for s in text), np.int64, n)
+        prev = np.concatenate(([-1 if self.prev is None else self.prev], cur[:-1]))   # -1: no state yet
+        changes = np.flatnonzero(cur != prev)
+        self.prev = int(cur[-1])
+        out = []
+        for i in changes:
+            a, b = int(prev[i]), int(cur[i])
+            if b == unknown: on, what = True, f"{self.field} '{text[i]}' not in the allowlist"
+            elif a < 0 or a == unknown: on, what = False, f"{self.field} {text[i]} (resync)"
+            else:
+                on = not self.allowed[a * self.k + b]
+                what = f"{self.field} {self.states[a]} -> {text[i]}" + (" not allowed" if on else "")
+            if on or self.active:      # every bad change is reported, a good one only to clear
+                out.append(Alert(self.id, self.severity, on, what, int(i)))
+            self.active = on
+        return out
+
+
+class SilenceRule:
+    def __init__(self, spec):
+        self.id = spec["id"]; self.severity = spec.get("severity", "warning")
+        self.seconds = float(spec.get("seconds", 5.0))
+        self.reset()
+
+    def reset(self):
+        self.last_rx = None; self.active = False
+
+    def evaluate(self, cols, n):
+        if not n: return []
+        rx = cols(RX_TIME)[-1]
+        if rx == rx: self.last_rx = float(rx)
+        if self.active:
+            self.active = False
+            return [Alert(self.id, self.severity, False, "telemetry link back", n - 1)]
+        return []
+
+    def tick(self, now):
+        if self.active or self.last_rx is None or now - self.last_rx < self.seconds: return []
+        self.active = True
+        return [Alert(self.id, self.severity, True, f"no telemetry for {now - self.last_rx:.0f} s", -1)]
+
+
+RULE_TYPES = {"threshold": LatchedRule, "rate": RateRule, "silence": SilenceRule}
+
+
+class RuleEngine:
+    """
+    Compiles rule specs once; evaluate() runs every rule over a batch of packet dicts,
+    evaluate_columns() over a batch already in columns (rows of the telemetry store).
+    - each needed field is converted to a float column once per batch, shared by all rules
+    - threshold and rate rules run together as one matrix (LatchedGroup)
+    - returns Alerts in packet order (raise and clear transitions only)
+    """
+    def __init__(self, specs, state_allowlist=()):
+        self.rules = []
+        for i, spec in enumerate(specs or []):
+            spec = dict(spec); spec.setdefault("id", f"rule{i}")
+            kind = spec.get("type", "threshold")
+            if kind == "state": self.rules.append(StateRule(spec, state_allowlist))
+            elif kind in RULE_TYPES: self.rules.append(RULE_TYPES[kind](spec))
+            else: raise ValueError(f"unknown alarm rule type '{kind}' ({spec['id']})")
+        latched = [r for r in self.rules if isinstance(r, LatchedRule)]
+        self.groups = [LatchedGroup(latched)] + [r for r in self.rules if not isinstance(r, LatchedRule)]
+
+    def reset(self):
+        for g in self.groups: g.reset()
+
+    def active(self):
+        return [r for r in self.rules if getattr(r, "active", False)]
+
+    def evaluate(self, packets):
+        cache = {}
+        def cols(field, text=False):
+            if (field, text) not in cache: cache[field, text] = (_text if text else _column)(packets, field)
+            return cache[field, text]
+        return self.evaluate_columns(cols, len(packets))
+
+    def evaluate_columns(self, cols, n):
+        """cols(field, text=False) -> the batch's float column (str objects with text=True), n rows."""
+        out = []
+        for g in self.groups: out += g.evaluate(cols, n)
+        out.sort(key=lambda a: a.index)
+        return out
+
+    def tick(self, now):
+        out = []
+        for r in self.rules:
+            if hasattr(r, "tick"): out += r.tick(now)
+        return out
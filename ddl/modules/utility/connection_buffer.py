@@ -1,3 +1,6 @@
+import os, glob
+
+
 class ConnectionBuffer:
     def __init__(self, parent):
         self.parent = parent
@@ -16,7 +19,10 @@ class ConnectionBuffer:
             for cmd in ["/clear","/dummy.on","/dummy.off","/dummy.time <sec>",
                         "/cal","/cx.on","/cx.off","/st.gps","/st hh:mm:ss",
                         "/sim.enable","/sim.activate","/sim.disable",
-                        "/simp <pressure_pa>","/mec.<device>.on","/mec.<device>.off"]:
+                        "/simp <pressure_pa>","/mec.<device>.on","/mec.<device>.off",
+                        "/bench.render [flight.csv]","/panels","/panel.show <id>","/panel.hide <id>","/timing","/alarms","/viewer [flight.csv]","/resume [flight.csv]","/view","/find <words>","/find.import [blackbox dir]",
+                        "/profile.start","/profile.stop","/mem.snapshot","/map.tiles <file.mbtiles|off>","/landing","/stats [seconds]",
+                        "/compare [start|launch|apogee|landed|state:<NAME>] <flight.csv|glob>[@N|@all] ..."]:
                 self.terminal.write(f" - {cmd}")
         elif low == f"{self.prefix}clear":
             self.terminal.clear()
@@ -59,6 +65,71 @@ class ConnectionBuffer:
             self.serial.sim_play()
         elif low == f"{self.prefix}sim.stop":
             self.serial.sim_stop()
+        elif low == f"{self.prefix}panels":
+            for p in self.parent.graph_manager.panels.panels.values():
+                self.terminal.write(f" - {p.id} [{p.type}] {'shown' if p.visible else 'hidden'}: {', '.join(p.fields)}")
+        elif low.startswith(f"{self.prefix}panel.show ") or low.startswith(f"{self.prefix}panel.hide "):
+            pid = low.split(maxsplit=1)[1].strip(); on = low.startswith(f"{self.prefix}panel.show")
+            if self.parent.graph_manager.set_panel_visible(pid, on):
+                self.terminal.write(f"(OK) Panel {pid}: {'shown' if on else 'hidden'}")
+            else:
+                self.terminal.write(f"(!) Unknown panel '{pid}' - see /panels")
+        elif low == f"{self.prefix}timing":
+            for line in self.parent.graph_manager.timing.report():
+                self.terminal.write(line)
+        elif low.split()[0] == f"{self.prefix}find":
+            parts = text.split(maxsplit=1)
+            if len(parts) > 1: self.terminal.find(parts[1])
+            else: self.terminal.write("(!) Usage: /find <words>  (word* = prefix)")
+        elif low.split()[0] == f"{self.prefix}find.import":
+            parts = text.split(maxsplit=1)
+            folder = parts[1] if len(parts) > 1 else os.path.join(self.serial.logs_path, "BlackBox")
+            if self.terminal.search is None: self.terminal.write("(!) Search is disabled")
+            else: self.terminal.write(f"(OK) Indexing {self.terminal.search.import_blackbox(folder)} BlackBox segments in background")
+        elif low == f"{self.prefix}profile.start":
+            self.parent.diagnostics.start_profile()
+        elif low == f"{self.prefix}profile.stop":
+            self.parent.diagnostics.stop_profile()
+        elif low == f"{self.prefix}mem.snapshot":
+            self.parent.diagnostics.memory_snapshot()
+        elif low.split()[0] == f"{self.prefix}map.tiles":
+            parts = text.split(maxsplit=1)
+            if len(parts) > 1: self.parent.graph_manager.set_map_tiles(None if parts[1].strip().lower() == "off" else parts[1].strip())
+            else: self.terminal.write("(!) Usage: /map.tiles <file.mbtiles|off>")
+        elif low == f"{self.prefix}landing":
+            lp = self.parent.graph_manager.landing
+            if lp is None: self.terminal.write("(!) Landing prediction is disabled (graphs.landing.enable)")
+            elif lp.last is None: self.terminal.write("(!) No landing prediction yet (needs a descent with GPS fixes)")
+            else: self.terminal.write(lp.last.describe())
+        elif low.split()[0] == f"{self.prefix}compare":
+            args = text.split()[1:]
+            event = args.pop(0) if args and (args[0] in ("start", "launch", "apogee", "landed") or args[0].startswith("state:")) else None
+            from ddl.modules.acquisition.compare import parse_spec
+            paths = []    # `@N` / `@all`: which flight(s) of each file (default: the last Clear All segment)
+            for a in args or [os.path.join(self.serial.logs_path, "*.csv")]:
+                path, sel = parse_spec(a)
+                paths += [p + (f"@{sel}" if sel else "") for p in sorted(glob.glob(path)) or [path]]
+            self.parent.graph_manager.open_compare(list(dict.fromkeys(paths)), event)
+        elif low == f"{self.prefix}view":
+            gm = self.parent.graph_manager
+            for name, watch in (("window", gm.window_view), ("plots", gm.view), ("terminal", self.terminal.view)):
+                if watch is not None: self.terminal.write(watch.report(name))
+        elif low == f"{self.prefix}alarms":
+            for line in self.parent.alarm_manager.report():
+                self.terminal.write(line)
+        elif low.split()[0] == f"{self.prefix}stats":
+            parts = low.split()
+            try: self.parent.graph_manager.open_stats(float(parts[1]) if len(parts) > 1 else None)
+            except ValueError: self.terminal.write("(!) Usage: /stats [window seconds]")
+        elif low.split()[0] == f"{self.prefix}resume":
+            parts = text.split(maxsplit=1)
+            self.parent.graph_manager.resume(parts[1] if len(parts) > 1 else None)
+        elif low.split()[0] == f"{self.prefix}viewer":
+            parts = text.split(maxsplit=1)
+            self.parent.graph_manager.open_viewer(parts[1] if len(parts) > 1 else None)
+        elif low.split()[0] == f"{self.prefix}bench.render":
+            parts = text.split(maxsplit=1)
+            self.parent.graph_manager.run_render_benchmark(parts[1] if len(parts) > 1 else None)
 
         else:
             # raw send
@@ -68,7 +139,8 @@ class ConnectionBuffer:
     def update_ports(self, override_message=False):
         self.serial.update_ports()
     def connect(self):
-        if self.ui.btn_connect_serial.isChecked(): self.serial.connect()
+        if self.ui.btn_connect_serial.isChecked():
+            self.serial.connect(self.ui.cb_ports.currentText(), self.ui.cb_bauds.currentText())
         else: self.serial.disconnect()
     def toggle_recording(self):
         if self.ui.btn_togle_log.isChecked():
@@ -77,7 +149,5 @@ class ConnectionBuffer:
             self.serial._open_csv_if_needed()
         else:
             self.serial.record_enabled=False
-            try:
-                if getattr(self.serial, "csv_file", None): self.serial.csv_file.flush()
-            except: pass
+            self.serial.recorder.flush()
             self.terminal.write("(OK) Recording: OFF")
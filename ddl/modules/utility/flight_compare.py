@@ -0,0 +1,56 @@
+import time
+import pyqtgraph as pg
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+from ddl.modules.acquisition.compare import compare_flights
+from ddl.modules.utility.graph_types import MonoAxisPlotWidget, RPYPlotWidget
+
+FLIGHT_COLORS = ["#0A5", "#06C", "#C60", "#A0A", "#C00", "#088", "#660", "#555", "#E80", "#60C"]
+AXIS_STYLES = [Qt.SolidLine, Qt.DashLine, Qt.DotLine]
+
+
+class FlightCompare(QWidget):
+    """
+    Recorded flights overlaid on one time axis (seconds from the chosen event).
+    - one plot per panel spec, built from the live MonoAxis/RPY widget types
+    - one colour per flight; on R/P/Y plots the axis is the line style
+    - X axes linked, mouse zoom/pan on X, Y follows the visible data
+    """
+    def __init__(self, paths, panels, event="launch", dt=0.1, parent=None):
+        super().__init__(parent)
+        start = time.perf_counter()
+        channels = [f for spec in panels for f in spec.get("fields", [])[:3 if spec.get("type") == "rpy" else 1]]
+        self.cmp = compare_flights(paths, channels, event, dt)
+        load_ms = (time.perf_counter() - start) * 1000.0
+        self.setWindowTitle(f"Flight comparison - {len(self.cmp.names)} flights aligned on {event}"); self.resize(1200, 800)
+        self.layout_widget = pg.GraphicsLayoutWidget()
+        self.layout_widget.setAntialiasing(False)
+        self.info = QLabel("")
+        lay = QVBoxLayout(self); lay.addWidget(self.layout_widget); lay.addWidget(self.info)
+        self.plots = []
+        labels = {"bottom": f"Time from {event} (s)"}
+        for spec in panels:
+            rpy = spec.get("type") == "rpy"
+            fields = spec.get("fields", [])[:3 if rpy else 1]
+            if not fields: continue
+            title = spec.get("title", spec.get("id", fields[0]))
+            plot = RPYPlotWidget(title=title, labels=dict(labels)) if rpy else MonoAxisPlotWidget(title=title, labels=dict(labels))
+            self.layout_widget.addItem(plot)
+            if not self.plots: plot.addLegend(offset=(10, 10))
+            for k, name in enumerate(self.cmp.names):
+                color = FLIGHT_COLORS[k % len(FLIGHT_COLORS)]
+                for a, f in enumerate(fields):
+                    pen = pg.mkPen(color, width=1.5, style=AXIS_STYLES[a % 3])
+                    label = name if a == 0 and not self.plots else None
+                    plot.plot(self.cmp.grid, self.cmp.channels[f][k], pen=pen, connect="finite", name=label)
+            vb = plot.getViewBox()
+            vb.setMouseEnabled(x=True, y=False); vb.setAutoVisible(y=True); vb.enableAutoRange()
+            if self.plots: plot.setXLink(self.plots[0])
+            self.plots.append(plot)
+            self.layout_widget.nextRow()
+        skipped = f" | skipped: {', '.join(f'{p} ({why})' for p, why in self.cmp.skipped)}" if self.cmp.skipped else ""
+        offsets = ", ".join(f"{n} @ {t0:.1f} s" for n, t0 in zip(self.cmp.names, self.cmp.offsets))
+        self.info.setText(f"{len(self.cmp.grid)} grid points | loaded in {load_ms:.0f} ms | {offsets}{skipped}")
+        self.info.setWordWrap(True)
+        self.load_ms = load_ms
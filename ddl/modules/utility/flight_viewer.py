@@ -0,0 +1,66 @@
+import time
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+from ddl.modules.utility.graph_types import _mk_pen, AXIS_PEN, GRID_ALPHA
+
+
+class FlightViewer(QWidget):
+    """
+    Post-flight browser over a min/max Pyramid.
+    - one plot per panel spec (mono/rpy fields), X axes linked, mouse zoom/pan on X
+    - every view change is coalesced into one refresh that asks the pyramid for
+      one min/max record per pixel, so cost depends on the view width, not the recording length
+    """
+    def __init__(self, pyramid, panels, title="Flight viewer", parent=None):
+        super().__init__(parent)
+        self.pyr = pyramid
+        self.setWindowTitle(title); self.resize(1200, 800)
+        self.t0, self.t1 = pyramid.span()
+        self.layout_widget = pg.GraphicsLayoutWidget()
+        self.layout_widget.setAntialiasing(False)   # min/max strokes: AA only blurs them and costs a lot
+        self.info = QLabel("")
+        lay = QVBoxLayout(self); lay.addWidget(self.layout_widget); lay.addWidget(self.info)
+        self.curves = []     # (plot, curve, channel)
+        self.plots = []
+        for spec in panels:
+            fields = [f for f in spec.get("fields", []) if f in pyramid.index]
+            if not fields: continue
+            plot = self.layout_widget.addPlot(title=spec.get("title", fields[0]), labels={"bottom": "Session Time (s)"})
+            plot.showGrid(x=True, y=True, alpha=GRID_ALPHA)
+            plot.getAxis("bottom").setPen(AXIS_PEN); plot.getAxis("left").setPen(AXIS_PEN)
+            vb = plot.getViewBox()
+            vb.setMouseEnabled(x=True, y=False); vb.setAutoVisible(y=True); vb.enableAutoRange(axis="y")
+            colors = spec.get("colors") or ["#0A5", "#06C", "#C60"]
+            for i, f in enumerate(fields):
+                self.curves.append((plot, plot.plot(pen=_mk_pen(colors[i % len(colors)], 1), connect="finite"), f))
+            if self.plots: plot.setXLink(self.plots[0])
+            self.plots.append(plot)
+            self.layout_widget.nextRow()
+        self._refresh_pending = False
+        if self.plots:
+            self.plots[0].getViewBox().sigXRangeChanged.connect(self._schedule)
+            self.plots[0].setXRange(0.0, max(1.0, self.t1 - self.t0), padding=0)
+        self.refresh()
+
+    def _schedule(self, *_):
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self.refresh)
+
+    def refresh(self):
+        self._refresh_pending = False
+        if not self.plots: return
+        start = time.perf_counter()
+        vb = self.plots[0].getViewBox()
+        x0, x1 = vb.viewRange()[0]
+        budget = max(200, int(vb.width()))   # one min/max record (two vertices) per pixel
+        points = 0
+        for _plot, curve, ch in self.curves:
+            t, lo, hi = self.pyr.query(ch, x0 + self.t0, x1 + self.t0, budget)
+            curve.setData(np.repeat(t - self.t0, 2), np.column_stack((lo, hi)).ravel())
+            points += len(t)
+        ms = (time.perf_counter() - start) * 1000.0
+        self.info.setText(f"{self.pyr.samples} samples | view {x1 - x0:.1f} s | {points} records drawn | refresh {ms:.1f} ms")
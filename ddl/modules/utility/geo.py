@@ -0,0 +1,105 @@
+import math
+import numpy as np
+
+# WGS84 ellipsoid
+EARTH_A  = 6378137.0
+EARTH_E2 = 6.69437999014e-3
+
+
+class LocalTangentPlane:
+    """
+    Flat-earth ENU projection around a reference fix.
+    - accurate to well under a metre over a few km (typical CanSat recovery area)
+    - to_enu()/to_geodetic() work on floats and NumPy arrays alike
+    """
+    def __init__(self, lat0: float, lon0: float, alt0: float = 0.0):
+        self.lat0 = float(lat0); self.lon0 = float(lon0); self.alt0 = float(alt0)
+        s = math.sin(math.radians(self.lat0))
+        w = 1.0 - EARTH_E2 * s * s
+        # metres per degree along the meridian / the parallel at lat0
+        self.m_per_deg_lat = math.radians(EARTH_A * (1.0 - EARTH_E2) / (w ** 1.5))
+        self.m_per_deg_lon = math.radians(EARTH_A / math.sqrt(w) * math.cos(math.radians(self.lat0)))
+
+    def to_enu(self, lat, lon):
+        """(lat, lon) degrees -> (east, north) metres."""
+        return (lon - self.lon0) * self.m_per_deg_lon, (lat - self.lat0) * self.m_per_deg_lat
+
+    def to_geodetic(self, east, north):
+        """(east, north) metres -> (lat, lon) degrees."""
+        return self.lat0 + north / self.m_per_deg_lat, self.lon0 + east / self.m_per_deg_lon
+
+
+def distance_bearing(east: float, north: float):
+    """Ground distance (m) and true bearing (deg, 0=N, 90=E) of an ENU offset."""
+    return math.hypot(east, north), math.degrees(math.atan2(east, north)) % 360.0
+
+
+def valid_fix(lat: float, lon: float) -> bool:
+    """GPS modules report 0,0 until they have a fix."""
+    return abs(lat) > 0.0001 or abs(lon) > 0.0001
+
+
+def thin_track(east, north, tolerance: float):
+    """
+    Vectorized thinning of a long track (bulk loads): of consecutive points in the same
+    `tolerance`-sized grid cell only the first is kept; the last point is always kept.
+    """
+    if len(east) < 3 or tolerance <= 0: return east, north
+    cell = np.floor(np.column_stack((east, north)) / tolerance)
+    keep = np.empty(len(east), dtype=bool); keep[0] = keep[-1] = True
+    keep[1:-1] = (cell[1:-1] != cell[:-2]).any(axis=1)
+    return east[keep], north[keep]
+
+
+class PathSimplifier:
+    """
+    On-line polyline simplification (opening-window Douglas-Peucker).
+    - push() returns the vertices that became final (0 or 1 per call)
+    - every dropped point lies within `tolerance` of the kept polyline
+    - `max_window` bounds the per-point cost on long straight legs
+    """
+    def __init__(self, tolerance: float = 2.0, max_window: int = 256):
+        self.tolerance = float(tolerance)
+        self.max_window = int(max_window)
+        self.reset()
+
+    def reset(self):
+        self.anchor = None   # last committed vertex
+        self.window = []     # points since anchor; window[-1] is the floating end
+
+    @property
+    def tail(self):
+        """Current floating end point (not yet committed), or None."""
+        return self.window[-1] if self.window else None
+
+    def push(self, x: float, y: float):
+        p = (float(x), float(y))
+        if self.anchor is None:
+            self.anchor = p
+            return [p]
+        if len(self.window) < self.max_window and self._fits(self.anchor, p):
+            self.window.append(p)
+            return []
+        # the window cannot stretch to p: freeze its end as a vertex, restart from there
+        if not self.window:
+            self.anchor = p
+            return [p]
+        self.anchor = self.window[-1]
+        self.window = [p]
+        return [self.anchor]
+
+    def _fits(self, a, b):
+        ax, ay = a; dx = b[0] - ax; dy = b[1] - ay
+        seg2 = dx * dx + dy * dy
+        tol2 = self.tolerance * self.tolerance
+        for px, py in self.window:
+            qx = px - ax; qy = py - ay
+            if seg2 == 0.0:
+                d2 = qx * qx + qy * qy
+            else:
+                t = max(0.0, min(1.0, (qx * dx + qy * dy) / seg2))
+                ex = qx - t * dx; ey = qy - t * dy
+                d2 = ex * ex + ey * ey
+            if d2 > tol2:
+                return False
+        return True
@@ -1,19 +1,42 @@
+import sqlite3, warnings
 import pyqtgraph as pg
 import numpy as np
+from PyQt5.QtCore import Qt, QRectF
 from PyQt5.QtGui import QColor, QBrush
+from ddl.modules.utility.geo import LocalTangentPlane, PathSimplifier, distance_bearing, valid_fix, thin_track
 
 def _mk_pen(color_hex, width=3.5): return pg.mkPen(color_hex, width=width)
 AXIS_PEN = pg.mkPen('#222', width=2)
 GRID_ALPHA = 0.30
+# graphs.settings.cupy is a preference: without cupy pyqtgraph falls back to NumPy, but warns on every image render
+warnings.filterwarnings("ignore", message="cupy library could not be loaded")
 
-class MonoAxisPlotWidget(pg.PlotItem):
+def _finite_range(*arrays):
+    """(min, max) over the non-NaN values of store columns; (-1, 1) when there are none."""
+    lo = min((np.fmin.reduce(a) for a in arrays if len(a)), default=np.nan)
+    hi = max((np.fmax.reduce(a) for a in arrays if len(a)), default=np.nan)
+    return (float(lo), float(hi)) if np.isfinite(lo) and np.isfinite(hi) else (-1.0, 1.0)
+
+class _Deferred:
+    """update() always stores the sample; drawing is skipped while paused and done once on resume()."""
+    paused = False; stale = False
+    def pause(self): self.paused = True
+    def resume(self):
+        self.paused = False
+        if self.stale: self.stale = False; self.redraw()
+    def _draw(self):
+        if self.paused: self.stale = True
+        else: self.redraw()
+
+class MonoAxisPlotWidget(_Deferred, pg.PlotItem):
     def __init__(self, parent=None, labels=None, title=None,
                  color: str = "#0A5", enableMenu=False, mission_time_axis=False, **kargs):
         if labels is None: labels = {'bottom': 'Mission Time (s)'}
         super().__init__(parent=parent, labels=labels, title=title, enableMenu=enableMenu, **kargs)
         self.mission_time_axis = mission_time_axis
         self.x = []; self.y = []
-        self.curve = self.plot(pen=_mk_pen(color), antialias=True, connect='finite')
+        self.store = None; self.field = None
+        self.curve = self.plot(pen=_mk_pen(color), connect='finite')
         self.curve.pxMode = False
         fill_color = QColor(color); fill_color.setAlpha(24)
         self.curve.setFillBrush(QBrush(fill_color)); self.curve.setFillLevel(0)
@@ -23,15 +46,32 @@ class MonoAxisPlotWidget(pg.PlotItem):
         self.getViewBox().disableAutoRange(axis=None)  # manual control
         self.hideButtons(); self.getViewBox().setMouseEnabled(x=False, y=False)
 
+    def bind(self, store, fields):
+        """Draw from the shared TelemetryStore ("t" and fields[0] views) instead of own lists."""
+        self.store = store; self.field = fields[0]
+
     def reset(self):
         self.x.clear(); self.y.clear()
         self.curve.setData([], [])
         self.setXRange(0, 10, padding=0.01)  # initial
 
     def update(self, value, mission_time_s: float):
-        v = float(value)
-        self.x.append(max(0.0, float(mission_time_s)))
-        self.y.append(v)
+        if self.store is None:
+            v = float(value)
+            self.x.append(max(0.0, float(mission_time_s)))
+            self.y.append(v)
+        self._draw()
+
+    def load(self, t, values):
+        """Bulk history (arrays): appended in one go, drawn with one setData."""
+        if self.store is None:
+            self.x.extend(np.maximum(np.asarray(t, dtype=float), 0.0).tolist())
+            self.y.extend(np.asarray(values, dtype=float).tolist())
+        self._draw()
+
+    def redraw(self):
+        if self.store is not None: return self._redraw_store()
+        if not self.x: return
         self.curve.setData(self.x, self.y)
         # X axis 0..now (auto based on data)
         xmin = 0.0
@@ -40,12 +80,22 @@ class MonoAxisPlotWidget(pg.PlotItem):
         # Y range with margin
         ymin = min(self.y) if self.y else -1
         ymax = max(self.y) if self.y else 1
+        self._set_y(ymin, ymax)
+
+    def _redraw_store(self):
+        x, y = self.store.view("t"), self.store.view(self.field)
+        if y is None or not len(x): return
+        self.curve.setData(x, y)
+        self.setXRange(0.0, max(10.0, float(x[-1])), padding=0.02)
+        self._set_y(*_finite_range(y))
+
+    def _set_y(self, ymin, ymax):
         if ymin == ymax:
             ymin -= 1; ymax += 1
         yr = (ymax - ymin) * 0.10
         self.setYRange(ymin - yr, ymax + yr, padding=0.02)
 
-class RPYPlotWidget(pg.PlotItem):
+class RPYPlotWidget(_Deferred, pg.PlotItem):
     def __init__(self, parent=None, labels=None, title=None,
                  colors=("#0A5","#06C","#C60"), enableMenu=False, mission_time_axis=False, **kargs):
         if labels is None: labels = {'bottom': 'Mission Time (s)'}
@@ -53,7 +103,8 @@ class RPYPlotWidget(pg.PlotItem):
         self.colors = colors
         self.x = []
         self.y = [[],[],[]]
-        self.curves = [self.plot(pen=_mk_pen(c), antialias=True, connect='finite') for c in colors]
+        self.store = None; self.fields = None
+        self.curves = [self.plot(pen=_mk_pen(c), connect='finite') for c in colors]
         for c in self.curves: c.pxMode=False
         self.showGrid(x=True, y=True, alpha=GRID_ALPHA)
         self.getAxis('bottom').setPen(AXIS_PEN); self.getAxis('left').setPen(AXIS_PEN)
@@ -61,6 +112,10 @@ class RPYPlotWidget(pg.PlotItem):
         self.getViewBox().disableAutoRange(axis=None)
         self.hideButtons(); self.getViewBox().setMouseEnabled(x=False, y=False)
 
+    def bind(self, store, fields):
+        """Draw from the shared TelemetryStore ("t" and three field views) instead of own lists."""
+        self.store = store; self.fields = list(fields[:3])
+
     def reset(self):
         self.x.clear()
         for i in range(3): self.y[i].clear()
@@ -68,10 +123,23 @@ class RPYPlotWidget(pg.PlotItem):
         self.setXRange(0, 10, padding=0.01)
 
     def update(self, values3, mission_time_s: float):
-        r, p, y = [float(v) for v in values3]
-        t = max(0.0, float(mission_time_s))
-        self.x.append(t)
-        self.y[0].append(r); self.y[1].append(p); self.y[2].append(y)
+        if self.store is None:
+            r, p, y = [float(v) for v in values3]
+            t = max(0.0, float(mission_time_s))
+            self.x.append(t)
+            self.y[0].append(r); self.y[1].append(p); self.y[2].append(y)
+        self._draw()
+
+    def load(self, t, values3):
+        """Bulk history: t and three value arrays, one setData per curve."""
+        if self.store is None:
+            self.x.extend(np.maximum(np.asarray(t, dtype=float), 0.0).tolist())
+            for i in range(3): self.y[i].extend(np.asarray(values3[i], dtype=float).tolist())
+        self._draw()
+
+    def redraw(self):
+        if self.store is not None: return self._redraw_store()
+        if not self.x: return
         for i in range(3): self.curves[i].setData(self.x, self.y[i])
         xmin = 0.0; xmax = max(10.0, self.x[-1])
         self.setXRange(xmin, xmax, padding=0.02)
@@ -82,29 +150,328 @@ class RPYPlotWidget(pg.PlotItem):
             yr = (ymax - ymin) * 0.10
             self.setYRange(ymin - yr, ymax + yr, padding=0.02)
 
-class GpsPlotWidget(pg.PlotItem):
-    def __init__(self, parent=None, labels=None, title=None, color: str="#222", enableMenu=False, **kargs):
-        if labels is None: labels={'bottom':'Longitude','left':'Latitude'}
+    def _redraw_store(self):
+        x = self.store.view("t"); ys = [self.store.view(f) for f in self.fields]
+        if any(y is None for y in ys) or not len(x): return
+        for c, y in zip(self.curves, ys): c.setData(x, y)
+        self.setXRange(0.0, max(10.0, float(x[-1])), padding=0.02)
+        ymin, ymax = _finite_range(*ys)
+        if ymin == ymax: ymin -= 1; ymax += 1
+        yr = (ymax - ymin) * 0.10
+        self.setYRange(ymin - yr, ymax + yr, padding=0.02)
+
+class GpsPlotWidget(_Deferred, pg.PlotItem):
+    """
+    GPS track in local ENU metres relative to the first valid fix (the pad).
+    - stored vertices go through on-line path simplification (tolerance in m)
+    - view bounds are kept incrementally, never recomputed over the track
+    - title shows distance/bearing from the pad (and the predicted touchdown, if any)
+    - optional offline basemap from an MBTiles file (`tiles`: path, cache_tiles, budget_ms, opacity);
+      with a basemap the view can be panned / zoomed with the mouse
+    """
+    def __init__(self, parent=None, labels=None, title=None, color: str="#222", enableMenu=False,
+                 simplify_tolerance_m: float = 2.0, min_span_m: float = 50.0, tiles: dict = None, **kargs):
+        if labels is None: labels={'bottom':'East (m)','left':'North (m)'}
         super().__init__(parent=parent, labels=labels, title=title, enableMenu=enableMenu, **kargs)
-        self.x = []; self.y = []
-        self.track = self.plot(pen=_mk_pen(color, 2.5), antialias=True, connect='finite', symbol=None)
+        self.base_title = title or ""
+        self.min_span_m = float(min_span_m)
+        self.simplifier = PathSimplifier(simplify_tolerance_m)
+        self.origin = None                       # LocalTangentPlane of the pad
+        self.x = []; self.y = []                 # committed (simplified) vertices, metres
+        self.bounds = None                       # [xmin, xmax, ymin, ymax] over every raw fix
+        self._range_stale = False
+        self.distance_m = 0.0; self.bearing_deg = 0.0
+        self.last = None                         # latest fix (e, n)
+        self.track = self.plot(pen=_mk_pen(color, 2.5), connect='finite', symbol=None)
         self.track.pxMode=False
+        self.pad = pg.ScatterPlotItem(symbol='o', size=8, pen=pg.mkPen("#111"), brush=pg.mkBrush(None)); self.addItem(self.pad)
         self.scatter = pg.ScatterPlotItem(symbol='x', size=9, brush=pg.mkBrush("#111")); self.addItem(self.scatter)
+        self.prediction = None                   # landing.Prediction (touchdown point + ellipse)
+        self.touchdown = pg.ScatterPlotItem(symbol='t', size=11, pen=pg.mkPen("#C00"), brush=pg.mkBrush(None)); self.addItem(self.touchdown)
+        self.touchdown_ellipse = self.plot(pen=pg.mkPen("#C00", width=1.5, style=Qt.DashLine))
         self.showGrid(x=True, y=True, alpha=GRID_ALPHA)
         self.getAxis('bottom').setPen(AXIS_PEN); self.getAxis('left').setPen(AXIS_PEN)
         self.getAxis('bottom').setTextPen('#111'); self.getAxis('left').setTextPen('#111')
+        self.getViewBox().disableAutoRange(axis=None)
+        self.setAspectLocked(True)
         self.hideButtons(); self.getViewBox().setMouseEnabled(x=False, y=False)
+        self.tiles = None
+        if tiles and tiles.get("path"):
+            try: self.set_tiles(**tiles)
+            except (OSError, ValueError, sqlite3.Error) as e: print(f"[WARNING] GPS TILES - {e}")
+
+    def set_tiles(self, path, cache_tiles: int = 128, budget_ms: float = 8.0, opacity: float = 1.0):
+        """Put an MBTiles basemap under the track (replaces the previous one); raises if unreadable."""
+        from ddl.modules.utility.map_tiles import MBTiles, TileLayer
+        layer = TileLayer(MBTiles(path), lambda: self.origin, cache_tiles, budget_ms, opacity)
+        self.clear_tiles()
+        self.tiles = layer; self.addItem(layer)
+        vb = self.getViewBox()
+        vb.sigRangeChanged.connect(layer.refresh); vb.sigResized.connect(layer.refresh)
+        vb.setMouseEnabled(x=True, y=True)
+        layer.refresh()
+        return layer
+
+    def clear_tiles(self):
+        if self.tiles is None: return
+        vb = self.getViewBox()
+        vb.sigRangeChanged.disconnect(self.tiles.refresh); vb.sigResized.disconnect(self.tiles.refresh)
+        self.removeItem(self.tiles); self.tiles.close(); self.tiles = None
+        vb.setMouseEnabled(x=False, y=False)
 
     def reset(self):
+        self.origin = None; self.bounds = None; self.last = None; self._range_stale = False
+        self.simplifier.reset()
         self.x.clear(); self.y.clear()
-        self.track.setData([], []); self.scatter.setData([], [])
+        self.distance_m = 0.0; self.bearing_deg = 0.0
+        self.track.setData([], []); self.scatter.setData([], []); self.pad.setData([], [])
+        self.prediction = None; self.touchdown.setData([], []); self.touchdown_ellipse.setData([], [])
+        self.setTitle(self.base_title)
+        if self.tiles is not None: self.tiles.refresh()
 
     def update(self, latitude, longitude):
-        lon = float(longitude); lat = float(latitude)
-        self.x.append(lon); self.y.append(lat)
-        self.track.setData(self.x, self.y)
-        self.scatter.setData([lon], [lat], symbol='x')
-        if self.x and self.y:
-            x_range = (min(self.x) - 0.0004, max(self.x) + 0.0004)
-            y_range = (min(self.y) - 0.0004, max(self.y) + 0.0004)
-            self.setRange(xRange=x_range, yRange=y_range)
+        lat = float(latitude); lon = float(longitude)
+        if not valid_fix(lat, lon): return
+        if self.origin is None:
+            self.origin = LocalTangentPlane(lat, lon)
+            self.pad.setData([0.0], [0.0])
+        e, n = self.origin.to_enu(lat, lon)
+        for vx, vy in self.simplifier.push(e, n):
+            self.x.append(vx); self.y.append(vy)
+        self.last = (e, n)
+        if self._grow_bounds(e, n): self._range_stale = True
+        self.distance_m, self.bearing_deg = distance_bearing(e, n)
+        self._draw()
+
+    def load(self, latitude, longitude):
+        """
+        Bulk history of fixes (arrays): projected and thinned vectorized (consecutive fixes in the
+        same tolerance-sized cell collapse), then live updates continue from the last fix.
+        """
+        lat = np.asarray(latitude, dtype=float); lon = np.asarray(longitude, dtype=float)
+        ok = np.isfinite(lat) & np.isfinite(lon) & ((np.abs(lat) > 0.0001) | (np.abs(lon) > 0.0001))
+        lat = lat[ok]; lon = lon[ok]
+        if not len(lat): return
+        if self.origin is None:
+            self.origin = LocalTangentPlane(lat[0], lon[0])
+            self.pad.setData([0.0], [0.0])
+        e, n = self.origin.to_enu(lat, lon)
+        e, n = thin_track(e, n, self.simplifier.tolerance)
+        self.simplifier.reset(); self.simplifier.push(e[-1], n[-1])
+        self.x.extend(e[:-1].tolist()); self.y.extend(n[:-1].tolist())
+        self.last = (float(e[-1]), float(n[-1]))
+        b = [min(e.min(), 0.0), max(e.max(), 0.0), min(n.min(), 0.0), max(n.max(), 0.0)]
+        if self.bounds is not None:
+            b = [min(b[0], self.bounds[0]), max(b[1], self.bounds[1]), min(b[2], self.bounds[2]), max(b[3], self.bounds[3])]
+        self.bounds = b; self._range_stale = True
+        self.distance_m, self.bearing_deg = distance_bearing(*self.last)
+        self._draw()
+
+    def set_prediction(self, prediction):
+        """Predicted touchdown (landing.Prediction, placed by lat/lon) or None to hide it."""
+        if prediction is None and self.prediction is None: return
+        self.prediction = prediction
+        self._draw()
+
+    def redraw(self):
+        if self.last is None: return
+        e, n = self.last
+        tail = self.simplifier.tail
+        if tail is not None:
+            self.track.setData(self.x + [tail[0]], self.y + [tail[1]])
+        else:
+            self.track.setData(self.x, self.y)
+        self.scatter.setData([e], [n], symbol='x')
+        if self._range_stale:
+            self._range_stale = False
+            b = self.bounds
+            cx = (b[0] + b[1]) / 2; cy = (b[2] + b[3]) / 2
+            half = max(self.min_span_m, (b[1] - b[0]) * 1.1, (b[3] - b[2]) * 1.1) / 2
+            self.setRange(xRange=(cx - half, cx + half), yRange=(cy - half, cy + half), padding=0)
+        title = f"{self.base_title}  {self.distance_m:.0f} m @ {self.bearing_deg:03.0f}°"
+        pred = self.prediction
+        if pred is not None:
+            pe, pn = self.origin.to_enu(pred.lat, pred.lon)
+            self.touchdown.setData([pe], [pn]); self.touchdown_ellipse.setData(*pred.ellipse(64, pe, pn))
+            dist, brg = distance_bearing(pe, pn)
+            title += f"  | touchdown {dist:.0f} m @ {brg:03.0f}° in {pred.time_to_ground:.0f} s"
+        else:
+            self.touchdown.setData([], []); self.touchdown_ellipse.setData([], [])
+        self.setTitle(title)
+
+    def _grow_bounds(self, e, n):
+        """True when the bounds grew (the view range is then re-fitted on the next draw)."""
+        b = self.bounds
+        if b is None:
+            self.bounds = [min(e, 0.0), max(e, 0.0), min(n, 0.0), max(n, 0.0)]
+            return True
+        if b[0] <= e <= b[1] and b[2] <= n <= b[3]:
+            return False
+        if e < b[0]: b[0] = e
+        elif e > b[1]: b[1] = e
+        if n < b[2]: b[2] = n
+        elif n > b[3]: b[3] = n
+        return True
+
+class SpectrumPlotWidget(_Deferred, pg.PlotItem):
+    """
+    STFT waterfall of one or more channels (IMU vibration): x = frequency, y = time, newest line on top.
+    - per channel a sliding window of `nfft` samples; one Hann-windowed, mean-removed frame every `hop` samples
+    - every frame of a batch (all channels, all hops) goes through a single numpy.fft.rfft call;
+      channel powers are summed into one dB line
+    - the image is a ring of `lines` RGBA rows with a write index: a new line is coloured into one row and
+      nothing else is touched or transformed again; two ImageItems show the older and the newer part of
+      the ring (views, wrapped by Qt without a copy or a colour lookup), placed with setRect
+    - lines are kept as 8-bit codes over a span of 1.5 * range_db; levels follow the peak in steps of
+      range_db / 32 and such a step only recolours the codes through a 256-entry table
+    - bound to a TelemetryStore, new rows are read from its views when drawing: while paused they only
+      accumulate and are transformed in one batch on resume (older frames than the image shows are skipped)
+    - sample rate: `rate_hz`, or the median receive interval; `marker_field` * `marker_scale` draws a
+      frequency marker (e.g. the rotor rate)
+    """
+    def __init__(self, parent=None, title=None, nfft: int = 64, hop: int = 8, lines: int = 200, rate_hz=None,
+                 range_db: float = 60.0, colormap: str = "viridis", marker_field=None, marker_scale: float = 1.0,
+                 enableMenu=False, **kargs):
+        super().__init__(parent=parent, labels={'bottom': 'Frequency (Hz)', 'left': 'Time (s)'}, title=title,
+                         enableMenu=enableMenu, **kargs)
+        self.base_title = title or ""
+        self.nfft = max(8, int(nfft)); self.hop = max(1, int(hop)); self.lines = max(8, int(lines))
+        self.bins = self.nfft // 2 + 1
+        self.rate_cfg = float(rate_hz) if rate_hz else None
+        self.range_db = float(range_db)
+        self.marker_field = marker_field; self.marker_scale = float(marker_scale)
+        self.taper = np.hanning(self.nfft)
+        self.store = None; self.fields = []
+        self.img = np.zeros((self.lines, self.bins), np.float32)     # dB ring, row `row` = oldest line
+        self.code = np.zeros((self.lines, self.bins), np.uint8)      # the same ring as 8-bit codes
+        self.rgba = np.zeros((self.lines, self.bins), np.uint32)     # and coloured (RGBA bytes)
+        try: lut = pg.colormap.get(colormap).getLookupTable(nPts=256, alpha=True)
+        except Exception: lut = np.column_stack([np.arange(256)] * 3 + [np.full(256, 255)])
+        self.lut = np.ascontiguousarray(lut, np.uint8).view(np.uint32).ravel()
+        self.images = [pg.ImageItem(axisOrder='row-major'), pg.ImageItem(axisOrder='row-major')]   # older, newer part
+        for image in self.images: self.addItem(image)
+        self.marker = pg.InfiniteLine(angle=90, pen=pg.mkPen("#F33", width=1.5, style=Qt.DashLine))
+        self.marker.hide(); self.addItem(self.marker)
+        self.getAxis('bottom').setPen(AXIS_PEN); self.getAxis('left').setPen(AXIS_PEN)
+        self.getAxis('bottom').setTextPen('#111'); self.getAxis('left').setTextPen('#111')
+        self.hideButtons(); self.getViewBox().setMouseEnabled(x=False, y=False)
+        self.reset()
+
+    @property
+    def nbytes(self): return self.img.nbytes + self.code.nbytes + self.rgba.nbytes + self.buf.nbytes
+
+    def bind(self, store, fields):
+        """Read new samples of `fields` from the shared TelemetryStore instead of update() values."""
+        self.store = store; self.fields = list(fields); self.next = 0
+        self.buf = np.zeros((len(self.fields), 0))
+
+    def reset(self):
+        self.buf = np.zeros((len(self.fields), 0)); self.next = 0
+        self.pending = []; self.pending_t = []
+        self.t_tail = np.zeros(0); self.rate = self.rate_cfg
+        self.top = None; self.filled = 0; self.peak_hz = None
+        self.row = 0; self.anchor = None; self.levels = None; self.title = None
+        self.img.fill(0.0); self.code.fill(0); self.rgba.fill(0); self.marker.hide()
+        for image in self.images: image.clear()
+        self.setTitle(self.base_title); self._place()
+
+    def update(self, values, mission_time_s: float):
+        if self.store is None:
+            self.pending.append([float(v) for v in values]); self.pending_t.append(float(mission_time_s))
+        self._draw()
+
+    def load(self, t, values):
+        """Bulk history (resume): transformed in one batch; only what fits in the image is kept."""
+        if self.store is None:
+            keep = (self.lines + 1) * self.hop + self.nfft
+            self.pending += np.column_stack(values)[-keep:].tolist(); self.pending_t += np.asarray(t)[-keep:].tolist()
+        self._draw()
+
+    def redraw(self):
+        t, new = self._take()
+        if new.shape[1]:
+            self._estimate_rate(t)
+            self._transform(new)
+        if self.marker_field is not None and self.store is not None:
+            try: self.marker.setValue(float(self.store.last.get(self.marker_field)) * self.marker_scale); self.marker.show()
+            except (TypeError, ValueError): pass
+
+    # INTERNAL
+    def _take(self):
+        """(times, channels x samples) received since the last draw."""
+        if self.store is None:
+            if not self.pending: return np.zeros(0), np.zeros((0, 0))
+            t = np.asarray(self.pending_t); new = np.asarray(self.pending, dtype=float).T
+            self.pending = []; self.pending_t = []
+            if len(self.buf) != len(new): self.buf = np.zeros((len(new), 0))
+            return t, new
+        n = len(self.store)
+        if n < self.next: self.next = 0; self.buf = self.buf[:, :0]       # store was cleared
+        start = max(self.next, n - ((self.lines + 1) * self.hop + self.nfft))
+        if start > self.next: self.buf = self.buf[:, :0]     # rows skipped: the window restarts after them
+        self.next = n
+        t = self.store.view("t", start, n)
+        cols = [self.store.view(f, start, n) for f in self.fields]
+        return t, np.vstack([c if c is not None else np.full(n - start, np.nan) for c in cols])
+
+    def _estimate_rate(self, t):
+        if self.rate_cfg: return
+        self.t_tail = np.concatenate((self.t_tail, t))[-256:]
+        if len(self.t_tail) < 8: return
+        dt = np.median(np.diff(self.t_tail))
+        if dt > 0 and (self.rate is None or abs(1.0 / dt - self.rate) > 0.05 * self.rate):
+            self.rate = 1.0 / dt; self._place()
+
+    def _transform(self, new):
+        from numpy.lib.stride_tricks import sliding_window_view
+        buf = np.concatenate((self.buf, new), axis=1)
+        count = (buf.shape[1] - self.nfft) // self.hop + 1 if buf.shape[1] >= self.nfft else 0
+        if count <= 0: self.buf = buf; return
+        skip = max(0, count - self.lines)                                   # frames that would scroll out at once
+        frames = sliding_window_view(buf[:, skip * self.hop:], self.nfft, axis=1)[:, ::self.hop][:, :count - skip]
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)                 # all-NaN frames (channel absent)
+            frames = np.nan_to_num(frames - np.nanmean(frames, axis=2, keepdims=True))
+        spec = np.fft.rfft(frames * self.taper, axis=2)
+        power = (spec.real ** 2 + spec.imag ** 2).sum(axis=0)               # (frames, bins)
+        db = (10.0 * np.log10(power + 1e-12)).astype(np.float32)
+        self.buf = buf[:, count * self.hop:]
+        self._push_lines(db)
+
+    def _push_lines(self, db):
+        k = len(db)
+        rows = (self.row + np.arange(k)) % self.lines                      # ring: overwrite the k oldest rows
+        self.img[rows] = db; self.row = (self.row + k) % self.lines
+        self.filled = min(self.lines, self.filled + k)
+        peak = float(db.max())
+        self.top = peak if self.top is None else max(peak, self.top - 0.5 * k)
+        self.peak_hz = float(np.argmax(db[-1])) * (self.rate or 1.0) / self.nfft
+        if self.anchor is None or abs(self.top - self.anchor) > self.range_db / 4:     # peak left the span: re-code all
+            self.anchor = self.top; self.levels = None; rows = slice(None)
+        base = self.anchor - 1.25 * self.range_db; step = 1.5 * self.range_db / 255
+        self.code[rows] = np.clip((self.img[rows] - base) / step, 0, 255)
+        if self.levels is None or abs(self.top - self.levels[1]) > self.range_db / 32:
+            self.levels = (self.top - self.range_db, self.top); rows = slice(None)     # level step: recolour all
+            lo, hi = self.levels
+            self.colours = self.lut[np.clip((base + step * np.arange(256) - lo) * (255 / (hi - lo)), 0, 255).astype(np.uint8)]
+        self.rgba[rows] = np.take(self.colours, self.code[rows])
+        rgba = self.rgba.view(np.uint8).reshape(self.lines, self.bins, 4)
+        for image, part in zip(self.images, (rgba[self.row:], rgba[:self.row])):    # views, oldest line first
+            if len(part): image.setImage(part, autoLevels=False)
+            image.setVisible(len(part) > 0)
+        self._stack()
+        title = f"{self.base_title} | peak {self.peak_hz:.2f} {'Hz' if self.rate else 'cycles/sample'}"
+        if title != self.title: self.title = title; self.setTitle(title)
+
+    def _place(self):
+        fs = self.rate or 1.0
+        self._stack()
+        self.setXRange(0.0, fs / 2, padding=0.0); self.setYRange(-self.lines * self.hop / fs, 0.0, padding=0.0)
+
+    def _stack(self):
+        """Older part of the ring below the newer one, newest line at t = 0."""
+        fs = self.rate or 1.0
+        df = fs / self.nfft; dt = self.hop / fs
+        n_new = self.row; n_old = self.lines - n_new
+        for image, y, n in zip(self.images, (-self.lines * dt, -n_new * dt), (n_old, n_new)):
+            if n and image.image is not None: image.setRect(QRectF(-df / 2, y, df * self.bins, n * dt))
@@ -0,0 +1,156 @@
+"""
+Touchdown prediction during descent (Qt-free).
+
+ALTITUDE and the ENU-projected GPS fix are each fitted with a straight line in time by
+exponentially weighted least squares (time constant `tau_s`). The fit is kept as a few
+running weighted sums that are decayed and shifted to the newest sample, so every packet
+costs the same handful of multiplications however long the descent is.
+
+Extrapolating the horizontal lines to the time the altitude line reaches the ground gives
+the touchdown point; its covariance combines the fit uncertainty of the position/drift lines
+and of the time to ground (delta method), drawn as a `confidence` ellipse.
+"""
+import math
+
+from ddl.modules.utility.geo import LocalTangentPlane, distance_bearing, valid_fix
+
+CHI2_2D = {0.5: 1.386, 0.68: 2.279, 0.9: 4.605, 0.95: 5.991, 0.99: 9.210}
+
+
+class WeightedLine:
+    """y = a + b u with u = t - t_last, fitted to several y channels sharing the same t."""
+    def __init__(self, channels: int):
+        self.k = channels
+        self.w = self.u = self.uu = 0.0
+        self.y = [0.0] * channels; self.uy = [0.0] * channels
+        self.yy = [[0.0] * channels for _ in range(channels)]
+        self.t = None
+
+    def add(self, t: float, values, tau: float):
+        if self.t is not None:
+            d = t - self.t
+            f = math.exp(-max(d, 0.0) / tau)
+            # shift u to the new sample time, then decay every sum
+            self.uu = (self.uu - 2 * d * self.u + d * d * self.w) * f
+            self.uy = [(uy - d * y) * f for uy, y in zip(self.uy, self.y)]
+            self.u = (self.u - d * self.w) * f
+            self.w *= f; self.y = [y * f for y in self.y]
+            self.yy = [[v * f for v in row] for row in self.yy]
+        self.t = t
+        self.w += 1.0
+        for i, v in enumerate(values):
+            self.y[i] += v
+            row = self.yy[i]
+            for j, v2 in enumerate(values): row[j] += v * v2
+
+    def solve(self):
+        """((a, b) per channel, residual covariance k x k, inverse normal matrix) or None if degenerate."""
+        det = self.w * self.uu - self.u * self.u
+        if self.w < 3.0 or det <= 1e-9 * max(self.w * self.uu, 1e-12): return None
+        inv = (self.uu / det, -self.u / det, self.w / det)        # [[p, q], [q, r]] of (XᵀWX)^-1
+        coef = []
+        for y, uy in zip(self.y, self.uy):
+            coef.append(((self.uu * y - self.u * uy) / det, (self.w * uy - self.u * y) / det))
+        dof = max(self.w - 2.0, 1.0)
+        res = [[(self.yy[i][j] - coef[i][0] * self.y[j] - coef[i][1] * self.uy[j]) / dof
+                for j in range(self.k)] for i in range(self.k)]
+        for i in range(self.k): res[i][i] = max(res[i][i], 0.0)
+        return coef, res, inv
+
+
+class Prediction:
+    """Predicted touchdown: lat/lon, ENU offset from the pad, ellipse (semi-axes m, angle deg from east)."""
+    def __init__(self, lat, lon, east, north, cov, confidence, time_to_ground, descent_rate, drift):
+        self.lat = lat; self.lon = lon; self.east = east; self.north = north
+        self.cov = cov; self.confidence = confidence
+        self.time_to_ground = time_to_ground; self.descent_rate = descent_rate; self.drift = drift
+        s = CHI2_2D.get(confidence, CHI2_2D[0.95])
+        (vee, ven), (_, vnn) = cov
+        mid = (vee + vnn) / 2; rad = math.hypot((vee - vnn) / 2, ven)
+        self.axes = (math.sqrt(s * max(mid + rad, 0.0)), math.sqrt(s * max(mid - rad, 0.0)))
+        self.angle_deg = math.degrees(0.5 * math.atan2(2 * ven, vee - vnn))
+
+    def ellipse(self, points: int = 64, east=None, north=None):
+        """Closed outline in ENU metres around (east, north), the predicted point by default."""
+        east = self.east if east is None else east; north = self.north if north is None else north
+        a, b = self.axes; th = math.radians(self.angle_deg); c, s = math.cos(th), math.sin(th)
+        xs = []; ys = []
+        for i in range(points + 1):
+            p = 2 * math.pi * i / points
+            x, y = a * math.cos(p), b * math.sin(p)
+            xs.append(east + x * c - y * s); ys.append(north + x * s + y * c)
+        return xs, ys
+
+    def describe(self):
+        dist, brg = distance_bearing(self.east, self.north)
+        speed, heading = self.drift
+        return (f"[LANDING] {self.lat:.6f}, {self.lon:.6f} ({dist:.0f} m @ {brg:03.0f}° from pad) in {self.time_to_ground:.0f} s | "
+                f"descent {self.descent_rate:.1f} m/s, drift {speed:.1f} m/s to {heading:03.0f}° | "
+                f"{self.confidence:.0%} ellipse {self.axes[0]:.0f} x {self.axes[1]:.0f} m")
+
+
+class LandingPredictor:
+    """
+    Per-packet update(t, altitude, lat, lon) -> Prediction or None.
+    - predicts only in `states` (any state when empty) while the fitted descent rate exceeds `min_descent_mps`
+    - ground: `ground_altitude_m`, or the first altitude seen (ALTITUDE is relative to the pad)
+    - the horizontal fit needs valid GPS fixes; packets without one still refine the altitude line
+    """
+    def __init__(self, tau_s: float = 20.0, min_descent_mps: float = 1.0, states=(),
+                 confidence: float = 0.95, ground_altitude_m=None):
+        self.tau = float(tau_s); self.min_descent = float(min_descent_mps)
+        self.states = set(states or ()); self.confidence = float(confidence)
+        self.ground_cfg = ground_altitude_m
+        self.reset()
+
+    @classmethod
+    def from_config(cls, cfg: dict):
+        """graphs.landing section; None when disabled."""
+        cfg = cfg or {}
+        if not cfg.get("enable", True): return None
+        return cls(float(cfg.get("tau_s", 20.0)), float(cfg.get("min_descent_mps", 1.0)), cfg.get("states") or (),
+                   float(cfg.get("confidence", 0.95)), cfg.get("ground_altitude_m"))
+
+    def reset(self):
+        self.alt = WeightedLine(1); self.pos = WeightedLine(2)
+        self.origin = None; self.last = None
+        self.ground = None if self.ground_cfg is None else float(self.ground_cfg)
+
+    def seed(self, altitude, lat, lon):
+        """Pad reference (ground, GPS origin) from a whole session's columns, e.g. before replaying only its tail."""
+        if self.ground is None: self.ground = next((float(a) for a in altitude if math.isfinite(a)), None)
+        if self.origin is None:
+            fix = next(((float(a), float(b)) for a, b in zip(lat, lon) if valid_fix(a, b)), None)
+            if fix: self.origin = LocalTangentPlane(*fix)
+
+    def update(self, t: float, altitude: float, lat: float, lon: float, state: str = ""):
+        if not math.isfinite(altitude): return self.last
+        if self.ground is None: self.ground = altitude
+        self.alt.add(t, (altitude,), self.tau)
+        if valid_fix(lat, lon):
+            if self.origin is None: self.origin = LocalTangentPlane(lat, lon)
+            self.pos.add(t, self.origin.to_enu(lat, lon), self.tau)
+        if self.states and state not in self.states:
+            self.last = None; return None
+        self.last = self._predict(t)
+        return self.last
+
+    def _predict(self, t):
+        za = self.alt.solve(); hp = self.pos.solve()
+        if za is None or hp is None: return None
+        ((a_z, b_z),), ((s_z,),), (p, q, r) = za
+        if -b_z < self.min_descent: return None
+        h = a_z - self.ground
+        # time to ground measured from the newest altitude sample, then from the newest fix
+        T = max(h / -b_z, 0.0)
+        var_T = (p * s_z) / b_z ** 2 + (h / b_z ** 2) ** 2 * (r * s_z) + 2 * (-1 / b_z) * (h / b_z ** 2) * (q * s_z)
+        tp = T + (self.alt.t - self.pos.t)
+        (ae, be), (an, bn) = hp[0]; res = hp[1]; hp_p, hp_q, hp_r = hp[2]
+        f = hp_p + 2 * tp * hp_q + tp * tp * hp_r                  # [1, tp] (XᵀWX)^-1 [1, tp]ᵀ
+        vt = max(var_T, 0.0)
+        cov = ((res[0][0] * f + be * be * vt, res[0][1] * f + be * bn * vt),
+               (res[1][0] * f + bn * be * vt, res[1][1] * f + bn * bn * vt))
+        east = ae + be * tp; north = an + bn * tp
+        lat, lon = self.origin.to_geodetic(east, north)
+        drift = (math.hypot(be, bn), math.degrees(math.atan2(be, bn)) % 360.0)
+        return Prediction(lat, lon, east, north, cov, self.confidence, T, -b_z, drift)
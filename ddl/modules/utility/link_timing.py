@@ -0,0 +1,84 @@
+from collections import deque
+import numpy as np
+
+
+def _mission_seconds(hms):
+    try:
+        h, m, s = str(hms).split(":")
+        return int(h) * 3600 + int(m) * 60 + float(s)
+    except (ValueError, AttributeError):
+        return None
+
+
+class LinkTiming:
+    """
+    Link timing from the monotonic receive stamps (RX_TIME) of the last `window` packets.
+    - interval: receive-to-receive spacing; jitter is its deviation from the median interval
+    - latency: receive stamp -> panels updated in the GUI (queueing + parsing + setData)
+    - drift: least-squares slope of MISSION_TIME against receive time, in ppm
+      (MISSION_TIME has 1 s resolution, so it needs a few minutes of packets to settle)
+    """
+    def __init__(self, window: int = 2000):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.last_rx = None
+        self.intervals = deque(maxlen=self.window)
+        self.latencies = deque(maxlen=self.window)
+        self.clock = deque(maxlen=self.window)   # (rx, mission seconds, unwrapped)
+        self._day = 0.0; self._prev_ms = None
+
+    def arrival(self, rx: float, mission_time=None) -> float:
+        """Record a packet's receive stamp; returns the interval since the previous one (0 for the first)."""
+        dt = 0.0 if self.last_rx is None else max(0.0, rx - self.last_rx)
+        if self.last_rx is not None: self.intervals.append(dt)
+        self.last_rx = rx
+        ms = _mission_seconds(mission_time)
+        if ms is not None:
+            if self._prev_ms is not None and ms < self._prev_ms - 43200: self._day += 86400.0   # UTC midnight
+            self._prev_ms = ms
+            self.clock.append((rx, ms + self._day))
+        return dt
+
+    def rendered(self, rx: float, now: float):
+        self.latencies.append(now - rx)
+
+    def drift_ppm(self):
+        """Mission clock rate vs. receiver monotonic clock (None until 60 s of samples)."""
+        if len(self.clock) < 10: return None
+        c = np.asarray(self.clock)
+        if c[-1, 0] - c[0, 0] < 60.0: return None
+        slope = np.polyfit(c[:, 0] - c[0, 0], c[:, 1] - c[0, 1], 1)[0]
+        return (slope - 1.0) * 1e6
+
+    def summary(self) -> dict:
+        out = {"packets": len(self.intervals) + (self.last_rx is not None)}
+        if self.latencies:
+            lat = np.asarray(self.latencies) * 1000.0
+            out["latency_ms"] = {"p50": float(np.percentile(lat, 50)), "p95": float(np.percentile(lat, 95)),
+                                 "p99": float(np.percentile(lat, 99)), "max": float(lat.max())}
+        if self.intervals:
+            iv = np.asarray(self.intervals) * 1000.0
+            med = float(np.median(iv)); jit = np.abs(iv - med)
+            out["interval_ms"] = {"median": med, "mean": float(iv.mean()), "std": float(iv.std())}
+            out["jitter_ms"] = {"p50": float(np.percentile(jit, 50)), "p95": float(np.percentile(jit, 95)),
+                                "max": float(jit.max())}
+        out["drift_ppm"] = self.drift_ppm()
+        return out
+
+    def report(self):
+        """Terminal lines for /timing."""
+        s = self.summary()
+        lines = [f"(OK) Link timing over last {s['packets']} packets"]
+        if "latency_ms" in s:
+            l = s["latency_ms"]
+            lines.append(f" - rx->render: p50 {l['p50']:.2f} ms | p95 {l['p95']:.2f} | p99 {l['p99']:.2f} | max {l['max']:.2f}")
+        if "interval_ms" in s:
+            i = s["interval_ms"]; j = s["jitter_ms"]
+            lines.append(f" - interval: median {i['median']:.1f} ms | mean {i['mean']:.1f} | std {i['std']:.1f}")
+            lines.append(f" - jitter: p50 {j['p50']:.2f} ms | p95 {j['p95']:.2f} | max {j['max']:.2f}")
+        d = s["drift_ppm"]
+        lines.append(f" - clock drift (MISSION_TIME vs rx): {d:+.0f} ppm" if d is not None
+                     else " - clock drift: needs 60 s of packets with MISSION_TIME")
+        return lines
@@ -0,0 +1,168 @@
+"""
+Offline basemap for the GPS panel from a local MBTiles file (SQLite, XYZ/TMS raster tiles).
+
+- only tiles intersecting the view are read, at the zoom whose resolution matches the screen
+- decoded tiles live in a bounded LRU keyed by (z, x, y): memory stays under `cache_tiles` tiles
+- reading + decoding runs in GUI-thread slices of `budget_ms`, so panning never blocks on a
+  burst of missing tiles (they appear as they arrive)
+"""
+import os, math, time, sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+import pyqtgraph as pg
+from PyQt5.QtCore import QRectF, QTimer
+from PyQt5.QtGui import QImage
+
+WEB_MERCATOR_M_PER_PX = 156543.03392804097   # ground metres per 256-px tile pixel at z=0, equator
+MISSING = object()                            # cached "no tile here" so empty areas are not re-queried
+
+
+def tile_xy(lat: float, lon: float, z: int):
+    """Fractional slippy-map (XYZ) tile coordinates of a point."""
+    n = 1 << z
+    lat = max(-85.0511, min(85.0511, lat))
+    x = (lon + 180.0) / 360.0 * n
+    y = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n
+    return x, y
+
+
+def tile_bounds(z: int, x: int, y: int):
+    """(north lat, west lon, south lat, east lon) of an XYZ tile."""
+    n = 1 << z
+    lat = lambda ty: math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ty / n))))
+    return lat(y), x / n * 360.0 - 180.0, lat(y + 1), (x + 1) / n * 360.0 - 180.0
+
+
+def zoom_for(m_per_px: float, lat: float, zmin: int, zmax: int) -> int:
+    """Zoom whose tile pixels are closest to one screen pixel."""
+    res = WEB_MERCATOR_M_PER_PX * math.cos(math.radians(lat))
+    z = round(math.log2(res / max(m_per_px, 1e-6))) if res > 0 else zmax
+    return int(max(zmin, min(zmax, z)))
+
+
+class MBTiles:
+    """Read-only MBTiles file: tile(z, x, y) with XYZ rows (the file stores TMS rows)."""
+    def __init__(self, path: str):
+        if not os.path.isfile(path): raise FileNotFoundError(path)
+        self.path = path
+        self.db = sqlite3.connect(Path(path).absolute().as_uri() + "?mode=ro", uri=True)
+        self.meta = dict(self.db.execute("SELECT name, value FROM metadata").fetchall())
+        try:
+            self.minzoom = int(self.meta["minzoom"]); self.maxzoom = int(self.meta["maxzoom"])
+        except (KeyError, ValueError):
+            self.minzoom, self.maxzoom = self.db.execute("SELECT MIN(zoom_level), MAX(zoom_level) FROM tiles").fetchone()
+            if self.minzoom is None: raise ValueError(f"{path}: no tiles")
+
+    def tile(self, z: int, x: int, y: int):
+        row = self.db.execute("SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                              (z, x, (1 << z) - 1 - y)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self.db.close()
+
+
+class TileCache:
+    """Bounded LRU of decoded tiles; hits/misses for diagnostics."""
+    def __init__(self, max_tiles: int = 128):
+        self.max_tiles = max(1, int(max_tiles))
+        self.items = OrderedDict()
+        self.hits = 0; self.misses = 0
+
+    def __contains__(self, key): return key in self.items
+    def __len__(self): return len(self.items)
+
+    def get(self, key):
+        img = self.items.get(key)
+        if img is None: self.misses += 1; return None
+        self.items.move_to_end(key); self.hits += 1
+        return img
+
+    def put(self, key, img):
+        self.items[key] = img; self.items.move_to_end(key)
+        while len(self.items) > self.max_tiles: self.items.popitem(last=False)
+
+    def clear(self): self.items.clear()
+
+    @property
+    def nbytes(self):
+        return sum(img.sizeInBytes() for img in self.items.values() if img is not MISSING)
+
+
+class TileLayer(pg.GraphicsObject):
+    """
+    Basemap item for a ViewBox in local ENU metres; `origin()` returns the LocalTangentPlane
+    (None until the first fix). Tile rectangles are placed through that projection.
+    """
+    def __init__(self, source: MBTiles, origin, cache_tiles: int = 128, budget_ms: float = 8.0, opacity: float = 1.0):
+        super().__init__()
+        self.source = source; self.origin = origin
+        self.cache = TileCache(cache_tiles)
+        self.max_view = max(1, self.cache.max_tiles // 2)    # the view never thrashes its own cache
+        self.budget = budget_ms / 1000.0
+        self.view_tiles = []          # [(key, QRectF)] currently in view
+        self.pending = []             # keys in view, not cached yet (nearest to the centre first)
+        self.zoom = None
+        self._bounds = QRectF()
+        self._timer = QTimer(); self._timer.setSingleShot(True); self._timer.timeout.connect(self._load_some)
+        self.setZValue(-100); self.setOpacity(opacity)
+
+    def boundingRect(self): return self._bounds
+
+    def paint(self, p, *args):
+        for key, rect in self.view_tiles:
+            img = self.cache.get(key)
+            if img is None or img is MISSING: continue
+            # ViewBox y points north, image rows point south
+            p.save()
+            p.translate(rect.left(), rect.bottom())
+            p.scale(rect.width() / img.width(), -rect.height() / img.height())
+            p.drawImage(0, 0, img)
+            p.restore()
+
+    def refresh(self):
+        """View or origin changed: pick the zoom, list the tiles in view, queue the missing ones."""
+        vb = self.getViewBox(); origin = self.origin()
+        if vb is None or origin is None:
+            self.view_tiles = []; self.pending = []; self.update(); return
+        (x0, x1), (y0, y1) = vb.viewRange()
+        lat_c, _ = origin.to_geodetic((x0 + x1) / 2, (y0 + y1) / 2)
+        z = zoom_for((x1 - x0) / max(vb.width(), 1.0), lat_c, self.source.minzoom, self.source.maxzoom)
+        lat_n, lon_w = origin.to_geodetic(x0, y1); lat_s, lon_e = origin.to_geodetic(x1, y0)
+        while True:
+            n = 1 << z
+            fx0, fy0 = tile_xy(lat_n, lon_w, z); fx1, fy1 = tile_xy(lat_s, lon_e, z)
+            tx0, ty0 = max(0, int(fx0)), max(0, int(fy0)); tx1, ty1 = min(n - 1, int(fx1)), min(n - 1, int(fy1))
+            if (tx1 - tx0 + 1) * (ty1 - ty0 + 1) <= self.max_view or z <= self.source.minzoom: break
+            z -= 1
+        cx, cy = (fx0 + fx1) / 2, (fy0 + fy1) / 2
+        keys = sorted(((z, tx, ty) for tx in range(tx0, tx1 + 1) for ty in range(ty0, ty1 + 1)),
+                      key=lambda k: (k[1] + 0.5 - cx) ** 2 + (k[2] + 0.5 - cy) ** 2)[:self.max_view]
+        self.zoom = z
+        self.view_tiles = [(k, self._rect(origin, k)) for k in keys]
+        self.pending = [k for k in keys if k not in self.cache]
+        self.prepareGeometryChange()
+        self._bounds = QRectF(x0, y0, x1 - x0, y1 - y0)
+        self.update()
+        if self.pending and not self._timer.isActive(): self._timer.start(0)
+
+    def _rect(self, origin, key):
+        north, west, south, east = tile_bounds(*key)
+        e0, n0 = origin.to_enu(south, west); e1, n1 = origin.to_enu(north, east)
+        return QRectF(e0, n0, e1 - e0, n1 - n0)
+
+    def _load_some(self):
+        end = time.perf_counter() + self.budget
+        while self.pending and time.perf_counter() < end:
+            key = self.pending.pop(0)
+            if key in self.cache: continue
+            try: data = self.source.tile(*key)
+            except sqlite3.Error: data = None
+            img = QImage.fromData(data) if data else QImage()
+            self.cache.put(key, MISSING if img.isNull() else img.convertToFormat(QImage.Format_ARGB32_Premultiplied))
+        self.update()
+        if self.pending: self._timer.start(0)
+
+    def close(self):
+        self._timer.stop(); self.cache.clear(); self.source.close()
@@ -0,0 +1,301 @@
+"""
+Microbenchmarks of the per-packet hot paths, with stored baselines.
+
+Each case is timed like timeit: calls are batched until one round takes
+`--round-ms`, the median of `--repeat` rounds is the per-call time. Results
+are compared with a JSON baseline; a case slower than baseline * (1 + tolerance)
+is a regression and makes the run exit with status 1.
+
+    python -m ddl.modules.utility.microbench                      # compare with saves/microbench.json
+    python -m ddl.modules.utility.microbench --save               # (re)write the baseline
+    python -m ddl.modules.utility.microbench --only widget --tolerance 0.5
+
+Runs offscreen (QT_QPA_PLATFORM=offscreen unless already set).
+"""
+import os, sys, json, time, shutil, tempfile, argparse, platform, statistics
+from datetime import datetime
+
+HISTORY = (1000, 10000, 100000)
+DEFAULT_BASELINE = "./saves/microbench.json"
+
+
+# ---------- cases ----------
+def _packet(n=1):
+    from ddl.modules.acquisition.standin import synthetic_packet
+    return synthetic_packet(n, "1043")
+
+def _line(d):
+    from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+    return ",".join(str(d[k]) for k in REQUIRED_FIELDS)
+
+class _NullRecorder:
+    def raw(self, line, t=None): pass
+    def write_row(self, data): pass
+    def mark_clear(self): pass
+
+
+def case_parse(protocol="ascii", integrity="none"):
+    """AcquisitionCore.handle / feed: the per-frame work of read_serial (no port, no files)."""
+    from ddl.modules.acquisition.core import AcquisitionCore
+    core = AcquisitionCore.from_config(_NullRecorder(), {"protocol": protocol, "integrity": {"mode": integrity}}, "1043")
+    d = _packet()
+    if core.codec is not None:
+        chunk = core.codec.encode(d)
+        return lambda: core.feed(chunk, 0.0)
+    line = _line(d)
+    if core.checker is not None: line = core.checker.seal(line)
+    raw = (line + "\r\n").encode()
+    return lambda: core.handle(raw, 0.0)
+
+
+def case_csv_row(tmp, pyramid=False):
+    """Recorder.write_row into a real CSV (and min/max pyramid)."""
+    from ddl.modules.acquisition.recorder import Recorder
+    from ddl.modules.acquisition.protocol import REQUIRED_FIELDS, RX_TIME
+    folder = tempfile.mkdtemp(dir=tmp)
+    rec = Recorder(folder, os.path.join(folder, "Flight_1043.csv"), REQUIRED_FIELDS, True,
+                   {"compression": "none"}, {"enable": pyramid})
+    rec.open_csv()
+    d = dict(_packet(), **{RX_TIME: 0.0})
+    def run():
+        d[RX_TIME] += 0.1; rec.write_row(d)
+    run.close = rec.close
+    return run
+
+
+def case_attitude(batch=10):
+    """AttitudeFilter.angles: one bus batch of `batch` rows, as the live ATT_* consumer runs it."""
+    import numpy as np
+    from ddl.modules.acquisition.attitude import AttitudeFilter
+    f = AttitudeFilter()
+    t = np.arange(batch) * 0.1; gyro = np.zeros((batch, 3)); mag = np.zeros((batch, 3))
+    accel = np.tile([0.0, 0.0, 9.81], (batch, 1))
+    def run():
+        t[:] += batch * 0.1; f.angles(t, gyro, accel, mag)
+    return run
+
+
+def case_bus_publish(subscribers=3):
+    """TelemetryBus.publish: one packet into the column store, handed to `subscribers` per-packet subscribers."""
+    _layout()
+    from ddl.modules.managers.telemetry_bus import TelemetryBus
+    from ddl.modules.acquisition.protocol import RX_TIME
+    bus = TelemetryBus()
+    for _ in range(subscribers): bus.subscribe(lambda u: u.view("ALTITUDE"))
+    d = dict(_packet(), **{RX_TIME: 0.0})
+    def run():
+        d[RX_TIME] += 0.1; bus.publish(d)
+    return run
+
+
+def case_config_get(key):
+    from ddl.modules.managers.configuration_manager import ConfigManager
+    ConfigManager.get(key)
+    return lambda: ConfigManager.get(key)
+
+
+def case_widget(kind, history):
+    """
+    <Widget>.update with exactly `history` points drawn on every call.
+    - mono / rpy: bound to a TelemetryStore (as live), rewound to history - 1 rows before each append
+    - gps: its simplified track is trimmed back to the prefilled vertex count after each call
+    """
+    import math
+    import numpy as np
+    from ddl.modules.acquisition.protocol import RX_TIME
+    from ddl.modules.utility.telemetry_store import TelemetryStore
+    view = _layout()
+    from ddl.modules.utility.graph_types import MonoAxisPlotWidget, RPYPlotWidget, GpsPlotWidget
+    w = {"mono": MonoAxisPlotWidget, "rpy": RPYPlotWidget, "gps": GpsPlotWidget}[kind](title=kind)
+    view.addItem(w)
+    run = None
+    if kind == "gps":
+        feed = lambda i: w.update(42.842835 + 2e-6 * i + 1e-5 * math.sin(i * 0.05), -2.668065 + 3e-6 * i + 1e-5 * math.cos(i * 0.05))
+        w.pause()
+        for i in range(history): feed(i)
+        w.resume()
+        keep = len(w.x); state = [history]
+        def run():
+            state[0] += 1; feed(state[0])
+            if len(w.x) > keep: del w.x[:len(w.x) - keep], w.y[:len(w.y) - keep]
+    else:
+        fields = ["GYRO_R", "GYRO_P", "GYRO_Y"] if kind == "rpy" else ["ALTITUDE"]
+        n = history - 1; i = np.arange(n)
+        store = TelemetryStore(history)
+        store.load({f: np.sin(i * (0.5 + 0.1 * k)) * 60 for k, f in enumerate(fields)}, i * 0.1, 0.0)
+        w.bind(store, fields)
+        packet = {f: "1.0" for f in fields}; packet[RX_TIME] = n * 0.1
+        def run():
+            store.rows = n; store.append(packet); w.update(None, n * 0.1)
+    run.close = lambda: view.removeItem(w)
+    return run
+
+
+def case_spectrum(nfft=64, hop=8):
+    """SpectrumPlotWidget.update: one 3-channel IMU sample (a batched STFT line + image shift every `hop` calls)."""
+    import math
+    view = _layout()
+    from ddl.modules.utility.graph_types import SpectrumPlotWidget
+    w = SpectrumPlotWidget(title="spectrum", nfft=nfft, hop=hop, rate_hz=100.0)
+    view.addItem(w)
+    i = [0]
+    def run():
+        i[0] += 1; k = i[0] * 0.01
+        w.update((math.sin(75.4 * k), math.cos(31.4 * k), 9.81 + math.sin(195 * k)), k)
+    run.close = lambda: view.removeItem(w)
+    return run
+
+
+def case_table_update():
+    """LastTelemetryModel.update with a few fields changing per packet (the last-packet block)."""
+    from ddl.modules.utility.telemetry_table import LastTelemetryModel
+    from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+    m = LastTelemetryModel(REQUIRED_FIELDS)
+    packets = [_packet(n) for n in range(1, 101)]
+    i = [0]
+    def run():
+        i[0] += 1; m.update(packets[i[0] % 100])
+    return run
+
+
+_VIEW = []
+def _layout():
+    if not _VIEW:
+        import pyqtgraph as pg
+        from PyQt5.QtWidgets import QApplication
+        QApplication.instance() or QApplication(sys.argv[:1])
+        v = pg.GraphicsLayoutWidget(); v.resize(1280, 720); v.show()
+        _VIEW.append(v)
+    return _VIEW[0]
+
+
+def cases(tmp):
+    """name -> setup() returning the timed callable (optionally with .close())."""
+    out = {
+        "parse.ascii": lambda: case_parse(),
+        "parse.ascii+crc16": lambda: case_parse(integrity="crc16"),
+        "parse.cobs": lambda: case_parse("cobs"),
+        "csv.write_row": lambda: case_csv_row(tmp),
+        "csv.write_row+pyramid": lambda: case_csv_row(tmp, True),
+        "attitude.batch10": case_attitude,
+        "bus.publish": case_bus_publish,
+        "config.get.shallow": lambda: case_config_get("connection.protocol"),
+        "config.get.deep": lambda: case_config_get("connection.acquisition_process.poll_ms"),
+        "table.update": case_table_update,
+        "widget.spectrum.update": case_spectrum,
+    }
+    for kind in ("mono", "rpy", "gps"):
+        for n in HISTORY:
+            out[f"widget.{kind}.update@{n // 1000}k"] = (lambda k=kind, h=n: case_widget(k, h))
+    return out
+
+
+# ---------- timing ----------
+def measure(fn, repeat=5, round_ms=200.0):
+    """Median / best per-call time in µs over `repeat` rounds of an auto-sized call count."""
+    fn()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        dt = time.perf_counter() - t0
+        if dt * 1000.0 >= round_ms / 4 or number >= 1 << 20: break
+        number *= 4
+    number = max(1, int(number * round_ms / max(dt * 1000.0, 1e-3)))
+    rounds = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        rounds.append((time.perf_counter() - t0) / number * 1e6)
+    return {"us": statistics.median(rounds), "min_us": min(rounds), "calls": number}
+
+
+def run(only=None, repeat=5, round_ms=200.0, log=print):
+    tmp = tempfile.mkdtemp(prefix="ddl-microbench-")
+    results = {}
+    try:
+        for name, setup in cases(tmp).items():
+            if only and not any(o in name for o in only): continue
+            fn = None
+            try:
+                fn = setup()
+                results[name] = measure(fn, repeat, round_ms)
+            except Exception as e: results[name] = {"error": f"{type(e).__name__}: {e}"}
+            finally:
+                if hasattr(fn, "close"): fn.close()
+            log(_describe(name, results[name]))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """[(name, ratio, verdict)] against a baseline result dict; verdict: ok / REGRESSION / faster / new."""
+    out = []
+    for name, r in results.items():
+        b = baseline.get(name)
+        if "us" not in r: out.append((name, None, "ERROR")); continue
+        if not b or "us" not in b: out.append((name, None, "new")); continue
+        ratio = r["us"] / b["us"]
+        verdict = "REGRESSION" if ratio > 1 + tolerance else ("faster" if ratio < 1 / (1 + tolerance) else "ok")
+        out.append((name, ratio, verdict))
+    return out
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(path, results):
+    folder = os.path.dirname(path)
+    if folder: os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"measured": datetime.now().isoformat(timespec="seconds"), "machine": _machine(),
+                   "results": results}, f, indent=2)
+
+
+def _machine():
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(), "cpus": os.cpu_count()}
+
+
+def _describe(name, r):
+    if "us" not in r: return f"[MICRO] {name:<28} FAILED ({r.get('error', '?')})"
+    return f"[MICRO] {name:<28} {r['us']:10.2f} us/call (best {r['min_us']:.2f}, {r['calls']} calls/round)"
+
+
+def main(argv=None):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    ap = argparse.ArgumentParser(description="Microbenchmarks of the telemetry hot paths with baseline gating.")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON (default: %(default)s)")
+    ap.add_argument("--save", action="store_true", help="write this run as the new baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio (default: %(default)s = +25%%)")
+    ap.add_argument("--only", nargs="*", help="run cases whose name contains any of these")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--round-ms", type=float, default=200.0)
+    args = ap.parse_args(argv)
+
+    results = run(args.only, args.repeat, args.round_ms)
+    base = load_baseline(args.baseline)
+    status = 0
+    if base is not None:
+        if base.get("machine") != _machine(): print(f"[MICRO] (!) baseline measured on another machine: {base.get('machine')}")
+        for name, ratio, verdict in compare(results, base.get("results", {}), args.tolerance):
+            if verdict in ("REGRESSION", "ERROR"): status = 1
+            if verdict != "ok": print(f"[MICRO] {verdict:<10} {name}" + (f" x{ratio:.2f}" if ratio else ""))
+        print(f"[MICRO] {'regressions found' if status else 'no regressions'} (tolerance +{args.tolerance:.0%}, baseline {base.get('measured')})")
+    elif not args.save:
+        print(f"[MICRO] no baseline at {args.baseline} - run with --save to create it")
+    if args.save:
+        if base is not None and args.only:   # partial run: keep the other cases
+            results = dict(base.get("results", {}), **results)
+        save_baseline(args.baseline, results)
+        print(f"[MICRO] baseline saved: {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
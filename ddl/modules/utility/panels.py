@@ -0,0 +1,180 @@
+from ddl.modules.utility.graph_types import MonoAxisPlotWidget, RPYPlotWidget, GpsPlotWidget, SpectrumPlotWidget
+
+# type name -> (factory(spec) -> widget, push(widget, fields, data, t))
+PANEL_TYPES = {}
+# type name -> load(widget, fields, columns, t): bulk history from column arrays (session resume)
+PANEL_LOADERS = {}
+
+def panel_type(name, factory):
+    """Register a plot type usable as `"type"` in graphs.panels."""
+    def deco(push):
+        PANEL_TYPES[name] = (factory, push)
+        return push
+    return deco
+
+
+def panel_loader(name):
+    """Register the bulk history loader of a plot type."""
+    def deco(load):
+        PANEL_LOADERS[name] = load
+        return load
+    return deco
+
+
+def _title(spec):
+    units = spec.get("units")
+    return f"{spec.get('title', spec['id'])} ({units})" if units else spec.get("title", spec["id"])
+
+def _colors(spec, default):
+    return tuple(spec.get("colors") or default)
+
+
+@panel_type("mono", lambda s: MonoAxisPlotWidget(title=_title(s), color=_colors(s, ("#0A5",))[0],
+                                                  mission_time_axis=True))
+def _push_mono(w, fields, data, t):
+    w.update(float(data.get(fields[0], 0.0)), t)
+
+@panel_loader("mono")
+def _load_mono(w, fields, cols, t):
+    w.load(t, cols[fields[0]])
+
+@panel_type("rpy", lambda s: RPYPlotWidget(title=_title(s), colors=_colors(s, ("#0A5", "#06C", "#C60")),
+                                            mission_time_axis=True))
+def _push_rpy(w, fields, data, t):
+    w.update([float(data.get(f, 0.0)) for f in fields[:3]], t)
+
+@panel_loader("rpy")
+def _load_rpy(w, fields, cols, t):
+    w.load(t, [cols[f] for f in fields[:3]])
+
+@panel_type("gps", lambda s: GpsPlotWidget(title=_title(s), color=_colors(s, ("#222",))[0],
+                                            simplify_tolerance_m=s.get("simplify_tolerance_m", 2.0),
+                                            min_span_m=s.get("min_span_m", 50.0), tiles=s.get("tiles")))
+def _push_gps(w, fields, data, t):
+    w.update(float(data.get(fields[0], 0.0)), float(data.get(fields[1], 0.0)))
+
+@panel_loader("gps")
+def _load_gps(w, fields, cols, t):
+    w.load(cols[fields[0]], cols[fields[1]])
+
+
+@panel_type("spectrum", lambda s: SpectrumPlotWidget(title=_title(s), nfft=s.get("nfft", 64), hop=s.get("hop", 8),
+                                                      lines=s.get("lines", 200), rate_hz=s.get("rate_hz"),
+                                                      range_db=s.get("range_db", 60.0), colormap=s.get("colormap", "viridis"),
+                                                      marker_field=s.get("marker_field"), marker_scale=s.get("marker_scale", 1.0)))
+def _push_spectrum(w, fields, data, t):
+    w.update([float(data.get(f, "nan")) for f in fields], t)
+
+@panel_loader("spectrum")
+def _load_spectrum(w, fields, cols, t):
+    w.load(t, [cols[f] for f in fields])
+
+class Panel:
+    """
+    One entry of graphs.panels; the plot widget is only built the first time it is shown.
+    - with a TelemetryStore, widgets that can bind() draw from its column views (no own history)
+    """
+    def __init__(self, spec: dict, store=None):
+        self.spec = dict(spec)
+        self.id = spec["id"]
+        self.type = spec.get("type", "mono")
+        if self.type not in PANEL_TYPES:
+            raise ValueError(f"unknown panel type '{self.type}' ({self.id})")
+        self.fields = list(spec.get("fields") or [])
+        self.row = int(spec.get("row", 0))
+        self.visible = bool(spec.get("visible", True))
+        self.widget = None; self.store = store
+        self._factory, self._push = PANEL_TYPES[self.type]
+
+    def ensure_widget(self):
+        if self.widget is None:
+            self.widget = self._factory(self.spec)
+            if self.store is not None and hasattr(self.widget, "bind"):
+                self.widget.bind(self.store, self.fields); self.widget.redraw()
+        return self.widget
+
+    def push(self, data: dict, t: float):
+        self._push(self.widget, self.fields, data, t)
+
+    def load(self, cols: dict, t) -> bool:
+        """Bulk history; False when this type has no loader or the columns lack its fields."""
+        load = PANEL_LOADERS.get(self.type)
+        if load is None or not all(f in cols for f in self.fields): return False
+        load(self.widget, self.fields, cols, t)
+        return True
+
+    def reset(self):
+        if self.widget is not None: self.widget.reset()
+
+
+class PanelRegistry:
+    """
+    Panels declared in config, with field -> panel routing over the visible ones.
+    - hidden panels have no widget (until first shown) and receive no updates
+    - pause()/resume(): widgets keep storing samples but only draw once on resume
+      (plot area not visible: window minimized, covered by another tab, scrolled away)
+    - with a store, bound panels read the whole session from it: one shown later starts complete
+    """
+    def __init__(self, specs, store=None):
+        self.panels = {}
+        for spec in specs or []:
+            p = Panel(spec, store); self.panels[p.id] = p
+        self.routes = {}
+        self.paused = False
+        self._rebuild_routes()
+
+    def __getitem__(self, pid): return self.panels[pid]
+    def __contains__(self, pid): return pid in self.panels
+
+    def visible(self):
+        return [p for p in self.panels.values() if p.visible]
+
+    def set_visible(self, pid: str, on: bool) -> bool:
+        p = self.panels.get(pid)
+        if p is None: return False
+        p.visible = bool(on)
+        if on:
+            p.ensure_widget()
+            if self.paused: p.widget.pause()
+        self._rebuild_routes()
+        return True
+
+    def dispatch(self, data: dict, t: float):
+        """Push a packet (or a partial dict of derived channels) to the panels subscribed to its fields."""
+        routes = self.routes; hit = set()
+        for key in data:
+            for p in routes.get(key, ()):
+                if p.id in hit: continue
+                hit.add(p.id)
+                try: p.push(data, t)
+                except Exception as e: print(f"[WARNING] PANEL {p.id} - {e}")
+
+    def reset(self):
+        for p in self.panels.values(): p.reset()
+
+    def load(self, cols: dict, t):
+        """Bulk history (column arrays + time axis) into the visible panels; returns the ids loaded."""
+        loaded = []
+        for p in self.visible():
+            try:
+                if p.load(cols, t): loaded.append(p.id)
+            except Exception as e: print(f"[WARNING] PANEL {p.id} - {e}")
+        return loaded
+
+    def pause(self):
+        self.paused = True
+        for p in self.panels.values():
+            if p.widget is not None: p.widget.pause()
+
+    def resume(self):
+        """One catch-up draw per panel that received data while paused."""
+        self.paused = False
+        for p in self.panels.values():
+            if p.widget is not None: p.widget.resume()
+
+    def _rebuild_routes(self):
+        routes = {}
+        for p in self.visible():
+            p.ensure_widget()
+            for f in p.fields: routes.setdefault(f, []).append(p)
+        self.routes = routes
@@ -0,0 +1,130 @@
+"""
+On-demand cProfile / tracemalloc capture for a running station (Qt-free).
+
+cProfile only sees the thread that enabled it, so a ProfileSession keeps one
+Profile per thread: the GUI thread enables its own in start(), long-running
+worker loops call thread_hook() once per iteration, which attaches a Profile
+to that thread while a session runs and detaches it (from the same thread)
+once the session is stopping.
+"""
+import os, io, sys, time, pstats, cProfile, threading, tracemalloc
+
+_session = None
+_attached = {}      # thread ident -> session whose Profile is enabled in that thread
+
+
+def thread_hook():
+    """Worker loops: join / leave the active profiling session (two dict/None checks when idle)."""
+    if _session is not None or _attached: _sync()
+
+
+def _sync():
+    ident = threading.get_ident()
+    owner = _attached.get(ident)
+    if owner is not None and (owner.stopping or owner is not _session):
+        owner._detach(ident)       # also after the session was written without this thread
+    elif owner is None and _session is not None and not _session.stopping:
+        _session._attach()
+
+
+class ProfileSession:
+    def __init__(self):
+        self.profiles = {}      # thread ident -> (name, Profile)
+        self.finished = {}      # detached ones, ready to report
+        self.stopping = False; self.written = False
+        self.started = time.time(); self.cpu0 = time.process_time()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def start(cls):
+        global _session
+        if _session is not None: return None
+        s = cls(); s._attach()
+        _session = s
+        return s
+
+    def _attach(self):
+        ident = threading.get_ident()
+        p = cProfile.Profile()
+        with self.lock: self.profiles[ident] = (threading.current_thread().name, p)
+        _attached[ident] = self
+        p.enable()
+
+    def _detach(self, ident):
+        with self.lock: entry = self.profiles.pop(ident, None)
+        _attached.pop(ident, None)
+        if entry is None: return
+        entry[1].disable()
+        if not self.written: self.finished[ident] = entry
+
+    def stop(self):
+        """Caller's thread detaches now; workers detach at their next thread_hook()."""
+        self.stopping = True; self._detach(threading.get_ident())
+
+    def pending(self):
+        return [name for name, _ in self.profiles.values()]
+
+    def write(self, directory: str):
+        """Merged pstats + text report of every detached thread; returns (pstats path, txt path)."""
+        global _session
+        if _session is self: _session = None
+        self.written = True
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, time.strftime("profile_%Y%m%d_%H%M%S"))
+        wall = time.time() - self.started; cpu = time.process_time() - self.cpu0
+        merged = None
+        out = io.StringIO()
+        out.write(f"Profile {time.ctime(self.started)} | {wall:.1f} s wall | process CPU {cpu:.1f} s ({100 * cpu / max(wall, 1e-9):.0f}%)\n")
+        out.write(f"Threads: {', '.join(name for name, _ in self.finished.values())}\n")
+        if self.profiles: out.write(f"Not detached in time (no loop iteration): {', '.join(self.pending())}\n")
+        for name, p in self.finished.values():
+            st = pstats.Stats(p, stream=out)
+            merged = st if merged is None else merged.add(p)
+            out.write(f"\n==== thread {name}: top 25 by cumulative time ====\n")
+            st.sort_stats("cumulative").print_stats(25)
+        if merged is not None:
+            merged.dump_stats(base + ".pstats")
+            out.write("\n==== all threads: top 40 by own time ====\n")
+            merged.stream = out; merged.sort_stats("tottime").print_stats(40)
+        with open(base + ".txt", "w", encoding="utf-8") as f: f.write(out.getvalue())
+        return (base + ".pstats" if merged is not None else None), base + ".txt"
+
+
+# Memory
+def list_bytes(seq) -> int:
+    """Container + boxed items (lists of Python floats / strings)."""
+    return sys.getsizeof(seq) + sum(map(sys.getsizeof, seq))
+
+
+def array_bytes(*arrays) -> int:
+    return sum(getattr(a, "nbytes", 0) for a in arrays if a is not None)
+
+
+def snapshot_report(components, previous=None, frames: int = 10, top: int = 30):
+    """
+    Text report: per-component sizes (name -> (bytes, detail)), then tracemalloc
+    top allocation sites and the growth since `previous`; returns (text, snapshot).
+    The first call starts tracemalloc, so allocation sites cover what happens after it.
+    """
+    out = io.StringIO()
+    out.write(f"Memory snapshot {time.ctime()}\n\n==== components ====\n")
+    total = 0
+    for name, (size, detail) in components.items():
+        total += size
+        out.write(f"{name:<28} {size / 1e6:10.2f} MB  {detail}\n")
+    out.write(f"{'total (components)':<28} {total / 1e6:10.2f} MB\n")
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        out.write("\n(tracemalloc started now: allocation sites appear from the next /mem.snapshot)\n")
+        return out.getvalue(), tracemalloc.take_snapshot()
+    snap = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+    cur, peak = tracemalloc.get_traced_memory()
+    out.write(f"\ntraced {cur / 1e6:.1f} MB (peak {peak / 1e6:.1f} MB)\n")
+    out.write(f"\n==== top {top} by file ====\n")
+    for s in snap.statistics("filename")[:top]: out.write(f"{s}\n")
+    out.write(f"\n==== top {top} by line ====\n")
+    for s in snap.statistics("lineno")[:top]: out.write(f"{s}\n")
+    if previous is not None:
+        out.write(f"\n==== growth since previous snapshot ====\n")
+        for s in snap.compare_to(previous, "lineno")[:top]: out.write(f"{s}\n")
+    return out.getvalue(), snap
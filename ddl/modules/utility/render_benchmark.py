@@ -0,0 +1,194 @@
+"""
+Render-backend benchmark for the telemetry plots.
+
+Every combination of the pyqtgraph settings in `graphs.settings` is drawn
+through the real plot widgets (Mono/RPY/GPS) in a child process, so a backend
+that crashes (OpenGL drivers, missing cupy/numba) only marks that combination
+as failed. The fastest working combination is saved as the render profile
+that GraphManager applies on top of `graphs.settings` at start-up.
+
+    python -m ddl.modules.utility.render_benchmark [--csv saves/Flight_1043.csv] [--save PATH]
+"""
+import os, sys, csv, json, math, time, argparse, itertools, subprocess
+import importlib.util
+from datetime import datetime
+
+SETTING_KEYS = ("antialias", "opengl", "cupy", "numba", "segmentedLineMode")
+# graphs.settings key -> pyqtgraph config option
+PG_OPTIONS = {"antialias": "antialias", "opengl": "useOpenGL", "cupy": "useCupy",
+              "numba": "useNumba", "segmentedLineMode": "segmentedLineMode"}
+SERIES_FIELDS = ("ALTITUDE", "VOLTAGE", "ACCEL_R", "ACCEL_P", "ACCEL_Y",
+                 "GYRO_R", "GYRO_P", "GYRO_Y", "GPS_LATITUDE", "GPS_LONGITUDE")
+
+
+# ---------- profile file ----------
+def load_profile(path: str) -> dict:
+    """Settings saved by a previous benchmark run ({} if none/unreadable)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        return {k: saved[k] for k in SETTING_KEYS if k in saved}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+def save_profile(path: str, best: dict, results: list):
+    folder = os.path.dirname(path)
+    if folder: os.makedirs(folder, exist_ok=True)
+    out = dict(best["settings"])
+    out["frame_ms"] = best["frame_ms"]
+    out["measured"] = datetime.now().isoformat(timespec="seconds")
+    out["results"] = results
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(out, f, indent=2)
+
+
+# ---------- series ----------
+def synthetic_series(n: int) -> dict:
+    t = [i * 0.1 for i in range(n)]
+    return {
+        "ALTITUDE": [max(0.0, 60 * x - 0.5 * 9.81 * 0.1 * x * x) for x in t],
+        "VOLTAGE": [12.6 - 0.002 * x + 0.02 * math.sin(x * 3) for x in t],
+        "ACCEL_R": [math.sin(x * 5) for x in t], "ACCEL_P": [math.cos(x * 4) for x in t],
+        "ACCEL_Y": [9.81 + 0.3 * math.sin(x * 7) for x in t],
+        "GYRO_R": [20 * math.sin(x) for x in t], "GYRO_P": [15 * math.cos(x * 1.3) for x in t],
+        "GYRO_Y": [90 * math.sin(x * 0.2) for x in t],
+        "GPS_LATITUDE": [42.842835 + 2e-6 * x + 1e-5 * math.sin(x * 0.05) for x in t],
+        "GPS_LONGITUDE": [-2.668065 + 3e-6 * x + 1e-5 * math.cos(x * 0.05) for x in t],
+    }
+
+def recorded_series(csv_path: str, n: int) -> dict:
+    """Columns of a Flight_*.csv (separator/comment rows skipped), cycled up to n samples."""
+    cols = {k: [] for k in SERIES_FIELDS}
+    with open(csv_path, "r", encoding="utf-8", errors="ignore", newline="") as f:
+        header = None
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#"): continue
+            if header is None:
+                header = {name: i for i, name in enumerate(row)}
+                if "ALTITUDE" not in header: raise ValueError(f"no CSV header in {csv_path}")
+                continue
+            try: vals = [float(row[header[k]]) for k in SERIES_FIELDS]
+            except (KeyError, IndexError, ValueError): continue
+            for k, v in zip(SERIES_FIELDS, vals): cols[k].append(v)
+    if not cols["ALTITUDE"]: raise ValueError(f"no numeric rows in {csv_path}")
+    m = len(cols["ALTITUDE"])
+    return {k: [v[i % m] for i in range(n)] for k, v in cols.items()}
+
+
+# ---------- combinations ----------
+def combinations():
+    """All setting combinations worth trying on this machine."""
+    has_cupy = importlib.util.find_spec("cupy") is not None
+    has_numba = importlib.util.find_spec("numba") is not None
+    for aa, gl, seg, cupy, numba in itertools.product(
+            (True, False), (False, True), ("off", "on"),
+            (False, True) if has_cupy else (False,), (False, True) if has_numba else (False,)):
+        yield {"antialias": aa, "opengl": gl, "cupy": cupy, "numba": numba, "segmentedLineMode": seg}
+
+
+# ---------- one combination (child process) ----------
+def benchmark_combo(settings: dict, series: dict, history: int, frames: int) -> dict:
+    """Draw `frames` packets on top of `history` samples; return frame time stats (ms)."""
+    import pyqtgraph as pg
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    for k, v in settings.items(): pg.setConfigOption(PG_OPTIONS[k], v)
+    from ddl.modules.utility.graph_types import MonoAxisPlotWidget, RPYPlotWidget, GpsPlotWidget
+
+    win = pg.GraphicsLayoutWidget(); win.setAntialiasing(bool(settings.get("antialias")))
+    win.resize(1280, 720)
+    alt = MonoAxisPlotWidget(title="Altitude (m)"); batt = MonoAxisPlotWidget(title="Battery Voltage (V)")
+    accel = RPYPlotWidget(title="Accel (R/P/Y)"); gyro = RPYPlotWidget(title="Gyro (R/P/Y)")
+    gps = GpsPlotWidget(title="GPS Track (E/N m)")
+    win.addItem(alt); win.addItem(batt); win.nextRow()
+    win.addItem(accel); win.addItem(gyro); win.nextRow()
+    win.addItem(gps, colspan=2)
+    win.show(); app.processEvents()
+
+    def feed(i):
+        t = i * 0.1
+        alt.update(series["ALTITUDE"][i], t); batt.update(series["VOLTAGE"][i], t)
+        accel.update((series["ACCEL_R"][i], series["ACCEL_P"][i], series["ACCEL_Y"][i]), t)
+        gyro.update((series["GYRO_R"][i], series["GYRO_P"][i], series["GYRO_Y"][i]), t)
+        gps.update(series["GPS_LATITUDE"][i], series["GPS_LONGITUDE"][i])
+
+    for i in range(history): feed(i)
+    win.viewport().repaint(); app.processEvents()
+
+    times = []
+    for i in range(history, history + frames):
+        t0 = time.perf_counter()
+        feed(i)
+        win.viewport().repaint()
+        app.processEvents()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    win.close()
+    times.sort()
+    return {"frame_ms": sum(times) / len(times), "p50_ms": times[len(times) // 2],
+            "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))]}
+
+
+# ---------- driver ----------
+def run_benchmark(csv_path=None, history=2000, frames=120, timeout_s=120.0, log=print) -> list:
+    """Benchmark every combination in its own process; results sorted fastest first."""
+    results = []
+    for settings in combinations():
+        cmd = [sys.executable, "-m", "ddl.modules.utility.render_benchmark", "--child", json.dumps(settings),
+               "--history", str(history), "--frames", str(frames)]
+        if csv_path: cmd += ["--csv", csv_path]
+        res = {"settings": settings, "ok": False}
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_s,
+                                  cwd=_project_root(), env=dict(os.environ))
+            lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+            if proc.returncode == 0 and lines:
+                res.update(json.loads(lines[-1])); res["ok"] = True
+            else:
+                res["error"] = (proc.stderr.strip().splitlines() or [f"exit {proc.returncode}"])[-1]
+        except subprocess.TimeoutExpired:
+            res["error"] = "timeout"
+        log(_describe(res))
+        results.append(res)
+    results.sort(key=lambda r: (not r["ok"], r.get("frame_ms", float("inf"))))
+    return results
+
+def _describe(res: dict) -> str:
+    s = res["settings"]
+    tag = (f"aa={int(s['antialias'])} gl={int(s['opengl'])} seg={s['segmentedLineMode']}"
+           f" cupy={int(s['cupy'])} numba={int(s['numba'])}")
+    if not res["ok"]: return f"[BENCH] {tag}: FAILED ({res.get('error', '?')})"
+    return f"[BENCH] {tag}: {res['frame_ms']:.2f} ms/frame (p95 {res['p95_ms']:.2f})"
+
+def _project_root():
+    here = os.path.dirname(os.path.abspath(__file__))
+    return os.path.abspath(os.path.join(here, "..", "..", ".."))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark pyqtgraph render settings on the real plot widgets.")
+    ap.add_argument("--csv", help="recorded Flight_*.csv to replay (default: synthetic series)")
+    ap.add_argument("--history", type=int, default=2000, help="samples already on the plots")
+    ap.add_argument("--frames", type=int, default=120, help="timed packets per combination")
+    ap.add_argument("--save", help="write the fastest working profile to this JSON file")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    n = args.history + args.frames
+    if args.child:
+        series = recorded_series(args.csv, n) if args.csv else synthetic_series(n)
+        print(json.dumps(benchmark_combo(json.loads(args.child), series, args.history, args.frames)))
+        return 0
+
+    results = run_benchmark(args.csv, args.history, args.frames)
+    best = results[0] if results and results[0]["ok"] else None
+    if best is None:
+        print("[BENCH] no working combination"); return 1
+    print(f"[BENCH] fastest: {_describe(best)[8:]}")
+    if args.save:
+        save_profile(args.save, best, results)
+        print(f"[BENCH] profile saved: {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Rolling statistics of every numeric telemetry channel over the last `window_s` seconds (Qt-free).
+
+Works on batches of TelemetryStore rows: the window is the row range [lo, hi) of the store, so
+samples leaving it are read back from the shared columns instead of being queued a second time.
+- mean / std / rate: Welford moments of (t, value) per channel, merged with each new batch and
+  un-merged with each expired one (Chan's parallel formulas, vectorized over all channels);
+  rate is the least-squares slope over the window (units per second)
+- min / max: monotonic deques of row indices per channel; a batch is reduced to its own
+  suffix extrema first, so each sample enters and leaves a deque at most once
+- the moments are recomputed exactly once per window turnover, so removal round-off never builds up
+"""
+import numpy as np
+
+from ddl.modules.acquisition.protocol import RX_TIME
+
+COLUMNS = ("N", "MEAN", "STD", "MIN", "MAX", "RATE /s")
+
+
+def _moments(X, T):
+    """(n, mean x, mean t, M2 x, M2 t, C tx) per row of X (channels x samples, NaN = missing)."""
+    ok = ~np.isnan(X); n = ok.sum(axis=1).astype(float)
+    Tm = np.where(ok, T[None, :], np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mx = np.where(n > 0, np.nansum(X, axis=1) / n, 0.0)
+        mt = np.where(n > 0, np.nansum(Tm, axis=1) / n, 0.0)
+    dx = X - mx[:, None]; dt = Tm - mt[:, None]
+    return [n, mx, mt, np.nansum(dx * dx, axis=1), np.nansum(dt * dt, axis=1), np.nansum(dx * dt, axis=1)]
+
+
+def _merge(a, b, sign):
+    """a + b (sign=1) or a - b (sign=-1) of two moment sets."""
+    na, mxa, mta, xxa, tta, txa = a; nb, mxb, mtb, xxb, ttb, txb = b
+    n = na + sign * nb
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if sign > 0:
+            mx = mxa + (mxb - mxa) * nb / n; mt = mta + (mtb - mta) * nb / n
+            f = na * nb / n; dx = mxb - mxa; dt = mtb - mta
+            out = [n, mx, mt, xxa + xxb + dx * dx * f, tta + ttb + dt * dt * f, txa + txb + dx * dt * f]
+        else:
+            mx = (na * mxa - nb * mxb) / n; mt = (na * mta - nb * mtb) / n
+            f = n * nb / na; dx = mxb - mx; dt = mtb - mt
+            out = [n, mx, mt, np.maximum(xxa - xxb - dx * dx * f, 0.0), np.maximum(tta - ttb - dt * dt * f, 0.0),
+                   txa - txb - dx * dt * f]
+    empty = n <= 0
+    return [np.where(empty, 0.0, v) for v in out]
+
+
+class RollingStats:
+    """
+    update(store, stop): take the store rows up to `stop` into the window; rows() -> per-channel stats.
+    - channels: every numeric column of the store (text fields and the time columns excluded)
+    - a store that shrank (Clear All) restarts the statistics
+    """
+    EXCLUDE = frozenset(("t", RX_TIME))
+
+    def __init__(self, window_s: float = 10.0):
+        self.window = float(window_s)
+        self.reset()
+
+    def reset(self):
+        self.names = []; self.index = {}
+        self.m = [np.zeros(0) for _ in range(6)]
+        self.maxq = []; self.minq = []        # per channel: (row indices, signed values), values decreasing
+        self.lo = self.hi = 0; self.removed = 0
+
+    def update(self, store, stop: int = None):
+        stop = len(store) if stop is None else stop
+        if stop < self.hi: self.reset()
+        self._channels(store)
+        if not self.names or stop <= self.hi: return
+        t = store.cols["t"][:stop]
+        lo = max(self.lo, int(np.searchsorted(t, t[-1] - self.window, side="left")))
+        if lo >= self.hi:                     # the whole previous window expired
+            self.m = [np.zeros(len(self.names)) for _ in range(6)]; self.removed = 0
+        elif lo > self.lo:
+            self.m = _merge(self.m, _moments(self._matrix(store, self.lo, lo), t[self.lo:lo]), -1)
+            self.removed += lo - self.lo
+        start = max(self.hi, lo)
+        X = self._matrix(store, start, stop)
+        self.m = _merge(self.m, _moments(X, t[start:stop]), 1)
+        self.lo, self.hi = lo, stop
+        self._extrema(X, start)
+        if self.removed >= max(stop - lo, 64):
+            self.m = _moments(self._matrix(store, lo, stop), t[lo:stop]); self.removed = 0
+
+    def rows(self):
+        """[(name, n, mean, std, min, max, rate)] in channel order; NaN where undefined."""
+        n, mx, _, xx, tt, tx = self.m
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.where(n > 1, np.sqrt(xx / np.maximum(n - 1, 1)), np.nan)
+            rate = np.where((n > 1) & (tt > 0), tx / tt, np.nan)
+            mean = np.where(n > 0, mx, np.nan)
+        out = []
+        for k, name in enumerate(self.names):
+            (_, hi), (_, lo) = self.maxq[k], self.minq[k]
+            out.append((name, int(n[k]), float(mean[k]), float(std[k]),
+                        float(-lo[0]) if len(lo) else np.nan, float(hi[0]) if len(hi) else np.nan, float(rate[k])))
+        return out
+
+    # INTERNAL
+    def _channels(self, store):
+        new = [k for k, c in store.cols.items() if k not in self.index and k not in self.EXCLUDE and c.dtype != object]
+        for k in new:
+            self.index[k] = len(self.names); self.names.append(k)
+            self.maxq.append((np.zeros(0, np.int64), np.zeros(0))); self.minq.append((np.zeros(0, np.int64), np.zeros(0)))
+        if new:   # earlier rows of a new channel are NaN: it starts empty
+            self.m = [np.concatenate((v, np.zeros(len(new)))) for v in self.m]
+
+    def _matrix(self, store, a, b):
+        return np.vstack([store.cols[k][a:b] for k in self.names]) if b > a else np.zeros((len(self.names), 0))
+
+    def _extrema(self, X, start):
+        for sign, queues in ((1.0, self.maxq), (-1.0, self.minq)):
+            V = np.where(np.isnan(X), -np.inf, sign * X)
+            if V.shape[1]:
+                suf = np.maximum.accumulate(V[:, ::-1], axis=1)[:, ::-1]
+                nxt = np.concatenate((suf[:, 1:], np.full((len(V), 1), -np.inf)), axis=1)
+                cand = (V > nxt) & np.isfinite(V)          # strictly above everything after it in the batch
+            for k in range(len(queues)):
+                idx, val = queues[k]
+                if V.shape[1]:
+                    keep = int(np.searchsorted(-val, -suf[k, 0], side="left"))   # older entries above the batch max
+                    c = np.flatnonzero(cand[k])
+                    idx = np.concatenate((idx[:keep], c + start)); val = np.concatenate((val[:keep], V[k, c]))
+                drop = int(np.searchsorted(idx, self.lo, side="left"))
+                queues[k] = (idx[drop:], val[drop:])
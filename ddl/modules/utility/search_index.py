@@ -0,0 +1,165 @@
+"""
+Full-text history of terminal and link lines in a SQLite FTS5 table.
+
+add() only queues (text, time, source); a writer thread batches the queue into
+one transaction per flush interval, so neither the acquisition reader nor the
+GUI thread ever waits on disk. search() runs on its own read connection (WAL),
+newest matches first.
+- the queue holds at most `max_queue` lines: when the writer falls behind, the oldest
+  are dropped (counted in `dropped`) instead of growing memory
+- retention: every `prune_s` the writer deletes lines past `max_rows` (oldest first)
+  and older than `max_days`; 0 disables either limit
+"""
+import os, time, queue, sqlite3, threading
+from datetime import datetime
+
+from ddl.modules.utility.profiling import thread_hook
+
+SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS lines USING fts5(text, source UNINDEXED, t UNINDEXED)",
+    "CREATE TABLE IF NOT EXISTS imported (path TEXT PRIMARY KEY)",
+)
+_PLAIN = "CREATE TABLE IF NOT EXISTS lines (text TEXT, source TEXT, t REAL)"   # sqlite built without FTS5
+
+
+def match_query(query: str) -> str:
+    """User words -> FTS5 query: every word must appear; `word*` is a prefix, the rest are literal phrases."""
+    terms = []
+    for word in query.split():
+        star = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*").replace('"', '""')
+        if word: terms.append(f'"{word}"' + ("*" if star else ""))
+    return " ".join(terms)
+
+
+def _wall(stamp: str):
+    try: return datetime.fromisoformat(stamp).timestamp()
+    except ValueError: return None
+
+
+class SearchIndex:
+    def __init__(self, path: str, flush_ms: int = 500, batch: int = 5000, max_queue: int = 100000,
+                 max_rows: int = 2000000, max_days: float = 30, prune_s: float = 600):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.flush_s = flush_ms / 1000.0; self.batch = batch
+        self.queue = queue.Queue(max(1, int(max_queue)))
+        self.max_rows = int(max_rows or 0); self.max_days = float(max_days or 0); self.prune_s = float(prune_s)
+        self.indexed = 0; self.dropped = 0
+        db = self._connect()
+        try:
+            for sql in SCHEMA: db.execute(sql)
+            self.fts = True
+        except sqlite3.OperationalError:
+            db.execute(_PLAIN); db.execute(SCHEMA[1]); self.fts = False
+        db.commit(); db.close()
+        self.reader = self._connect(check_same_thread=False)
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._work, name="search-index", daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def from_config(cls, cfg: dict, logs_path: str):
+        """None when application.settings.search.enable is false."""
+        cfg = cfg or {}
+        if not cfg.get("enable", True): return None
+        return cls(cfg.get("path") or os.path.join(logs_path, "search.sqlite3"), int(cfg.get("flush_ms", 500)), 5000,
+                   int(cfg.get("max_queue", 100000)), int(cfg.get("max_rows", 2000000)), float(cfg.get("max_days", 30)))
+
+    def _connect(self, **kw):
+        db = sqlite3.connect(self.path, **kw)
+        db.execute("PRAGMA journal_mode=WAL"); db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    # PUBLIC
+    def add(self, text: str, source: str = "term", t: float = None):
+        self._put((str(text), source, time.time() if t is None else t))
+
+    def import_blackbox(self, directory: str):
+        """Queue every closed BlackBox segment (listed in index.csv) not indexed yet; returns the file count."""
+        from ddl.modules.acquisition.blackbox import read_index
+        files = [os.path.join(directory, r["file"]) for r in read_index(directory)]
+        done = {p for (p,) in self.reader.execute("SELECT path FROM imported")}
+        todo = [p for p in files if os.path.abspath(p) not in done and os.path.exists(p)]
+        for p in todo: self._put(("", "import", p))
+        return len(todo)
+
+    def search(self, query: str, limit: int = 50):
+        """[(t, source, text)] newest first, and the query time in ms."""
+        start = time.perf_counter()
+        if self.fts:
+            q = match_query(query)
+            rows = self.reader.execute("SELECT t, source, text FROM lines WHERE lines MATCH ? ORDER BY rowid DESC LIMIT ?",
+                                       (q, limit)).fetchall() if q else []
+        else:
+            rows = self.reader.execute("SELECT t, source, text FROM lines WHERE instr(lower(text), lower(?)) "
+                                       "ORDER BY rowid DESC LIMIT ?", (query, limit)).fetchall()
+        return rows, (time.perf_counter() - start) * 1000.0
+
+    def close(self):
+        self._stop.set(); self.thread.join(timeout=5.0)
+        self.reader.close()
+
+    def _put(self, item):
+        """Never blocks: a full queue drops its oldest entry (a skipped import is queued again next time)."""
+        while True:
+            try: self.queue.put_nowait(item); return
+            except queue.Full: pass
+            try: self.queue.get_nowait(); self.dropped += 1
+            except queue.Empty: pass
+
+    # WORKER
+    def _work(self):
+        db = self._connect()
+        next_prune = 0.0
+        while True:
+            thread_hook()
+            if time.monotonic() >= next_prune:
+                next_prune = time.monotonic() + self.prune_s
+                try: self._prune(db)
+                except sqlite3.Error as e: print(f"[WARNING] SEARCH INDEX - {e}")
+            try: items = [self.queue.get(timeout=self.flush_s)]
+            except queue.Empty:
+                if self._stop.is_set(): break
+                continue
+            deadline = time.monotonic() + self.flush_s
+            while len(items) < self.batch and time.monotonic() < deadline:
+                try: items.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty: break
+            rows = [i for i in items if i[1] != "import"]
+            try:
+                with db:
+                    db.executemany("INSERT INTO lines(text, source, t) VALUES (?, ?, ?)", rows)
+                self.indexed += len(rows)
+                for _, _, path in (i for i in items if i[1] == "import"): self._import(db, path)
+            except (sqlite3.Error, OSError, EOFError) as e:
+                print(f"[WARNING] SEARCH INDEX - {e}")
+        db.close()
+
+    def _prune(self, db):
+        """Retention: drop the oldest lines past max_rows and those older than max_days."""
+        with db:
+            if self.max_rows:
+                top = db.execute("SELECT rowid FROM lines ORDER BY rowid DESC LIMIT 1").fetchone()
+                if top and top[0] > self.max_rows: db.execute("DELETE FROM lines WHERE rowid <= ?", (top[0] - self.max_rows,))
+            if self.max_days: db.execute("DELETE FROM lines WHERE t < ?", (time.time() - self.max_days * 86400.0,))
+
+    def _import(self, db, path):
+        from ddl.modules.acquisition.blackbox import open_segment
+        rows = []
+        with open_segment(path) as f, db:
+            for line in f:
+                close = line.find("]")
+                if not line.startswith("[") or close < 0: continue
+                sep = line.find(": ", close)
+                if sep < 0: continue
+                rows.append((line[sep + 2:].rstrip("\r\n"), "blackbox", _wall(line[1:close])))
+                if len(rows) >= self.batch:
+                    db.executemany("INSERT INTO lines(text, source, t) VALUES (?, ?, ?)", rows); self.indexed += len(rows); rows = []
+            db.executemany("INSERT INTO lines(text, source, t) VALUES (?, ?, ?)", rows); self.indexed += len(rows)
+            db.execute("INSERT OR IGNORE INTO imported(path) VALUES (?)", (os.path.abspath(path),))
+
+
+def format_hit(t, source, text):
+    stamp = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] if t else "----"
+    return f"[FIND] {stamp} {source}: {text}"
@@ -0,0 +1,115 @@
+"""
+Session telemetry as shared column buffers (Qt-free).
+
+One array per channel (float64 for numbers, object for text such as STATE), grown by
+doubling, so row i of every column is packet i. Consumers read read-only views of those
+buffers: any number of plots, windows or publishers share one copy of the history.
+"""
+import time
+import numpy as np
+
+from ddl.modules.acquisition.protocol import RX_TIME
+from ddl.modules.acquisition.flight_csv import TEXT_FIELDS
+
+
+class TelemetryStore:
+    """
+    - append(data): one packet -> one row; channels missing from it hold NaN / ""
+    - "t": session seconds since the first packet's RX_TIME (t0)
+    - view(name, start, stop): read-only NumPy view (no copy); stays valid after growth,
+      but only sees the rows that existed when it was taken
+    - put(name, start, values): derived channel rows written after the packets (e.g. ATT_* from a batch)
+    - last: the newest packet dict (labels, tables)
+    """
+    TEXT = frozenset(TEXT_FIELDS)
+
+    def __init__(self, capacity: int = 4096):
+        self.initial = max(16, int(capacity))
+        self.clear()
+
+    def clear(self):
+        self.cap = self.initial; self.rows = 0
+        self.cols = {"t": np.full(self.cap, np.nan)}
+        self.t0 = None; self.last = {}
+
+    def __contains__(self, name): return name in self.cols
+    def __len__(self): return self.rows
+
+    def channels(self): return list(self.cols)
+
+    @property
+    def nbytes(self):
+        return sum(c.nbytes if c.dtype != object else c.nbytes + 56 * self.rows for c in self.cols.values())
+
+    def view(self, name, start: int = 0, stop: int = None):
+        c = self.cols.get(name)
+        if c is None: return None
+        v = c[start:self.rows if stop is None else min(stop, self.rows)]
+        v.flags.writeable = False
+        return v
+
+    def append(self, data: dict) -> int:
+        """Store one packet; returns its row index."""
+        i = self.rows
+        if i == self.cap: self._grow(i + 1)
+        rx = data.get(RX_TIME)
+        if rx is None: rx = time.monotonic()
+        if self.t0 is None: self.t0 = rx
+        cols = self.cols
+        cols["t"][i] = rx - self.t0
+        for k, v in data.items():
+            c = cols.get(k)
+            if c is None: c = self._add(k, k not in self.TEXT and _is_number(v))
+            if c.dtype == object: c[i] = v
+            else:
+                try: c[i] = v
+                except (TypeError, ValueError): c[i] = np.nan
+        self.rows = i + 1
+        self.last = data
+        return i
+
+    def load(self, cols: dict, t, t0: float = None):
+        """Bulk rows (column arrays of equal length + session time), e.g. a resumed session."""
+        n = len(t)
+        if not n: return
+        start = self.rows
+        self._grow(start + n)
+        self.cols["t"][start:start + n] = t
+        for k, v in cols.items():
+            if k == "t": continue
+            v = np.asarray(v)
+            c = self.cols.get(k)
+            if c is None: c = self._add(k, v.dtype.kind in "fiu")
+            c[start:start + n] = v if c.dtype != object else v.astype(object)
+        self.rows = start + n
+        if t0 is not None: self.t0 = t0
+        self.last = {k: (str(c[self.rows - 1]) if c.dtype == object else np.format_float_positional(c[self.rows - 1], trim="-"))
+                     for k, c in self.cols.items() if k != "t"}
+
+    def put(self, name, start: int, values):
+        """Numeric rows [start, start + len(values)) of a derived channel; rows never put hold NaN."""
+        values = np.asarray(values, dtype=float)
+        stop = min(start + len(values), self.rows)
+        c = self.cols.get(name)
+        if c is None: c = self._add(name, True)
+        c[start:stop] = values[:stop - start]
+
+    def _add(self, name, numeric):
+        c = np.full(self.cap, np.nan) if numeric else np.full(self.cap, "", dtype=object)
+        self.cols[name] = c
+        return c
+
+    def _grow(self, need):
+        if need <= self.cap: return
+        cap = self.cap
+        while cap < need: cap *= 2
+        for k, c in self.cols.items():
+            new = np.full(cap, np.nan) if c.dtype != object else np.full(cap, "", dtype=object)
+            new[:self.rows] = c[:self.rows]
+            self.cols[k] = new
+        self.cap = cap
+
+
+def _is_number(v):
+    try: float(v); return True
+    except (TypeError, ValueError): return False
@@ -0,0 +1,189 @@
+import time
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QWidget, QTableView, QLabel, QVBoxLayout, QHeaderView
+
+# Display format per numeric field; anything else is shown as received
+FIELD_FORMATS = {
+    "ALTITUDE": "{:.1f}", "TEMPERATURE": "{:.1f}", "PRESSURE": "{:.1f}", "VOLTAGE": "{:.2f}",
+    "GYRO_R": "{:.2f}", "GYRO_P": "{:.2f}", "GYRO_Y": "{:.2f}",
+    "ACCEL_R": "{:.2f}", "ACCEL_P": "{:.2f}", "ACCEL_Y": "{:.2f}",
+    "MAG_R": "{:.2f}", "MAG_P": "{:.2f}", "MAG_Y": "{:.2f}",
+    "AUTO_GYRO_ROTATION_RATE": "{:.0f}",
+    "GPS_ALTITUDE": "{:.1f}", "GPS_LATITUDE": "{:.6f}", "GPS_LONGITUDE": "{:.6f}",
+}
+
+
+class LastTelemetryModel(QAbstractTableModel):
+    """
+    Fixed key/value table of the last packet.
+    - one row per field, rows only ever appended (unknown extra keys)
+    - update() compares raw strings per field and emits dataChanged only for
+      the rows that changed, so the view repaints just those cells
+    - formatted text is cached per field and only rebuilt when its raw value changes
+    """
+    def __init__(self, fields, parent=None):
+        super().__init__(parent)
+        self._keys = list(fields)
+        self._row = {k: i for i, k in enumerate(self._keys)}
+        self._fmt = [self._formatter(k) for k in self._keys]
+        self._raw = [None] * len(self._keys)
+        self._text = [""] * len(self._keys)
+
+    # Qt model API
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._keys)
+    def columnCount(self, parent=QModelIndex()): return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            r = index.row()
+            return self._keys[r] if index.column() == 0 else self._text[r]
+        if role == Qt.TextAlignmentRole and index.column() == 1:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    # PUBLIC
+    def update(self, d: dict):
+        first = last = -1
+        for k, v in d.items():
+            r = self._row.get(k)
+            if r is None:
+                r = self._append_key(k)
+            if v == self._raw[r]:
+                continue
+            self._raw[r] = v
+            self._text[r] = self._fmt[r](v)
+            if first < 0: first = r
+            elif r != last + 1:
+                self._emit_rows(first, last); first = r
+            last = r
+        if first >= 0:
+            self._emit_rows(first, last)
+
+    def clear(self):
+        self._raw = [None] * len(self._keys)
+        self._text = [""] * len(self._keys)
+        if self._keys:
+            self._emit_rows(0, len(self._keys) - 1)
+
+    def value(self, key: str):
+        r = self._row.get(key)
+        return None if r is None else self._raw[r]
+
+    # INTERNAL
+    def _emit_rows(self, first, last):
+        self.dataChanged.emit(self.index(first, 1), self.index(last, 1), [Qt.DisplayRole])
+
+    def _append_key(self, key):
+        r = len(self._keys)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self._keys.append(key); self._row[key] = r
+        self._fmt.append(self._formatter(key))
+        self._raw.append(None); self._text.append("")
+        self.endInsertRows()
+        return r
+
+    @staticmethod
+    def _formatter(key):
+        spec = FIELD_FORMATS.get(key)
+        if spec is None: return str
+        fmt = spec.format
+        def _format(v):
+            try: return fmt(float(v))
+            except (TypeError, ValueError): return str(v)
+        return _format
+
+
+class RollingStatsModel(QAbstractTableModel):
+    """
+    FIELD | N | MEAN | STD | MIN | MAX | RATE /s table of a RollingStats.
+    - update() formats every row, but emits dataChanged only for the row spans whose text changed
+    - rows are appended as channels appear (derived ATT_* channels, extra keys)
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from ddl.modules.utility.rolling_stats import COLUMNS
+        self._header = ("FIELD",) + COLUMNS
+        self._text = []   # per row: tuple of cell strings
+
+    # Qt model API
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._text)
+    def columnCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._header)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal: return self._header[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole: return self._text[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    # PUBLIC
+    def update(self, rows):
+        """rows: RollingStats.rows()."""
+        text = [self._format(r) for r in rows]
+        if len(text) > len(self._text):
+            self.beginInsertRows(QModelIndex(), len(self._text), len(text) - 1)
+            self._text += text[len(self._text):]
+            self.endInsertRows()
+        first = -1
+        for r, row in enumerate(text + [None]):
+            changed = row is not None and row != self._text[r]
+            if changed:
+                self._text[r] = row
+                if first < 0: first = r
+            elif first >= 0:
+                self.dataChanged.emit(self.index(first, 1), self.index(r - 1, len(self._header) - 1), [Qt.DisplayRole])
+                first = -1
+
+    def clear(self):
+        self.beginResetModel(); self._text = []; self.endResetModel()
+
+    @staticmethod
+    def _format(row):
+        name, n, *values = row
+        spec = FIELD_FORMATS.get(name, "{:.3g}")
+        cell = lambda v: "" if v != v else spec.format(v)
+        return (name, str(n)) + tuple(cell(v) for v in values[:-1]) + ("" if values[-1] != values[-1] else f"{values[-1]:+.3g}",)
+
+
+class RollingStatsView(QWidget):
+    """
+    Rolling statistics of the live session (/stats).
+    - fed by a batched bus subscription: statistics and table are only touched every refresh_ms
+    - starts from the telemetry store history, so the window is already full when it opens
+    - closing the window unsubscribes it
+    """
+    def __init__(self, bus, window_s: float = 10.0, refresh_ms: int = 500, parent=None):
+        super().__init__(parent)
+        from ddl.modules.utility.rolling_stats import RollingStats
+        self.bus = bus; self.stats = RollingStats(window_s)
+        self.setWindowTitle(f"Rolling statistics - last {window_s:g} s"); self.resize(760, 660)
+        self.model = RollingStatsModel(self)
+        self.table = QTableView(); self.table.setModel(self.model)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.info = QLabel("")
+        lay = QVBoxLayout(self); lay.addWidget(self.table); lay.addWidget(self.info)
+        self.sub = bus.subscribe(self._on_rows, interval_ms=refresh_ms, name="stats")
+        bus.cleared.connect(self._on_cleared)
+        self.refresh(len(bus.store))
+
+    def refresh(self, stop: int):
+        start = time.perf_counter()
+        self.stats.update(self.bus.store, stop)
+        self.model.update(self.stats.rows())
+        self.info.setText(f"{self.stats.hi - self.stats.lo} packets in the last {self.stats.window:g} s | "
+                          f"{len(self.stats.names)} channels | {(time.perf_counter() - start) * 1000:.1f} ms per refresh")
+
+    def _on_rows(self, u): self.refresh(u.stop)
+
+    def _on_cleared(self):
+        self.stats.reset(); self.model.clear()
+
+    def closeEvent(self, e):
+        self.bus.unsubscribe(self.sub)
+        try: self.bus.cleared.disconnect(self._on_cleared)
+        except TypeError: pass
+        super().closeEvent(e)
@@ -0,0 +1,64 @@
+import time
+from PyQt5.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+
+class VisibilityWatch(QObject):
+    """
+    Whether a widget can be seen: shown (with every parent / tab page), its window not
+    minimized, and part of it not clipped away (scrolled out of view).
+    - changed(bool) fires on transitions only, checked once per event-loop pass
+    - process CPU time is accumulated per state, so a soak run can compare
+      CPU % while visible against CPU % while hidden
+    """
+    changed = pyqtSignal(bool)
+    _EVENTS = {QEvent.Show, QEvent.Hide, QEvent.ShowToParent, QEvent.HideToParent,
+               QEvent.WindowStateChange, QEvent.Resize, QEvent.Move}
+
+    def __init__(self, widget, parent=None):
+        super().__init__(parent)
+        self.widget = widget
+        self.visible = False
+        self._pending = False
+        self._watched = []
+        self.cpu = {True: 0.0, False: 0.0}; self.wall = {True: 0.0, False: 0.0}
+        self._mark = (time.process_time(), time.monotonic())
+        self._watch(widget)
+
+    def _watch(self, w):
+        # the widget and its ancestors up to the window: tab switches / splitters hide an ancestor
+        while w is not None:
+            if w not in self._watched:
+                w.installEventFilter(self); self._watched.append(w)
+            w = w.parentWidget()
+
+    def eventFilter(self, obj, event):
+        if event.type() in self._EVENTS and not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self.check)
+        return False
+
+    def check(self):
+        self._pending = False
+        w = self.widget
+        try:
+            on = w.isVisible() and not w.window().isMinimized() and not w.visibleRegion().isEmpty()
+        except RuntimeError:   # widget already deleted
+            return
+        if on == self.visible: return
+        self._account()
+        self.visible = on
+        self.changed.emit(on)
+
+    def _account(self):
+        cpu, wall = time.process_time(), time.monotonic()
+        self.cpu[self.visible] += cpu - self._mark[0]; self.wall[self.visible] += wall - self._mark[1]
+        self._mark = (cpu, wall)
+
+    def report(self, name: str):
+        self._account()
+        out = []
+        for state, label in ((True, "visible"), (False, "hidden")):
+            wall = self.wall[state]
+            pct = 100.0 * self.cpu[state] / wall if wall > 0 else 0.0
+            out.append(f"{label} {wall:.0f} s, CPU {pct:.1f}%")
+        return f"[VIEW] {name}: {'shown' if self.visible else 'hidden'} | " + " | ".join(out)
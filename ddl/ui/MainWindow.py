@@ -18,7 +18,7 @@ class Ui_MainWindow(object):
             QLabel#topBadge {{ background:#F3F8F5; border:1px solid #D6E8DC; border-radius:6px; padding:4px 8px; font:14pt "{MONO}"; }}
             QGroupBox {{ background:{PANEL_BG}; border:1px solid {BORDER}; border-radius:10px; margin-top:12px; font:bold 16pt "{MONO}"; }}
             QGroupBox::title {{ left:12px; top:2px; padding:2px 4px; color:#333; }}
-            QLineEdit, QComboBox, QTextBrowser {{ background:#FFF; border:1px solid {BORDER}; border-radius:8px; padding:6px 8px; font:14pt "{MONO}"; }}
+            QLineEdit, QComboBox, QTextBrowser, QTableView {{ background:#FFF; border:1px solid {BORDER}; border-radius:8px; padding:6px 8px; font:14pt "{MONO}"; }}
             QPushButton {{ background:#FFF; border:1px solid {BORDER}; border-radius:10px; padding:8px 14px; font:bold 14pt "{MONO}"; }}
             QPushButton:hover {{ background:#F6F6F6; }} QPushButton:pressed {{ background:#EFEFEF; }}
         """)
@@ -109,10 +109,16 @@ class Ui_MainWindow(object):
         self.lb_map_link.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
         self.lb_map_link.setWordWrap(True); self.lb_map_link.setObjectName("lb_map_link")
 
-        self.tb_last_telemetry = QtWidgets.QTextBrowser(); self.tb_last_telemetry.setObjectName("tb_last_telemetry")
+        self.tb_last_telemetry = QtWidgets.QTableView(); self.tb_last_telemetry.setObjectName("tb_last_telemetry")
         self.tb_last_telemetry.setMinimumHeight(110)
-        self.tb_last_telemetry.setStyleSheet("QTextBrowser { font: 12pt \"" + MONO + "\"; }")
-        self.tb_last_telemetry.setReadOnly(True)
+        self.tb_last_telemetry.setStyleSheet("QTableView { font: 12pt \"" + MONO + "\"; }")
+        self.tb_last_telemetry.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tb_last_telemetry.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.tb_last_telemetry.setShowGrid(False); self.tb_last_telemetry.setWordWrap(False)
+        self.tb_last_telemetry.horizontalHeader().hide(); self.tb_last_telemetry.verticalHeader().hide()
+        self.tb_last_telemetry.horizontalHeader().setStretchLastSection(True)
+        self.tb_last_telemetry.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.tb_last_telemetry.verticalHeader().setDefaultSectionSize(22)
 
         self.infoLayout.addRow("Mission Time:", self.lb_mission_time)
         self.infoLayout.addRow("Temperature:", self.lb_temp)
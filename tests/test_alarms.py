@@ -0,0 +1,84 @@
+import pytest
+
+from ddl.modules.acquisition.protocol import RX_TIME
+from ddl.modules.utility.alarms import RuleEngine
+
+STATES = ["LAUNCH_PAD", "ASCENT", "APOGEE", "DESCENT", "LANDED"]
+
+
+def events(engine, packets, batch=None):
+    """(rule, active) of every alert, packets fed `batch` at a time (all at once by default)."""
+    batch = batch or len(packets)
+    out = []
+    for i in range(0, len(packets), batch):
+        out += [(a.rule, a.active) for a in engine.evaluate(packets[i:i + batch])]
+    return out
+
+
+def states(*names): return [{"STATE": s} for s in names]
+
+
+def test_state_unknown_latches_and_resyncs():
+    eng = RuleEngine([{"id": "s", "type": "state"}], STATES)
+    assert events(eng, states("LAUNCH_PAD", "BOGUS", "BOGUS", "", "BOGUS")) == [("s", True)]
+    assert [r.id for r in eng.active()] == ["s"]
+    alerts = eng.evaluate(states("ASCENT", "ASCENT"))
+    assert [(a.active, "resync" in a.message) for a in alerts] == [(False, True)]
+    assert eng.active() == []
+
+
+def test_state_bad_transition_raises_once_and_clears():
+    eng = RuleEngine([{"id": "s", "type": "state"}], STATES)
+    seq = states("LAUNCH_PAD", "ASCENT", "LAUNCH_PAD", "LAUNCH_PAD", "LAUNCH_PAD", "DESCENT", "LANDED")
+    assert events(eng, seq) == [("s", True), ("s", False)]
+    eng.reset()
+    assert events(eng, seq, batch=1) == [("s", True), ("s", False)]
+
+
+def test_state_first_packet_unknown():
+    eng = RuleEngine([{"id": "s", "type": "state"}], STATES)
+    assert events(eng, states("BOGUS")) == [("s", True)]
+
+
+def test_state_custom_transitions():
+    eng = RuleEngine([{"id": "s", "type": "state", "transitions": {"LAUNCH_PAD": ["LANDED"]}}], STATES)
+    assert events(eng, states("LAUNCH_PAD", "LANDED")) == []
+    assert events(eng, states("ASCENT")) == [("s", True)]
+
+
+def test_threshold_debounce_and_hysteresis():
+    eng = RuleEngine([{"id": "v", "field": "VOLTAGE", "below": 7.0, "hysteresis": 0.2, "debounce": 3}])
+    volts = [8.0, 6.9, 6.9, 8.0, 6.9, 6.9, 6.9, 6.9, 7.1, 7.1, 7.3, 7.3]
+    alerts = eng.evaluate([{"VOLTAGE": str(v)} for v in volts])
+    assert [(a.active, a.index) for a in alerts] == [(True, 6), (False, 10)]
+
+
+def test_threshold_same_across_batch_sizes():
+    volts = [8, 6, 6, 6, 8, 6, 6, 6, 6, 8, 8, 6] * 3
+    packets = [{"VOLTAGE": str(v)} for v in volts]
+    spec = [{"id": "v", "field": "VOLTAGE", "below": 7.0, "debounce": 2}]
+    whole = events(RuleEngine(spec), packets)
+    for batch in (1, 2, 5, 7):
+        assert events(RuleEngine(spec), packets, batch) == whole
+
+
+def test_rate_rule():
+    eng = RuleEngine([{"id": "r", "type": "rate", "field": "ALTITUDE", "below": -20.0, "debounce": 2}])
+    alt = [500, 490, 460, 430, 400, 395, 390]
+    packets = [{"ALTITUDE": str(a), RX_TIME: float(i)} for i, a in enumerate(alt)]
+    alerts = eng.evaluate(packets[:3]) + eng.evaluate(packets[3:])
+    assert [(a.active, a.index) for a in alerts] == [(True, 0), (False, 2)]   # -30/s twice, then -5/s
+
+
+def test_silence_rule():
+    eng = RuleEngine([{"id": "link", "type": "silence", "seconds": 5}])
+    assert eng.tick(100.0) == []                   # nothing received yet
+    eng.evaluate([{RX_TIME: 100.0}])
+    assert eng.tick(104.0) == []
+    assert [a.active for a in eng.tick(106.0)] == [True]
+    assert eng.tick(107.0) == []
+    assert [a.active for a in eng.evaluate([{RX_TIME: 108.0}])] == [False]
+
+
+def test_unknown_rule_type():
+    with pytest.raises(ValueError): RuleEngine([{"id": "x", "type": "nope"}])
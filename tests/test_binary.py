@@ -0,0 +1,76 @@
+import random
+import pytest
+
+from ddl.modules.acquisition.binary import (BinaryCodec, PACKET, cobs_encode, cobs_decode, slip_encode, slip_decode,
+                                            pack_packet, unpack_packet, unpack_many, SLIP_END)
+from ddl.modules.acquisition.standin import synthetic_packet
+
+LENGTHS = [0, 1, 2, 253, 254, 255, 256, 507, 508, 509, 1000]
+
+
+def payloads(n):
+    rng = random.Random(n)
+    yield bytes((i % 255) + 1 for i in range(n))   # no zero byte
+    yield bytes(n)   # only zeros
+    yield bytes(rng.randrange(256) for _ in range(n))
+    yield (SLIP_END + b"\xdb\xdc\xdb\xdd") * (n // 5) + b"\xdb" * (n % 5)   # SLIP specials
+
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_cobs_round_trip(n):
+    for data in payloads(n):
+        enc = cobs_encode(data)
+        assert b"\x00" not in enc
+        assert cobs_decode(enc) == data
+
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_slip_round_trip(n):
+    for data in payloads(n):
+        enc = slip_encode(data)
+        assert SLIP_END not in enc
+        assert slip_decode(enc) == data
+
+
+def test_cobs_rejects_broken_frames():
+    with pytest.raises(ValueError): cobs_decode(b"\x05ab")   # truncated
+    with pytest.raises(ValueError): cobs_decode(b"\x02a\x00b")   # delimiter inside
+
+
+def test_packet_round_trip():
+    d = synthetic_packet(42)
+    raw = pack_packet(d)
+    assert len(raw) == PACKET.size
+    out = unpack_packet(raw)
+    for k in ("TEAM_ID", "MISSION_TIME", "PACKET_COUNT", "MODE", "STATE", "GPS_TIME", "GPS_SATS", "CMD_ECHO"):
+        assert out[k] == d[k]
+    assert float(out["ALTITUDE"]) == pytest.approx(float(d["ALTITUDE"]), abs=0.05)
+    assert float(out["GPS_LATITUDE"]) == pytest.approx(float(d["GPS_LATITUDE"]), abs=1e-7)
+    assert unpack_packet(raw[:-1] + bytes([raw[-1] ^ 1])) is None   # CRC mismatch
+    assert unpack_packet(pack_packet(dict(d, STATE="BOGUS")))["STATE"] == ""   # index 255
+
+
+def test_unpack_many_drops_bad_rows():
+    raws = [pack_packet(synthetic_packet(i)) for i in range(1, 6)]
+    raws[2] = raws[2][:-1] + b"\x00"
+    arr = unpack_many(raws)
+    assert list(arr["PACKET_COUNT"]) == [1, 2, 4, 5]
+
+
+@pytest.mark.parametrize("framing", ["cobs", "slip"])
+def test_codec_stream(framing):
+    codec = BinaryCodec(framing)
+    wire = b"line noise" + b"".join(codec.encode(synthetic_packet(i)) for i in range(1, 21))
+    frames = []
+    for i in range(0, len(wire), 7):   # split mid-frame
+        frames += codec.feed(wire[i:i + 7])
+    decoded = [codec.decode(f) for f in frames]
+    good = [d for d in decoded if d is not None]
+    assert [d["PACKET_COUNT"] for d in good] == [str(i) for i in range(1, 21)]
+    assert codec.corrupt == len(decoded) - len(good) == 1   # the noise before the first delimiter
+
+
+def test_codec_counts_garbage_without_delimiter():
+    codec = BinaryCodec("cobs", max_frame=16)
+    assert codec.feed(b"\x01" * 32) == []
+    assert codec.corrupt == 1 and not codec.buf
@@ -0,0 +1,59 @@
+import numpy as np
+
+from ddl.modules.acquisition.flight_csv import (read_flight_csv, count_rows, hms_seconds, hms_second, continuous_time,
+                                                CLEAR_MARK, SESSION_MARK)
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+from ddl.modules.acquisition.standin import synthetic_packet
+
+
+def row(n, **over):
+    return ",".join(str(dict(synthetic_packet(n), **over)[k]) for k in REQUIRED_FIELDS)
+
+
+def write(path, lines, header=True):
+    path.write_text("\n".join(([",".join(REQUIRED_FIELDS)] if header else []) + lines) + "\n")
+    return str(path)
+
+
+def test_hms_parsers_agree():
+    texts = ["00:00:00", "12:34:56", "23:59:59", "1:2:3", "", "ab:cd:ef", "12-34-56", "12:34:5x"]
+    vec = hms_seconds(texts)
+    assert list(vec[:3]) == [0.0, 45296.0, 86399.0]
+    assert np.isnan(vec[3:]).all()
+    np.testing.assert_array_equal(vec, [hms_second(s) for s in texts])
+
+
+def test_continuous_time():
+    t = continuous_time(np.array([86398.0, 86399.0, 0.0, 1.0]))        # UTC midnight
+    np.testing.assert_array_equal(t, [86398.0, 86399.0, 86400.0, 86401.0])
+    t = continuous_time(np.array([100.0, 100.0, 100.0, 101.0]))        # one second shared by 3 packets
+    np.testing.assert_allclose(t, [100.0, 100.0 + 1 / 3, 100.0 + 2 / 3, 101.0])
+    t = continuous_time(np.array([500.0, 501.0, 10.0, 11.0]))          # new session: keeps going up
+    assert (np.diff(t) > 0).all()
+
+
+def test_read_columns_and_markers(tmp_path):
+    lines = [row(1), row(2), CLEAR_MARK, row(3, ALTITUDE="oops"), "short,row",
+             f"{SESSION_MARK}b ---", row(4), f"{SESSION_MARK}b ---", row(5)]
+    f = read_flight_csv(write(tmp_path / "f.csv", lines))
+    assert f.rows == 5 == count_rows(str(tmp_path / "f.csv"))
+    assert list(f["PACKET_COUNT"]) == [1, 2, 3, 4, 5]
+    assert f["STATE"].dtype.kind == "U" and f["STATE"][0] == "ASCENT"
+    assert np.isnan(f["ALTITUDE"][2])                                  # malformed number -> NaN
+    assert (f.clears, f.sessions, f.session) == ([2], [3], "b")        # a repeated id is a reconnect
+    assert f.segments() == [(0, 2), (2, 3), (3, 5)]
+    part = f.slice(3, 5)
+    assert part.rows == 2 and list(part["PACKET_COUNT"]) == [4, 5]
+
+
+def test_headerless_and_field_subset(tmp_path):
+    path = write(tmp_path / "f.csv", [row(1), row(2)], header=False)
+    f = read_flight_csv(path, header=REQUIRED_FIELDS, fields={"ALTITUDE"})
+    assert set(f) == {"ALTITUDE", "MISSION_TIME", "t"}
+    assert f.clears == [] and f.segments() == [(0, 2)]
+
+
+def test_empty_file(tmp_path):
+    f = read_flight_csv(write(tmp_path / "f.csv", [CLEAR_MARK]))
+    assert f.rows == 0 and f.segments() == []
+    assert count_rows(str(tmp_path / "missing.csv")) == 0
@@ -0,0 +1,54 @@
+import random
+from functools import reduce
+import pytest
+
+from ddl.modules.acquisition.integrity import FrameChecker, crc16, xor8
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+from ddl.modules.acquisition.standin import synthetic_packet
+
+PAYLOAD = ",".join(synthetic_packet(7)[k] for k in REQUIRED_FIELDS)
+
+
+def test_crc16_check_value():
+    assert crc16(b"123456789") == 0x29B1     # CRC-16/CCITT-FALSE
+    assert crc16(b"") == 0xFFFF
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 8, 9, 255, 256, 1000])
+def test_xor8_matches_bytewise(n):
+    data = bytes(random.Random(n).randrange(256) for _ in range(n))
+    assert xor8(data) == reduce(lambda a, b: a ^ b, data, 0)
+
+
+@pytest.mark.parametrize("mode", ["crc16", "xor"])
+def test_text_lines_pass_through_uncounted(mode):
+    fc = FrameChecker(mode, sync_token="1043,")
+    for line in ["Boot OK * ready", "hello world", "a,b*c", "GPS fix * 3 sats"]:
+        assert fc.frames(line) is None
+    assert (fc.ok, fc.corrupt, fc.resynced) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("mode", ["crc16", "xor"])
+def test_frames(mode):
+    fc = FrameChecker(mode, sync_token="1043,")
+    good = fc.seal(PAYLOAD)
+    assert fc.frames(good) == [PAYLOAD]
+    bad = good.replace("1043,", "1043,9", 1)
+    assert fc.frames(bad) == []
+    assert fc.frames(PAYLOAD) == []                       # telemetry without its checksum
+    assert fc.frames("junk" + good) == [PAYLOAD]          # resync on the sync token
+    assert fc.frames(good + good) == [PAYLOAD, PAYLOAD]   # two frames run together
+    assert (fc.ok, fc.corrupt, fc.resynced) == (1, 2, 3)
+
+
+def test_start_marker_and_no_resync():
+    fc = FrameChecker("crc16", start_marker="$", resync=False)
+    assert fc.frames(fc.seal(PAYLOAD)) == [PAYLOAD]
+    assert fc.frames("x" + fc.seal(PAYLOAD)) == []
+    assert fc.corrupt == 1 and fc.resynced == 0
+
+
+def test_from_config():
+    assert FrameChecker.from_config({"mode": "none"}) is None
+    assert FrameChecker.from_config({"mode": "xor"}, "1043").sync_token == "1043,"
+    with pytest.raises(ValueError): FrameChecker("md5")
@@ -0,0 +1,69 @@
+import math
+import numpy as np
+import pytest
+
+from ddl.modules.utility.geo import LocalTangentPlane
+from ddl.modules.utility.landing import LandingPredictor, WeightedLine
+
+PAD = LocalTangentPlane(13.7, 100.5)
+
+
+def descent(seconds, h0=500.0, rate=5.0, drift=(2.0, -1.0), noise=0.0, seed=0):
+    """(t, alt, lat, lon) of a straight descent drifting east/north at `drift` m/s."""
+    rng = np.random.default_rng(seed)
+    for i in range(seconds):
+        t = float(i)
+        e, n = drift[0] * t + rng.normal(0, noise), drift[1] * t + rng.normal(0, noise)
+        lat, lon = PAD.to_geodetic(e, n)
+        yield t, h0 - rate * t + rng.normal(0, noise), lat, lon
+
+
+def test_weighted_line_matches_polyfit():
+    rng = np.random.default_rng(1)
+    t = np.cumsum(rng.uniform(0.1, 2.0, 40)); y = 3.0 - 0.7 * t + rng.normal(0, 0.3, 40)
+    line = WeightedLine(1)
+    for ti, yi in zip(t, y): line.add(ti, (yi,), 15.0)
+    ((a, b),), _, _ = line.solve()
+    w = np.exp(-(t[-1] - t) / 15.0)
+    slope, icpt = np.polyfit(t - t[-1], y, 1, w=np.sqrt(w))
+    assert (a, b) == (pytest.approx(icpt), pytest.approx(slope))
+
+
+def test_linear_descent_lands_on_the_extrapolated_point():
+    lp = LandingPredictor(tau_s=20.0, ground_altitude_m=0.0)
+    for t, alt, lat, lon in descent(30): pred = lp.update(t, alt, lat, lon)
+    assert pred.descent_rate == pytest.approx(5.0)
+    assert pred.time_to_ground == pytest.approx((500.0 - 5.0 * 29) / 5.0)   # touchdown at t = 100
+    assert (pred.east, pred.north) == (pytest.approx(2.0 * 100), pytest.approx(-1.0 * 100))
+    assert pred.drift == (pytest.approx(math.hypot(2, 1)), pytest.approx(math.degrees(math.atan2(2, -1))))
+    assert pred.axes[0] == pytest.approx(0.0, abs=1e-3)
+
+
+def test_noisy_descent_stays_close():
+    lp = LandingPredictor(tau_s=20.0, ground_altitude_m=0.0)
+    for t, alt, lat, lon in descent(60, noise=1.0, seed=3): pred = lp.update(t, alt, lat, lon)
+    assert pred.time_to_ground == pytest.approx(500.0 / 5.0 - 59, abs=2.0)
+    assert math.hypot(pred.east - 200.0, pred.north + 100.0) < 3 * pred.axes[0]
+    assert pred.axes[0] > 0
+
+
+def test_no_prediction_while_ascending_or_outside_states():
+    lp = LandingPredictor()
+    for t, alt, lat, lon in descent(20, rate=-5.0): assert lp.update(t, alt, lat, lon) is None
+    lp = LandingPredictor(states=["DESCENT"])
+    for t, alt, lat, lon in descent(20): assert lp.update(t, alt, lat, lon, "ASCENT") is None
+    assert lp.update(20.0, 400.0, *PAD.to_geodetic(40.0, -20.0), "DESCENT") is not None
+
+
+def test_seed_sets_ground_and_origin():
+    lp = LandingPredictor()
+    lp.seed([float("nan"), 100.0, 550.0], [0.0, 13.7], [0.0, 100.5])   # (0, 0) is no fix
+    assert lp.ground == 100.0 and (lp.origin.lat0, lp.origin.lon0) == (13.7, 100.5)
+    for t, alt, lat, lon in descent(10): pred = lp.update(t, alt, lat, lon)
+    assert pred.time_to_ground == pytest.approx((455.0 - 100.0) / 5.0)
+
+
+def test_from_config():
+    assert LandingPredictor.from_config({"enable": False}) is None
+    lp = LandingPredictor.from_config({"tau_s": 5, "states": ["DESCENT"], "ground_altitude_m": 10})
+    assert (lp.tau, lp.states, lp.ground) == (5.0, {"DESCENT"}, 10.0)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from ddl.modules.acquisition.flight_csv import read_flight_csv, NUMERIC_FIELDS
+from ddl.modules.acquisition.protocol import REQUIRED_FIELDS
+from ddl.modules.acquisition.pyramid import PyramidWriter, Pyramid, build_from_csv, open_pyramid
+from ddl.modules.acquisition.standin import synthetic_packet
+
+
+def blocks(x, size):
+    """Brute-force (min, max) of every `size` rows, the last block partial; NaN ignored."""
+    out = [(np.nanmin(x[i:i + size], axis=0), np.nanmax(x[i:i + size], axis=0)) for i in range(0, len(x), size)]
+    return np.array([o[0] for o in out]), np.array([o[1] for o in out])
+
+
+def check_levels(pyr, t, x, fanout):
+    for k, level in enumerate(pyr.levels):
+        lo, hi = blocks(x, fanout ** k)
+        np.testing.assert_array_equal(level["t"], t[::fanout ** k])
+        np.testing.assert_array_equal(level["lo"], lo)
+        np.testing.assert_array_equal(level["hi"], hi)
+    assert len(pyr.levels[-1]) == 1 or len(pyr.levels) == 1
+
+
+@pytest.mark.filterwarnings("ignore:All-NaN slice")
+@pytest.mark.parametrize("n", [1, 7, 8, 64, 100, 1000])
+def test_writer_matches_brute_force(tmp_path, n):
+    rng = np.random.default_rng(n)
+    x = rng.normal(size=(n, 3)).astype(np.float32)
+    x[rng.random((n, 3)) < 0.1] = np.nan
+    t = np.arange(n, dtype=float)
+    w = PyramidWriter(str(tmp_path / "p.pyr"), channels=["A", "B", "C"], fanout=4, flush_every=16)
+    for i in range(n): w.append_values(t[i], x[i])
+    w.close()
+    check_levels(Pyramid(str(tmp_path / "p.pyr")), t, x, 4)
+
+
+def write_csv(path, n):
+    rows = [",".join(str(synthetic_packet(i)[k]) for k in REQUIRED_FIELDS) for i in range(1, n + 1)]
+    path.write_text("\n".join([",".join(REQUIRED_FIELDS)] + rows) + "\n")
+    return str(path)
+
+
+@pytest.mark.filterwarnings("ignore:All-NaN slice")
+def test_build_from_csv_matches_brute_force(tmp_path):
+    csv = write_csv(tmp_path / "f.csv", 300)
+    pyr = build_from_csv(csv, fanout=8)
+    data = read_flight_csv(csv)
+    channels = [c for c in NUMERIC_FIELDS if c in data]
+    assert pyr.channels == channels
+    x = np.column_stack([data[c] for c in channels]).astype(np.float32)
+    check_levels(pyr, data["t"], x, 8)
+
+
+def test_query_respects_the_point_budget(tmp_path):
+    w = PyramidWriter(str(tmp_path / "p.pyr"), channels=["A"], fanout=8)
+    for i in range(5000): w.append_values(float(i), np.array([np.sin(i / 50)], np.float32))
+    w.close()
+    pyr = Pyramid(str(tmp_path / "p.pyr"))
+    t, lo, hi = pyr.query("A", 0.0, 4999.0, max_points=200)
+    assert len(t) <= 200 and (lo <= hi).all()
+    assert lo.min() == pytest.approx(-1.0, abs=1e-3) and hi.max() == pytest.approx(1.0, abs=1e-3)
+    t, lo, hi = pyr.query("A", 1000.0, 1100.0, max_points=200)   # zoomed in: raw samples
+    assert (lo == hi).all() and t[0] <= 1000.0 <= 1100.0 <= t[-1]
+
+
+def test_open_pyramid_rebuilds_when_stale(tmp_path):
+    csv = write_csv(tmp_path / "f.csv", 50)
+    pyr = open_pyramid(csv)
+    assert pyr.samples == 50 and pyr.is_current(csv)
+    write_csv(tmp_path / "f.csv", 80)
+    assert not pyr.is_current(csv)
+    assert open_pyramid(csv).samples == 80
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from ddl.modules.acquisition.protocol import RX_TIME
+from ddl.modules.utility.rolling_stats import RollingStats
+from ddl.modules.utility.telemetry_store import TelemetryStore
+
+
+def brute(store, name, window):
+    """(n, mean, std, min, max, slope) of the rows RollingStats keeps in its window."""
+    t = store.view("t"); x = store.view(name)
+    lo = int(np.searchsorted(t, t[-1] - window, side="left"))
+    t, x = t[lo:], x[lo:]
+    ok = ~np.isnan(x); t, x = t[ok], x[ok]
+    if not len(x): return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+    std = x.std(ddof=1) if len(x) > 1 else np.nan
+    dt = t - t.mean()
+    slope = (dt * (x - x.mean())).sum() / (dt * dt).sum() if len(x) > 1 and (dt * dt).sum() > 0 else np.nan
+    return len(x), x.mean(), std, x.min(), x.max(), slope
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    store = TelemetryStore(64); stats = RollingStats(window_s=5.0)
+    rx = 1000.0
+    for _ in range(120):
+        for _ in range(int(rng.integers(1, 40))):            # batches of varying size
+            rx += float(rng.exponential(0.05))
+            d = {RX_TIME: rx, "ALTITUDE": 1e4 + rng.normal(0, 50), "VOLTAGE": 7.4 + rng.normal(0, 0.01)}
+            if rng.random() < 0.2: d["VOLTAGE"] = "nan"       # missing samples
+            if store.rows > 500: d["LATE"] = rng.normal()      # channel appearing mid-session
+            store.append(d)
+        stats.update(store)
+        for name, n, mean, std, mn, mx, rate in stats.rows():
+            expect = brute(store, name, 5.0)
+            assert n == expect[0]
+            np.testing.assert_allclose([mean, std, mn, mx, rate], expect[1:], rtol=1e-9, atol=1e-9)
+
+
+def test_restarts_when_the_store_is_cleared():
+    store = TelemetryStore(); stats = RollingStats(10.0)
+    for i in range(50): store.append({RX_TIME: float(i), "A": float(i)})
+    stats.update(store)
+    store.clear()
+    for i in range(3): store.append({RX_TIME: float(i), "A": 100.0 + i})
+    stats.update(store)
+    (name, n, mean, _, mn, mx, rate), = stats.rows()
+    assert (name, n, mean, mn, mx, rate) == ("A", 3, 101.0, 100.0, 102.0, pytest.approx(1.0))
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from ddl.modules.acquisition.protocol import RX_TIME
+from ddl.modules.utility.telemetry_store import TelemetryStore
+
+
+def test_append_grows_and_keeps_rows():
+    store = TelemetryStore(16)
+    for i in range(100):
+        d = {RX_TIME: 10.0 + i, "ALTITUDE": str(i), "STATE": "ASCENT" if i < 50 else "DESCENT"}
+        if i >= 40: d["LATE"] = "1.5"
+        if i == 60: d["ALTITUDE"] = "garbage"
+        assert store.append(d) == i
+    assert len(store) == 100 and store.cap == 128
+    np.testing.assert_array_equal(store.view("t"), np.arange(100.0))
+    alt = store.view("ALTITUDE")
+    assert np.isnan(alt[60]) and alt[99] == 99.0
+    assert store.view("STATE").dtype == object and store.view("STATE")[50] == "DESCENT"
+    late = store.view("LATE")
+    assert np.isnan(late[:40]).all() and (late[40:] == 1.5).all()     # NaN before the channel existed
+    assert store.view("MISSING") is None
+    assert store.last["ALTITUDE"] == "99"
+
+
+def test_views_are_read_only_windows():
+    store = TelemetryStore()
+    for i in range(10): store.append({RX_TIME: float(i), "A": float(i)})
+    v = store.view("A", 2, 5)
+    assert list(v) == [2.0, 3.0, 4.0]
+    with pytest.raises(ValueError): v[0] = 0.0
+    full = store.view("A")
+    store.append({RX_TIME: 10.0, "A": 10.0})
+    assert len(full) == 10 and len(store.view("A")) == 11
+    assert len(store.view("A", 8, 100)) == 3
+
+
+def test_text_fields_stay_text():
+    store = TelemetryStore()
+    store.append({RX_TIME: 0.0, "STATE": "1", "CMD_ECHO": "CXON"})
+    assert store.view("STATE").dtype == object and store.view("STATE")[0] == "1"
+    store.append({RX_TIME: 1.0})
+    assert list(store.view("CMD_ECHO")) == ["CXON", ""]
+
+
+def test_load_put_and_clear():
+    store = TelemetryStore(16)
+    store.append({RX_TIME: 5.0, "A": 1.0})
+    store.load({"A": np.arange(40.0), "STATE": np.array(["X"] * 40)}, np.arange(1.0, 41.0), t0=5.0)
+    assert len(store) == 41 and store.t0 == 5.0
+    assert store.view("A")[-1] == 39.0 and store.view("STATE")[0] == ""
+    assert (store.last["A"], store.last["STATE"]) == ("39", "X")
+    store.put("ATT_ROLL", 10, np.ones(100))                             # clipped to the stored rows
+    roll = store.view("ATT_ROLL")
+    assert np.isnan(roll[:10]).all() and (roll[10:] == 1.0).all()
+    store.clear()
+    assert len(store) == 0 and store.channels() == ["t"] and store.t0 is None